@@ -13,6 +13,11 @@ class Settings:
     DOC_GROQ_API_KEY: str = os.getenv("DOC_GROQ_API_KEY")
 
     BACKUP_GEMINI_KEY: str = os.getenv("BACKUP_GEMINI_KEY")
+    # Point at a stand-in (loadtests/fake_llm_server.py) to run without Google.
+    # Groq clients read GROQ_API_BASE from the environment themselves.
+    GEMINI_BASE_URL: str = os.getenv(
+        "GEMINI_BASE_URL", "https://generativelanguage.googleapis.com"
+    )
 
     DATABASE_PASSWORD: str = os.getenv("DB_PASSWORD") or os.getenv("DATABASE_PASSWORD")
 
@@ -30,11 +35,32 @@ class Settings:
     CHROMA_HOST: str = os.getenv("CHROMA_HOST", "chromadb")
     CHROMA_PORT: int = int(os.getenv("CHROMA_PORT", "8000"))
 
+    # "remote" (Chroma server), "embedded" (local snapshot) or "auto"
+    VECTOR_STORE_MODE: str = os.getenv("VECTOR_STORE_MODE", "auto")
+    VECTOR_SNAPSHOT_DIR: str = os.getenv(
+        "VECTOR_SNAPSHOT_DIR", ".cache/knowledge_snapshot"
+    )
+
+    # Embedding cache (SQLite) and batching for Chroma
+    EMBEDDING_CACHE_PATH: str = os.getenv(
+        "EMBEDDING_CACHE_PATH", ".cache/embeddings.sqlite3"
+    )
+    EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "50"))
+    EMBEDDING_CONCURRENCY: int = int(os.getenv("EMBEDDING_CONCURRENCY", "4"))
+
+    # Generated-SQL plan cache (entries per process)
+    SQL_PLAN_CACHE_SIZE: int = int(os.getenv("SQL_PLAN_CACHE_SIZE", "256"))
+
     AWS_ACCESS_KEY_ID: str = os.getenv("AWS_ACCESS_KEY_ID")
     AWS_SECRET_ACCESS_KEY: str = os.getenv("AWS_SECRET_ACCESS_KEY")
     AWS_REGION: str = os.getenv("AWS_REGION", "ap-south-1")
     DYNAMODB_ENDPOINT: str = os.getenv("DYNAMODB_ENDPOINT")
 
+    # OpenTelemetry collector (OTLP/HTTP) to send traces to; unset disables
+    # tracing (services/tracing.py).
+    OTEL_EXPORTER_OTLP_ENDPOINT: str = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
+    OTEL_SERVICE_NAME: str = os.getenv("OTEL_SERVICE_NAME", "mycalo-ai")
+
     def validate(self):
         if not self.GEMINI_API_KEY:
             self.GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
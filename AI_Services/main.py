@@ -3,6 +3,8 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from config import settings
 from routers import chat, chat_doctor_groq, chat_groq, nutrition, vision_nutrition
+from services import tracing
+from services.sql_plan_cache import sql_plan_cache
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -12,6 +14,8 @@ app = FastAPI(
     redoc_url="/ai/redoc",
 )
 
+tracing.instrument_app(app)
+
 # CORS Middleware (Allowing Django to connect)
 app.add_middleware(
     CORSMiddleware,
@@ -36,6 +40,10 @@ app.include_router(chat_doctor_groq.router, prefix="/ai")
 # Health check at the root of the /ai prefix
 @app.get("/ai")
 def health_check():
-    return {"status": "ok", "service": "AI_Services"}
+    return {
+        "status": "ok",
+        "service": "AI_Services",
+        "sql_plan_cache": sql_plan_cache.stats(),
+    }
 
 
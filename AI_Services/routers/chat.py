@@ -1,7 +1,9 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from services.chat_agent import HybridAgent
+from services.streaming import SSE_HEADERS, sse_event
 
 router = APIRouter(prefix="/chat", tags=["AI Chat"])
 
@@ -36,3 +38,23 @@ async def ask_assistant(request: ChatRequest):
             "response": "I'm encountering a temporary system error. Please try again shortly.",
             "success": False,
         }
+
+
+@router.post("/ask/stream")
+async def ask_assistant_stream(request: ChatRequest):
+    """
+    Streaming variant of /ask. Sends Server-Sent Events: `step` when a tool
+    starts/finishes, `token` for each chunk of the answer and a final `done`
+    carrying the complete response.
+    """
+    agent = HybridAgent()
+
+    print(f"[API] Streaming query for User {request.user_id}: {request.query}")
+
+    async def event_stream():
+        async for event in agent.stream_query(request.query, request.user_id):
+            yield sse_event(event)
+
+    return StreamingResponse(
+        event_stream(), media_type="text/event-stream", headers=SSE_HEADERS
+    )
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from dependencies import verify_token
 from services.chat_agent_doctor_groq import DoctorGroqAgent
+from services.streaming import SSE_HEADERS, sse_event
 
 router = APIRouter(prefix="/chat-groq", tags=["Doctor AI Chat"])
 
@@ -31,3 +33,25 @@ async def ask_doctor_agent(
         "patient_id": request.user_id,
         "success": True,
     }
+
+
+@router.post("/ask_doc/stream")
+async def ask_doctor_agent_stream(
+    request: DoctorChatRequest, token_payload: dict = Depends(verify_token)
+):
+
+    doctor_id = token_payload.get("user_id")
+    if not doctor_id:
+        raise HTTPException(status_code=401, detail="Doctor authentication failed")
+
+    agent = DoctorGroqAgent()
+
+    async def event_stream():
+        async for event in agent.stream_query(request.query, request.user_id):
+            if event["type"] == "done":
+                event.update({"doctor_id": doctor_id, "patient_id": request.user_id})
+            yield sse_event(event)
+
+    return StreamingResponse(
+        event_stream(), media_type="text/event-stream", headers=SSE_HEADERS
+    )
@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from dependencies import verify_token
 from services.chat_agent_groq import GroqHybridAgent
 from services.dynamodb_service import get_ai_chat_history, save_ai_chat_message
+from services.streaming import SSE_HEADERS, detached, sse_event
 
 router = APIRouter(prefix="/chat-groq", tags=["Groq AI Chat"])
 
@@ -36,3 +38,32 @@ async def ask_groq(request: ChatRequest, token_payload: dict = Depends(verify_to
     save_ai_chat_message(user_id, response, "ai")
 
     return {"response": response, "success": True}
+
+
+@router.post("/ask/stream")
+async def ask_groq_stream(
+    request: ChatRequest, token_payload: dict = Depends(verify_token)
+):
+    user_id = token_payload.get("user_id")
+    if not user_id:
+        raise HTTPException(status_code=401, detail="User identification failed")
+
+    save_ai_chat_message(user_id, request.query, "user")
+
+    agent = GroqHybridAgent()
+
+    async def answer_and_save():
+        async for event in agent.stream_query(request.query, user_id):
+            if event["type"] == "done" and event["response"]:
+                save_ai_chat_message(user_id, event["response"], "ai")
+            yield event
+
+    async def event_stream():
+        # Detached, so the answer is still completed and saved to the history
+        # if the client disconnects while it is being generated.
+        async for event in detached(answer_and_save()):
+            yield sse_event(event)
+
+    return StreamingResponse(
+        event_stream(), media_type="text/event-stream", headers=SSE_HEADERS
+    )
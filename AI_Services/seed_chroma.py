@@ -1,32 +1,33 @@
+import argparse
+import hashlib
+import json
+from itertools import chain, islice
+
 import chromadb
 from chromadb.config import Settings
 from langchain_chroma import Chroma
 from langchain_core.documents import Document
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
 
 from config import settings
+from services.embedding_cache import build_embeddings
+from services.local_vector_index import export_snapshot
 
+COLLECTION_NAME = "mycalo_app_knowledge"
 
-def seed_database():
-    print("Connecting to Google Cloud for embeddings...")
-    api_key = settings.BACKUP_GEMINI_KEY or settings.GEMINI_API_KEY
-    embeddings = GoogleGenerativeAIEmbeddings(
-        model="models/gemini-embedding-001", google_api_key=api_key
-    )
 
-    print("Connecting to ChromaDB...")
-    chroma_client = chromadb.HttpClient(
-        host=settings.CHROMA_HOST,
-        port=settings.CHROMA_PORT,
-        settings=Settings(anonymized_telemetry=False),
+def recipe_document(recipe: dict) -> Document:
+    return Document(
+        page_content=f"Recipe: {recipe['title']}. Instructions: {recipe['content']}",
+        metadata={
+            "category": "recipe",
+            "meal_type": recipe["type"],
+            "calories": recipe["calories"],
+        },
     )
 
-    vectorstore = Chroma(
-        client=chroma_client,
-        collection_name="mycalo_app_knowledge",
-        embedding_function=embeddings,
-    )
 
+def builtin_documents():
+    """App support docs and sample recipes that ship with the service"""
     # 1. --- App Support & Policies (10 New Entries) ---
     support_docs = [
         Document(
@@ -450,25 +451,147 @@ def seed_database():
         },
     ]
 
-    recipe_docs = [
-        Document(
-            page_content=f"Recipe: {r['title']}. Instructions: {r['content']}",
-            metadata={
-                "category": "recipe",
-                "meal_type": r["type"],
-                "calories": r["calories"],
-            },
-        )
-        for r in recipe_data
-    ]
+    return support_docs + [recipe_document(r) for r in recipe_data]
+
+
+def iter_jsonl_documents(path: str):
+    """Streams documents from a JSONL file, one JSON object per line.
+
+    Lines are either {"page_content": ..., "metadata": {...}} or recipe rows
+    shaped like the built-in recipe_data ({"title", "content", "calories", "type"}).
+    """
+    with open(path, encoding="utf-8") as handle:
+        for line_no, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            row = json.loads(line)
+            if "page_content" in row:
+                yield Document(
+                    page_content=row["page_content"], metadata=row.get("metadata") or {}
+                )
+            elif {"title", "content", "calories", "type"} <= row.keys():
+                yield recipe_document(row)
+            else:
+                print(f"⚠️ Skipping {path}:{line_no}, unrecognised document shape")
+
+
+def document_id(doc: Document) -> str:
+    """Content hash, so unchanged documents keep their ID across runs."""
+    payload = json.dumps(
+        {"content": doc.page_content, "metadata": doc.metadata}, sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _chunks(iterable, size: int):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def seed_database(
+    sources=(), prune: bool = True, chunk_size: int = 500, snapshot: bool = True
+):
+    print("Connecting to Google Cloud for embeddings...")
+    api_key = settings.BACKUP_GEMINI_KEY or settings.GEMINI_API_KEY
+    embeddings = build_embeddings(api_key)
+
+    print("Connecting to ChromaDB...")
+    chroma_client = chromadb.HttpClient(
+        host=settings.CHROMA_HOST,
+        port=settings.CHROMA_PORT,
+        settings=Settings(anonymized_telemetry=False),
+    )
 
-    # Combine all documents
-    full_knowledge_base = support_docs + recipe_docs
+    vectorstore = Chroma(
+        client=chroma_client,
+        collection_name=COLLECTION_NAME,
+        embedding_function=embeddings,
+    )
+
+    documents = chain(
+        builtin_documents(), *(iter_jsonl_documents(path) for path in sources)
+    )
 
-    print(f"Adding {len(full_knowledge_base)} documents to Vector Database...")
-    vectorstore.add_documents(full_knowledge_base)
-    print("✅ Successfully seeded ChromaDB with Recipes and App Knowledge!")
+    # Only IDs are kept in memory; documents are processed chunk by chunk.
+    seen_ids = set()
+    added = 0
+    for chunk in _chunks(documents, chunk_size):
+        pending = {}
+        for doc in chunk:
+            doc_id = document_id(doc)
+            if doc_id not in seen_ids:
+                pending[doc_id] = doc
+                seen_ids.add(doc_id)
+        if not pending:
+            continue
+
+        existing = vectorstore.get(ids=list(pending), include=[])["ids"]
+        for doc_id in existing:
+            pending.pop(doc_id, None)
+
+        if pending:
+            vectorstore.add_documents(list(pending.values()), ids=list(pending))
+            added += len(pending)
+            print(f"Added {len(pending)} new/changed documents...")
+
+    removed = 0
+    if prune:
+        stale_ids = []
+        offset = 0
+        while True:
+            page = vectorstore.get(include=[], limit=chunk_size, offset=offset)["ids"]
+            if not page:
+                break
+            stale_ids.extend(doc_id for doc_id in page if doc_id not in seen_ids)
+            offset += len(page)
+
+        for stale_chunk in _chunks(stale_ids, chunk_size):
+            vectorstore.delete(ids=stale_chunk)
+        removed = len(stale_ids)
+
+    print(
+        f"✅ ChromaDB in sync: {len(seen_ids)} documents, "
+        f"{added} embedded, {removed} stale removed."
+    )
+
+    if snapshot:
+        # Refresh the embedded index used by VECTOR_STORE_MODE=embedded/auto.
+        count = export_snapshot(vectorstore, settings.VECTOR_SNAPSHOT_DIR, chunk_size)
+        print(f"📦 Wrote {count} documents to {settings.VECTOR_SNAPSHOT_DIR}")
 
 
 if __name__ == "__main__":
-    seed_database()
+    parser = argparse.ArgumentParser(
+        description="Sync the MyCalo knowledge base into ChromaDB"
+    )
+    parser.add_argument(
+        "--source",
+        action="append",
+        default=[],
+        help="Extra JSONL file of documents or recipes (can be repeated)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=500,
+        help="Documents read, diffed and embedded per round",
+    )
+    parser.add_argument(
+        "--no-prune",
+        action="store_true",
+        help="Keep documents that are no longer in any source",
+    )
+    parser.add_argument(
+        "--no-snapshot",
+        action="store_true",
+        help="Skip refreshing the local vector snapshot",
+    )
+    args = parser.parse_args()
+    seed_database(
+        args.source,
+        prune=not args.no_prune,
+        chunk_size=args.chunk_size,
+        snapshot=not args.no_snapshot,
+    )
@@ -1,20 +1,19 @@
 import os
 from datetime import date
 
-import chromadb
-from chromadb.config import Settings
 from langchain.agents import AgentExecutor, create_tool_calling_agent
 from langchain.tools import StructuredTool
-from langchain_chroma import Chroma
 from langchain_community.utilities import SQLDatabase
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_google_genai import (  
-    ChatGoogleGenerativeAI,
-    GoogleGenerativeAIEmbeddings,
-)
+from langchain_google_genai import ChatGoogleGenerativeAI
 from pydantic import BaseModel, Field
 
 from config import settings
+from services import tracing
+from services.knowledge_base import get_knowledge_vectorstore
+from services.nutrition_queries import match_nutrition_query
+from services.sql_plan_cache import sql_plan_cache
+from services.streaming import stream_agent_events
 
 class NutritionHistoryInput(BaseModel):
     user_query: str = Field(
@@ -60,11 +59,16 @@ class HybridAgent:
             google_api_key=self.api_key,
             temperature=0.0,
             max_retries=0,
+            callbacks=tracing.llm_callbacks("gemini"),
         )
 
         fallbacks = [
             ChatGoogleGenerativeAI(
-                model=m, google_api_key=self.api_key, temperature=0.0, max_retries=0
+                model=m,
+                google_api_key=self.api_key,
+                temperature=0.0,
+                max_retries=0,
+                callbacks=tracing.llm_callbacks("gemini"),
             )
             for m in self.models_chain[1:]
         ]
@@ -93,27 +97,12 @@ class HybridAgent:
         return True
 
     def _init_vectorstore(self):
-        """Initialize ChromaDB with Google Cloud embeddings"""
+        """Initialize the knowledge base (local snapshot or ChromaDB)"""
         if self.vectorstore is None:
             try:
-              
-                embeddings = GoogleGenerativeAIEmbeddings(
-                    model="models/gemini-embedding-001", google_api_key=self.api_key
-                )
-
-                chroma_client = chromadb.HttpClient(
-                    host="chromadb",
-                    port=8000,
-                    settings=Settings(anonymized_telemetry=False),
-                )
-
-                self.vectorstore = Chroma(
-                    client=chroma_client,
-                    collection_name="mycalo_app_knowledge",
-                    embedding_function=embeddings,
-                )
+                self.vectorstore = get_knowledge_vectorstore(self.api_key)
                 print(
-                    "[VECTOR] ✓ Connected to ChromaDB container using Google Embeddings"
+                    f"[VECTOR] ✓ Knowledge base ready ({type(self.vectorstore).__name__})"
                 )
                 return True
             except Exception as e:
@@ -135,7 +124,7 @@ class HybridAgent:
         User Question: "{user_query}"
 
         Schema:
-        Table 1: tracking_dailylog (user_id, food_item_id, user_serving_grams, meal_type, date)
+        Table 1: tracking_dailylog (user_id, food_item_id, user_serving_grams, meal_type, date, calories, protein, carbohydrates, fat)
         Table 2: foods_fooditem (id, name, calories, protein, carbohydrates, fat)
         Table 3: exercises_exercise (id, name, met_value)
 
@@ -144,22 +133,51 @@ class HybridAgent:
         2. MEAL TYPES: The meal_type column ONLY contains uppercase values: 'BREAKFAST', 'LUNCH', 'DINNER', 'SNACK'.
         3. FOR GENERAL KNOWLEDGE: If asking about general food stats or exercise MET values, query foods_fooditem or exercises_exercise directly (DO NOT join with tracking_dailylog or filter by user_id).
         4. TEXT SEARCH: Always use ILIKE for case-insensitive text matching (e.g., name ILIKE '%Running%').
-        5. MACROS: All nutrition columns (calories, protein, carbohydrates, fat) are stored per 100g. Calculate actual macros using: (user_serving_grams/100.0) * value.
+        5. MACROS: tracking_dailylog.calories/protein/carbohydrates/fat are already scaled to the logged serving; SUM them directly for intake. The same columns in foods_fooditem are per 100g.
         6. Return ONLY valid PostgreSQL code. No markdown formatting.
         
         PostgreSQL Query:"""
 
         try:
-            response = await self.llm.ainvoke(sql_prompt)
-            sql = (
-                response.content.replace("```sql", "")
-                .replace("```", "")
-                .strip()
-                .rstrip(";")
-            )
-            print(f"[TOOL SQL GENERATED]:\n{sql}")
+            fast_query = match_nutrition_query(user_query, user_id)
+            cached_plan = None
+            if not fast_query:
+                cached_plan = sql_plan_cache.lookup(
+                    "gemini", user_query, user_id, current_date
+                )
+            if fast_query:
+                print(f"[TOOL FAST PATH] {fast_query.name} {fast_query.params}")
+                result = self.db.run(fast_query.sql, parameters=fast_query.params)
+            elif cached_plan:
+                cached_sql, params = cached_plan
+                print(f"[TOOL PLAN CACHE HIT] {params}")
+                result = self.db.run(cached_sql, parameters=params)
+            else:
+                response = await self.llm.ainvoke(sql_prompt)
+                sql = (
+                    response.content.replace("```sql", "")
+                    .replace("```", "")
+                    .strip()
+                    .rstrip(";")
+                )
+                print(f"[TOOL SQL GENERATED]:\n{sql}")
 
-            result = self.db.run(sql)
+                cached_sql = sql_plan_cache.store(
+                    "gemini", user_query, sql, user_id, current_date
+                )
+                if cached_sql:
+                    # Run the parameterized form so a bad rewrite never gets reused.
+                    params = sql_plan_cache.bind_params(
+                        user_query, user_id, current_date
+                    )
+                    try:
+                        result = self.db.run(cached_sql, parameters=params)
+                    except Exception as e:
+                        print(f"[TOOL PLAN CACHE REJECTED]: {e}")
+                        sql_plan_cache.invalidate("gemini", user_query)
+                        result = self.db.run(sql)
+                else:
+                    result = self.db.run(sql)
             print(f"[TOOL DB RESULT]: {result}")
 
             if not result or result == "[]" or str(result) == "[(None,)]":
@@ -238,3 +256,19 @@ Do your job quickly and concisely.""",
         except Exception as e:
             print(f"[CRITICAL AGENT ERROR] {str(e)}")
             return "I'm having a little trouble connecting to my systems right now."
+
+    async def stream_query(self, user_query: str, user_id: int):
+        """Streaming variant of process_query for the SSE endpoints"""
+        print(f"\n[AGENT STREAM] Processing query for User {user_id}")
+        try:
+            async for event in stream_agent_events(
+                self.agent_executor, {"input": user_query, "user_id": user_id}
+            ):
+                yield event
+
+        except Exception as e:
+            print(f"[CRITICAL AGENT ERROR] {str(e)}")
+            yield {
+                "type": "done",
+                "response": "I'm having a little trouble connecting to my systems right now.",
+            }
@@ -1,18 +1,19 @@
 import os
 from datetime import date
 
-import chromadb
-from chromadb.config import Settings
 from langchain.agents import AgentExecutor, create_tool_calling_agent
 from langchain.tools import StructuredTool
-from langchain_chroma import Chroma
 from langchain_community.utilities import SQLDatabase
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_groq import ChatGroq
 from pydantic import BaseModel, Field
 
 from config import settings
+from services import tracing
+from services.knowledge_base import get_knowledge_vectorstore
+from services.nutrition_queries import match_nutrition_query
+from services.sql_plan_cache import sql_plan_cache
+from services.streaming import stream_agent_events
 
 
 
@@ -52,10 +53,18 @@ class DoctorGroqAgent:
     def _initialize_groq_llm(self):
         print("[GROQ DOCTOR] Initializing Doctor Agent LLM...")
         primary_llm = ChatGroq(
-            model=self.models_chain[0], groq_api_key=self.groq_key, temperature=0.0
+            model=self.models_chain[0],
+            groq_api_key=self.groq_key,
+            temperature=0.0,
+            callbacks=tracing.llm_callbacks("groq"),
         )
         fallbacks = [
-            ChatGroq(model=m, groq_api_key=self.groq_key, temperature=0.0)
+            ChatGroq(
+                model=m,
+                groq_api_key=self.groq_key,
+                temperature=0.0,
+                callbacks=tracing.llm_callbacks("groq"),
+            )
             for m in self.models_chain[1:]
         ]
         return primary_llm.with_fallbacks(fallbacks)
@@ -86,21 +95,9 @@ class DoctorGroqAgent:
         """Lazy initialization of the Vector store connection"""
         if self.vectorstore is None:
             try:
-                embeddings = GoogleGenerativeAIEmbeddings(
-                    model="models/gemini-embedding-001", google_api_key=self.gemini_key
-                )
-                chroma_client = chromadb.HttpClient(
-                    host=settings.CHROMA_HOST,
-                    port=settings.CHROMA_PORT,
-                    settings=Settings(anonymized_telemetry=False),
-                )
-                self.vectorstore = Chroma(
-                    client=chroma_client,
-                    collection_name="mycalo_app_knowledge",
-                    embedding_function=embeddings,
-                )
+                self.vectorstore = get_knowledge_vectorstore(self.gemini_key)
                 print(
-                    "[CHROMA DB] ✓ Successfully connected Vector Store for Doctor Agent"
+                    f"[CHROMA DB] ✓ Doctor Agent knowledge base ready ({type(self.vectorstore).__name__})"
                 )
                 return True
             except Exception as e:
@@ -123,7 +120,7 @@ class DoctorGroqAgent:
         Doctor Request: {user_query}
         
         TABLES:
-        - tracking_dailylog (user_id, food_item_id, user_serving_grams, meal_type, date)
+        - tracking_dailylog (user_id, food_item_id, user_serving_grams, meal_type, date, calories, protein, carbohydrates, fat)
         - foods_fooditem (id, name, calories, protein, carbohydrates, fat)
         
         STRICT SQL RULES:
@@ -134,18 +131,50 @@ class DoctorGroqAgent:
         5. Return ONLY the raw SQL string. No markdown, no explanations."""
 
         try:
-            res = await self.llm.ainvoke(sql_prompt)
-            sql = (
-                res.content.strip().replace("```sql", "").replace("```", "").rstrip(";")
-            )
+            fast_query = match_nutrition_query(user_query, user_id)
+            cached_plan = None
+            if not fast_query:
+                cached_plan = sql_plan_cache.lookup(
+                    "doctor_groq", user_query, user_id, current_date
+                )
+            if fast_query:
+                print(f"[SQL FAST PATH] {fast_query.name} {fast_query.params}")
+                result = self.db.run(fast_query.sql, parameters=fast_query.params)
+            elif cached_plan:
+                cached_sql, params = cached_plan
+                print(f"[SQL PLAN CACHE HIT] {params}")
+                result = self.db.run(cached_sql, parameters=params)
+            else:
+                res = await self.llm.ainvoke(sql_prompt)
+                sql = (
+                    res.content.strip()
+                    .replace("```sql", "")
+                    .replace("```", "")
+                    .rstrip(";")
+                )
 
            
-            if sql.startswith("SELECT") is False:
-                sql = sql[sql.find("SELECT") :]
+                if sql.startswith("SELECT") is False:
+                    sql = sql[sql.find("SELECT") :]
 
-            print(f"[SQL GENERATED]: {sql}")
+                print(f"[SQL GENERATED]: {sql}")
 
-            result = self.db.run(sql)
+                cached_sql = sql_plan_cache.store(
+                    "doctor_groq", user_query, sql, user_id, current_date
+                )
+                if cached_sql:
+                    # Run the parameterized form so a bad rewrite never gets reused.
+                    params = sql_plan_cache.bind_params(
+                        user_query, user_id, current_date
+                    )
+                    try:
+                        result = self.db.run(cached_sql, parameters=params)
+                    except Exception as e:
+                        print(f"[SQL PLAN CACHE REJECTED]: {e}")
+                        sql_plan_cache.invalidate("doctor_groq", user_query)
+                        result = self.db.run(sql)
+                else:
+                    result = self.db.run(sql)
             print(f"[SQL DATA RETRIEVED]: {result}")
 
             
@@ -233,3 +262,19 @@ class DoctorGroqAgent:
         except Exception as e:
             print(f"[CRITICAL AGENT ERROR]: {str(e)}")
             return "I'm having trouble connecting to the patient database right now."
+
+    async def stream_query(self, user_query: str, user_id: int):
+        """Streaming variant of process_query for the SSE endpoints"""
+        print(f"\n[DOCTOR AGENT STREAM] Query regarding Patient {user_id}: {user_query}")
+        try:
+            async for event in stream_agent_events(
+                self.agent_executor, {"input": user_query, "user_id": user_id}
+            ):
+                yield event
+
+        except Exception as e:
+            print(f"[CRITICAL AGENT ERROR]: {str(e)}")
+            yield {
+                "type": "done",
+                "response": "I'm having trouble connecting to the patient database right now.",
+            }
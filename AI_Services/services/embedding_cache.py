@@ -0,0 +1,148 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List
+
+from langchain_core.embeddings import Embeddings
+from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+from config import settings
+
+EMBEDDING_MODEL = "models/gemini-embedding-001"
+
+
+class SQLiteEmbeddingStore:
+    """Persistent text-hash -> vector map. Vectors are stored as float32 blobs."""
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)"
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: List[str]) -> dict:
+        found = {}
+        with self._lock:
+            # Stay well under SQLite's bound-variable limit.
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+        return found
+
+    def set_many(self, items: dict):
+        if not items:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [(key, array("f", vector).tobytes()) for key, vector in items.items()],
+            )
+            self._conn.commit()
+
+
+class CachedEmbeddings(Embeddings):
+    """Wraps an embeddings model with a local cache and batched, bounded-concurrency
+    document embedding.
+
+    Queries and documents are cached separately because the Gemini model embeds
+    them with different task types.
+    """
+
+    def __init__(
+        self,
+        underlying: Embeddings,
+        store: SQLiteEmbeddingStore,
+        namespace: str,
+        batch_size: int = 50,
+        max_concurrency: int = 4,
+    ):
+        self.underlying = underlying
+        self.store = store
+        self.namespace = namespace
+        self.batch_size = max(batch_size, 1)
+        self.max_concurrency = max(max_concurrency, 1)
+
+    def _key(self, kind: str, text: str) -> str:
+        raw = f"{self.namespace}\0{kind}\0{text}".encode("utf-8")
+        return hashlib.sha256(raw).hexdigest()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._key("document", text) for text in texts]
+        cached = self.store.get_many(list(set(keys)))
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in cached:
+                missing.setdefault(key, text)
+
+        if missing:
+            print(
+                f"[EMBEDDINGS] {len(set(keys)) - len(missing)} cached, "
+                f"embedding {len(missing)} in batches of {self.batch_size}"
+            )
+            missing_keys = list(missing)
+            batches = [
+                missing_keys[start : start + self.batch_size]
+                for start in range(0, len(missing_keys), self.batch_size)
+            ]
+
+            def embed_batch(batch_keys):
+                vectors = self.underlying.embed_documents(
+                    [missing[key] for key in batch_keys]
+                )
+                fresh = dict(zip(batch_keys, vectors))
+                # Persist per batch so an interrupted run keeps its progress.
+                self.store.set_many(fresh)
+                return fresh
+
+            workers = min(self.max_concurrency, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for fresh in pool.map(embed_batch, batches):
+                    cached.update(fresh)
+
+        return [cached[key] for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        # Repeated FAQ-style questions differ mostly in casing and spacing.
+        key = self._key("query", " ".join(text.lower().split()))
+        cached = self.store.get_many([key])
+        if key in cached:
+            print("[EMBEDDINGS] Query embedding served from cache")
+            return cached[key]
+
+        vector = self.underlying.embed_query(text)
+        self.store.set_many({key: vector})
+        return vector
+
+
+@lru_cache(maxsize=1)
+def _get_store(path: str) -> SQLiteEmbeddingStore:
+    return SQLiteEmbeddingStore(path)
+
+
+@lru_cache(maxsize=None)
+def build_embeddings(api_key: str) -> CachedEmbeddings:
+    """Returns the shared cached Gemini embeddings for an API key."""
+    return CachedEmbeddings(
+        GoogleGenerativeAIEmbeddings(model=EMBEDDING_MODEL, google_api_key=api_key),
+        _get_store(settings.EMBEDDING_CACHE_PATH),
+        namespace=EMBEDDING_MODEL,
+        batch_size=settings.EMBEDDING_BATCH_SIZE,
+        max_concurrency=settings.EMBEDDING_CONCURRENCY,
+    )
@@ -4,6 +4,7 @@ import json
 import requests
 
 from config import settings
+from services import tracing
 
 
 class GeminiServiceError(Exception):
@@ -19,7 +20,7 @@ class GeminiService:
             raise RuntimeError("GEMINI_API_KEY not configured")
 
         self.api_key = settings.GEMINI_API_KEY
-        self.base_url = "https://generativelanguage.googleapis.com/v1beta/models"
+        self.base_url = f"{settings.GEMINI_BASE_URL}/v1beta/models"
 
         self.models_chain = [
             "gemini-2.5-flash-lite",
@@ -78,42 +79,53 @@ class GeminiService:
         for model in self.models_chain:
             print(f"[AI REQUEST] Trying model: {model}...")
 
-            try:
-                response = await asyncio.to_thread(
-                    requests.post,
-                    f"{self.base_url}/{model}:generateContent?key={self.api_key}",
-                    headers={"Content-Type": "application/json"},
-                    json=payload,
-                )
-
-                if response.status_code != 200:
-                    print(
-                        f"[FAIL] {model} failed with {response.status_code}. Error: {response.text}"
-                    )
-                    last_error = f"{model} error: {response.status_code}"
-                    continue
-
-                result = response.json()
-
+            with tracing.llm_attempt("gemini", model) as attempt:
                 try:
-                    text_data = result["candidates"][0]["content"]["parts"][0]["text"]
-                    text_data = (
-                        text_data.replace("```json", "").replace("```", "").strip()
+                    response = await asyncio.to_thread(
+                        requests.post,
+                        f"{self.base_url}/{model}:generateContent",
+                        headers={
+                            "Content-Type": "application/json",
+                            # A header rather than ?key=, so the key stays out
+                            # of URLs that get logged or traced.
+                            "x-goog-api-key": self.api_key,
+                        },
+                        json=payload,
                     )
 
-                    print(f"[SUCCESS] Connected to {model}")
-                    return json.loads(text_data)
-
-                except Exception:
-                    print(f"[PARSE ERROR] {model} returned bad data: {result}")
-                    last_error = f"{model} parsing failed"
+                    if response.status_code != 200:
+                        print(
+                            f"[FAIL] {model} failed with {response.status_code}. Error: {response.text}"
+                        )
+                        last_error = f"{model} error: {response.status_code}"
+                        tracing.attempt_failed(attempt, last_error)
+                        continue
+
+                    result = response.json()
+
+                    try:
+                        text_data = result["candidates"][0]["content"]["parts"][0][
+                            "text"
+                        ]
+                        text_data = (
+                            text_data.replace("```json", "").replace("```", "").strip()
+                        )
+
+                        print(f"[SUCCESS] Connected to {model}")
+                        return json.loads(text_data)
+
+                    except Exception:
+                        print(f"[PARSE ERROR] {model} returned bad data: {result}")
+                        last_error = f"{model} parsing failed"
+                        tracing.attempt_failed(attempt, last_error)
+                        continue
+
+                except Exception as e:
+                    print(f"[EXCEPTION] {model} crashed: {e}")
+                    last_error = str(e)
+                    tracing.attempt_failed(attempt, last_error)
                     continue
 
-            except Exception as e:
-                print(f"[EXCEPTION] {model} crashed: {e}")
-                last_error = str(e)
-                continue
-
         print("[FATAL] All failover models failed.")
         raise GeminiServiceError(
             f"Service Unavailable. All AI models failed. Last error: {last_error}",
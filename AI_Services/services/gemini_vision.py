@@ -5,6 +5,7 @@ import json
 import requests
 
 from config import settings
+from services import tracing
 
 
 class GeminiVisionServiceError(Exception):
@@ -20,7 +21,7 @@ class GeminiVisionService:
             raise RuntimeError("GEMINI_API_KEY not configured")
 
         self.api_key = settings.GEMINI_API_KEY
-        self.base_url = "https://generativelanguage.googleapis.com/v1beta/models"
+        self.base_url = f"{settings.GEMINI_BASE_URL}/v1beta/models"
 
         self.models_chain = [
             "gemini-2.5-flash",
@@ -87,42 +88,53 @@ class GeminiVisionService:
         for model in self.models_chain:
             print(f"[VISION REQUEST] Trying model: {model}...")
 
-            try:
-                response = await asyncio.to_thread(
-                    requests.post,
-                    f"{self.base_url}/{model}:generateContent?key={self.api_key}",
-                    headers={"Content-Type": "application/json"},
-                    json=payload,
-                )
-
-                if response.status_code != 200:
-                    print(
-                        f"[FAIL] {model} failed with {response.status_code}. Error: {response.text}"
-                    )
-                    last_error = f"{model} error: {response.status_code}"
-                    continue
-
-                result = response.json()
-
+            with tracing.llm_attempt("gemini", model) as attempt:
                 try:
-                    text_data = result["candidates"][0]["content"]["parts"][0]["text"]
-                    text_data = (
-                        text_data.replace("```json", "").replace("```", "").strip()
+                    response = await asyncio.to_thread(
+                        requests.post,
+                        f"{self.base_url}/{model}:generateContent",
+                        headers={
+                            "Content-Type": "application/json",
+                            # A header rather than ?key=, so the key stays out
+                            # of URLs that get logged or traced.
+                            "x-goog-api-key": self.api_key,
+                        },
+                        json=payload,
                     )
 
-                    print(f"[SUCCESS] Vision analysis with {model}")
-                    return json.loads(text_data)
-
-                except Exception:
-                    print(f"[PARSE ERROR] {model} returned bad data")
-                    last_error = f"{model} parsing failed"
+                    if response.status_code != 200:
+                        print(
+                            f"[FAIL] {model} failed with {response.status_code}. Error: {response.text}"
+                        )
+                        last_error = f"{model} error: {response.status_code}"
+                        tracing.attempt_failed(attempt, last_error)
+                        continue
+
+                    result = response.json()
+
+                    try:
+                        text_data = result["candidates"][0]["content"]["parts"][0][
+                            "text"
+                        ]
+                        text_data = (
+                            text_data.replace("```json", "").replace("```", "").strip()
+                        )
+
+                        print(f"[SUCCESS] Vision analysis with {model}")
+                        return json.loads(text_data)
+
+                    except Exception:
+                        print(f"[PARSE ERROR] {model} returned bad data")
+                        last_error = f"{model} parsing failed"
+                        tracing.attempt_failed(attempt, last_error)
+                        continue
+
+                except Exception as e:
+                    print(f"[EXCEPTION] {model} crashed: {e}")
+                    last_error = str(e)
+                    tracing.attempt_failed(attempt, last_error)
                     continue
 
-            except Exception as e:
-                print(f"[EXCEPTION] {model} crashed: {e}")
-                last_error = str(e)
-                continue
-
         print("[FATAL] All vision models failed.")
         raise GeminiVisionServiceError(
             f"Service Unavailable. Vision analysis failed. Last error: {last_error}",
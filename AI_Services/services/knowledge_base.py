@@ -0,0 +1,68 @@
+import chromadb
+from chromadb.config import Settings
+from langchain_chroma import Chroma
+
+from config import settings
+from services.embedding_cache import build_embeddings
+from services.local_vector_index import LocalVectorIndex, snapshot_version
+
+COLLECTION_NAME = "mycalo_app_knowledge"
+
+# (snapshot version, api key) -> loaded index, shared by every agent instance
+_local_index = {}
+
+
+def _load_local_index(api_key: str):
+    version = snapshot_version(settings.VECTOR_SNAPSHOT_DIR)
+    if version is None:
+        return None
+
+    key = (version, api_key)
+    if key not in _local_index:
+        _local_index.clear()
+        _local_index[key] = LocalVectorIndex(
+            settings.VECTOR_SNAPSHOT_DIR, build_embeddings(api_key)
+        )
+        print(
+            f"[VECTOR] Loaded local snapshot ({len(_local_index[key])} documents) "
+            f"from {settings.VECTOR_SNAPSHOT_DIR}"
+        )
+    return _local_index[key]
+
+
+def _connect_remote(api_key: str):
+    chroma_client = chromadb.HttpClient(
+        host=settings.CHROMA_HOST,
+        port=settings.CHROMA_PORT,
+        settings=Settings(anonymized_telemetry=False),
+    )
+    return Chroma(
+        client=chroma_client,
+        collection_name=COLLECTION_NAME,
+        embedding_function=build_embeddings(api_key),
+    )
+
+
+def get_knowledge_vectorstore(api_key: str):
+    """Returns something with `similarity_search(query, k)` for the app knowledge base.
+
+    VECTOR_STORE_MODE:
+    - "remote": always the Chroma server
+    - "embedded": only the local snapshot written by seed_chroma.py
+    - "auto": the local snapshot when one exists, otherwise Chroma
+    """
+    mode = settings.VECTOR_STORE_MODE
+
+    if mode in ("embedded", "auto"):
+        try:
+            index = _load_local_index(api_key)
+            if index is not None:
+                return index
+        except Exception as e:
+            print(f"[VECTOR ERROR] Local snapshot unusable: {e}")
+        if mode == "embedded":
+            raise RuntimeError(
+                f"No usable vector snapshot in {settings.VECTOR_SNAPSHOT_DIR}"
+            )
+
+    return _connect_remote(api_key)
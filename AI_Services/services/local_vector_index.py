@@ -0,0 +1,105 @@
+import json
+import os
+import shutil
+
+import numpy as np
+from langchain_core.documents import Document
+
+VECTORS_FILE = "vectors.npy"
+DOCUMENTS_FILE = "documents.jsonl"
+META_FILE = "meta.json"
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class LocalVectorIndex:
+    """Flat cosine-similarity index over a snapshot of a Chroma collection.
+
+    Vectors are memory-mapped, so every worker process shares the same pages and
+    loading is instant. Brute force is exact and fast at knowledge-base scale
+    (a few thousand documents), which is why there is no HNSW graph here.
+    """
+
+    def __init__(self, directory: str, embedding_function):
+        self.directory = directory
+        self.embedding_function = embedding_function
+        self.vectors = np.load(os.path.join(directory, VECTORS_FILE), mmap_mode="r")
+        with open(os.path.join(directory, DOCUMENTS_FILE), encoding="utf-8") as f:
+            self.documents = [json.loads(line) for line in f if line.strip()]
+        if len(self.documents) != len(self.vectors):
+            raise ValueError(f"Corrupt snapshot in {directory}: size mismatch")
+
+    def __len__(self):
+        return len(self.documents)
+
+    def similarity_search(self, query: str, k: int = 4, **kwargs):
+        """Same call shape as Chroma.similarity_search for the agents."""
+        if not len(self):
+            return []
+        query_vector = _normalize(
+            np.asarray(self.embedding_function.embed_query(query), dtype=np.float32)
+        )
+        scores = self.vectors @ query_vector
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            Document(
+                page_content=self.documents[i]["page_content"],
+                metadata=self.documents[i]["metadata"],
+            )
+            for i in top
+        ]
+
+
+def snapshot_version(directory: str):
+    """mtime of the snapshot's meta file, or None if there is no snapshot."""
+    try:
+        return os.stat(os.path.join(directory, META_FILE)).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def export_snapshot(vectorstore, directory: str, page_size: int = 500) -> int:
+    """Writes every document and embedding of a langchain Chroma store to
+    `directory`. The new snapshot is swapped in whole, so readers never see a
+    half-written one."""
+    staging = f"{directory}.tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+
+    pages = []
+    offset = 0
+    with open(os.path.join(staging, DOCUMENTS_FILE), "w", encoding="utf-8") as f:
+        while True:
+            page = vectorstore.get(
+                include=["embeddings", "documents", "metadatas"],
+                limit=page_size,
+                offset=offset,
+            )
+            if not page["ids"]:
+                break
+            for doc_id, content, metadata in zip(
+                page["ids"], page["documents"], page["metadatas"]
+            ):
+                row = {"id": doc_id, "page_content": content, "metadata": metadata}
+                f.write(json.dumps(row) + "\n")
+            pages.append(np.asarray(page["embeddings"], dtype=np.float32))
+            offset += len(page["ids"])
+
+    vectors = _normalize(np.concatenate(pages)) if pages else np.zeros((0, 0))
+    np.save(os.path.join(staging, VECTORS_FILE), vectors.astype(np.float32))
+    with open(os.path.join(staging, META_FILE), "w", encoding="utf-8") as f:
+        json.dump({"count": offset, "dimensions": int(vectors.shape[-1])}, f)
+
+    previous = f"{directory}.old"
+    shutil.rmtree(previous, ignore_errors=True)
+    if os.path.exists(directory):
+        os.rename(directory, previous)
+    os.rename(staging, directory)
+    shutil.rmtree(previous, ignore_errors=True)
+    return offset
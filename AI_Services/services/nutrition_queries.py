@@ -0,0 +1,255 @@
+import re
+from datetime import date, timedelta
+from typing import NamedTuple, Optional
+
+MEAL_TYPES = ("BREAKFAST", "LUNCH", "DINNER", "SNACK")
+
+# --- Parameterized query library ---
+# tracking_dailylog rows carry their own nutrient snapshot (already scaled to
+# the serving and rounded like the Django serializers), so totals are plain
+# column sums. foods_fooditem is only joined when the food name is needed.
+
+_LOG_FROM = """
+    FROM tracking_dailylog t1"""
+
+_FOOD_JOIN = """
+    JOIN foods_fooditem t2 ON t2.id = t1.food_item_id"""
+
+_LOG_WHERE = """
+    WHERE t1.user_id = :user_id
+      AND t1.date BETWEEN :start_date AND :end_date"""
+
+_MEAL_FILTER = """
+      AND t1.meal_type = :meal_type"""
+
+_TOTALS_COLUMNS = """
+    SELECT
+        COUNT(DISTINCT t1.date) AS days_logged,
+        COUNT(*) AS items_logged,
+        SUM(t1.calories) AS calories,
+        ROUND(SUM(t1.protein)::numeric, 1) AS protein_g,
+        ROUND(SUM(t1.carbohydrates)::numeric, 1) AS carbs_g,
+        ROUND(SUM(t1.fat)::numeric, 1) AS fat_g"""
+
+# Without HAVING an empty period still returns one row of (0, 0, NULL, ...),
+# which the agents would report as totals instead of "nothing logged".
+_TOTALS_HAVING = """
+    HAVING COUNT(*) > 0"""
+
+TOTALS_SQL = _TOTALS_COLUMNS + _LOG_FROM + _LOG_WHERE + _TOTALS_HAVING
+
+MEAL_TOTALS_SQL = (
+    _TOTALS_COLUMNS + _LOG_FROM + _LOG_WHERE + _MEAL_FILTER + _TOTALS_HAVING
+)
+
+_ITEM_COLUMNS = """
+    SELECT
+        t1.date,
+        t1.meal_type,
+        t2.name,
+        t1.user_serving_grams AS grams,
+        t1.calories"""
+
+_ITEM_ORDER = """
+    ORDER BY t1.date, t1.created_at"""
+
+LOG_ITEMS_SQL = _ITEM_COLUMNS + _LOG_FROM + _FOOD_JOIN + _LOG_WHERE + _ITEM_ORDER
+
+MEAL_ITEMS_SQL = (
+    _ITEM_COLUMNS + _LOG_FROM + _FOOD_JOIN + _LOG_WHERE + _MEAL_FILTER + _ITEM_ORDER
+)
+
+TOP_FOODS_SQL = (
+    """
+    SELECT
+        t2.name,
+        COUNT(*) AS times_logged,
+        SUM(t1.calories) AS calories"""
+    + _LOG_FROM
+    + _FOOD_JOIN
+    + _LOG_WHERE
+    + """
+    GROUP BY t2.name
+    ORDER BY times_logged DESC, calories DESC
+    LIMIT :limit"""
+)
+
+
+class FastPathQuery(NamedTuple):
+    name: str
+    sql: str
+    params: dict
+
+
+# --- Lightweight intent matcher ---
+
+_SUBJECT_RE = re.compile(
+    r"\b(i|i'?ve|me|my|mine|patient'?s?|he|she|they|their|his|her)\b"
+)
+_OUT_OF_SCOPE_RE = re.compile(
+    r"\b(exercise|exercises|workout|workouts|burn|burned|burnt|run|ran|running|"
+    r"walk|walked|walking|steps|met|recipe|recipes|should|suggest|recommend|"
+    r"why|how to|weight|goal|goals)\b"
+)
+_METRIC_RE = re.compile(
+    r"\b(calories|calorie|kcal|protein|proteins|carbs|carb|carbohydrates|"
+    r"fat|fats|macros|macro|total|intake)\b"
+)
+# Totals and listings need past-tense intake ("did I eat", "had", "logged"),
+# so "how many calories do I need" or "what can I eat" never get them.
+_INTAKE_RE = re.compile(
+    r"\b(ate|eaten|had|logged|consumed|intake|"
+    r"did\s+(?:\S+\s+){1,2}?(?:eat|have|log|get|consume))\b"
+)
+_NOT_HISTORY_RE = re.compile(
+    r"\b(need|needs|left|remaining|remain|can|could|would|will|allowed|budget|"
+    r"target|limit|supposed)\b"
+)
+_LISTING_RE = re.compile(r"\b(what|which|list|show)\b")
+_TOP_FOODS_RE = re.compile(
+    r"\b(top|most|favorite|favourite|often|frequently|usually)\b"
+)
+_ISO_DATE_RE = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
+_LAST_N_DAYS_RE = re.compile(r"\b(?:last|past)\s+(\d{1,3})\s+days?\b")
+
+# Periods and aggregations the queries below can't answer. A question using
+# them goes to the LLM rather than getting a confident answer for the wrong
+# period (e.g. today's totals for "in september") or the wrong statistic (a
+# SUM for "average protein").
+_UNSUPPORTED_PERIOD_RE = re.compile(
+    r"\b(january|february|march|april|may|june|july|august|september|october|"
+    r"november|december|jan|feb|mar|apr|jun|jul|aug|sep|sept|oct|nov|dec|"
+    r"monday|tuesday|wednesday|thursday|friday|saturday|sunday|weekend|"
+    r"year|years|yearly|annual|(?:19|20)\d{2})\b"
+    r"|\bbefore last\b"
+    r"|\bweek\s+(\d+|one|two|three|four|five)\b"
+    r"|\b(last|past|previous)\s+(\d+|a few|few|couple|two|three|four|five|six|"
+    r"seven|eight|nine|ten)\s+(?!days?\b)\w+"
+)
+_AGGREGATE_RE = re.compile(
+    r"\b(average|avg|mean|median|highest|lowest|max|maximum|min|minimum|least|"
+    r"best|worst|peak|daily|each day|per day|per meal|per week)\b"
+)
+# Any other hint of a period; without one the question is about today.
+_TEMPORAL_RE = re.compile(
+    r"\b(ago|since|between|last|past|previous|recent|recently|lately|earlier|"
+    r"before|after|until|during|day|days|week|weeks|month|months)\b"
+)
+
+_MEAL_WORDS = {
+    "breakfast": "BREAKFAST",
+    "lunch": "LUNCH",
+    "dinner": "DINNER",
+    "supper": "DINNER",
+    "snack": "SNACK",
+    "snacks": "SNACK",
+}
+
+
+def _resolve_date_range(text: str, today: date):
+    """Returns (start, end) for the period mentioned in the question, or None
+    if the period is phrased in a way the fast path does not understand."""
+    if _UNSUPPORTED_PERIOD_RE.search(_ISO_DATE_RE.sub(" ", text)):
+        return None
+
+    iso_dates = _ISO_DATE_RE.findall(text)
+    if len(iso_dates) == 1:
+        try:
+            day = date.fromisoformat(iso_dates[0])
+        except ValueError:
+            return None
+        return day, day
+    if len(iso_dates) > 1:
+        return None
+
+    match = _LAST_N_DAYS_RE.search(text)
+    if match:
+        days = int(match.group(1))
+        if days < 1 or days > 365:
+            return None
+        return today - timedelta(days=days - 1), today
+
+    if re.search(r"\b(today|tonight)\b", text):
+        return today, today
+    if "yesterday" in text:
+        day = today - timedelta(days=1)
+        return day, day
+    if re.search(r"\bpast week\b", text):
+        return today - timedelta(days=6), today
+    if re.search(r"\blast week\b", text):
+        start = today - timedelta(days=today.weekday() + 7)
+        return start, start + timedelta(days=6)
+    if re.search(r"\bthis week\b", text):
+        return today - timedelta(days=today.weekday()), today
+    if re.search(r"\blast month\b", text):
+        end = today.replace(day=1) - timedelta(days=1)
+        return end.replace(day=1), end
+    if re.search(r"\bthis month\b", text):
+        return today.replace(day=1), today
+    if _TEMPORAL_RE.search(text):
+        # Relative phrasing we don't parse ("3 weeks ago", "since monday").
+        return None
+    return today, today
+
+
+def match_nutrition_query(
+    user_query: str, user_id: int, today: Optional[date] = None
+) -> Optional[FastPathQuery]:
+    """Maps common nutrition-history questions to a parameterized query.
+
+    Returns None when the question is not a clear match, so the caller can fall
+    back to LLM-generated SQL.
+    """
+    text = " ".join(user_query.lower().split())
+    today = today or date.today()
+
+    if not _SUBJECT_RE.search(text) or _OUT_OF_SCOPE_RE.search(text):
+        return None
+    if _AGGREGATE_RE.search(text) or _NOT_HISTORY_RE.search(text):
+        return None
+
+    date_range = _resolve_date_range(text, today)
+    if date_range is None:
+        return None
+    start_date, end_date = date_range
+
+    meals = {
+        meal for word, meal in _MEAL_WORDS.items() if re.search(rf"\b{word}\b", text)
+    }
+    if len(meals) > 1:
+        return None
+    meal_type = meals.pop() if meals else None
+
+    params = {
+        "user_id": int(user_id),
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+    }
+
+    if _TOP_FOODS_RE.search(text) and re.search(
+        r"\b(food|foods|eat|ate|meal|meals)\b", text
+    ):
+        # Ranked by how often foods were eaten, so "the most protein food"
+        # (a metric ranking) has to go to the LLM.
+        if meal_type or _METRIC_RE.search(text):
+            return None
+        params["limit"] = 5
+        return FastPathQuery("top_foods", TOP_FOODS_SQL, params)
+
+    if not _INTAKE_RE.search(text):
+        return None
+
+    if _LISTING_RE.search(text) and not _METRIC_RE.search(text):
+        if meal_type:
+            params["meal_type"] = meal_type
+            return FastPathQuery("meal_items", MEAL_ITEMS_SQL, params)
+        return FastPathQuery("log_items", LOG_ITEMS_SQL, params)
+
+    if _METRIC_RE.search(text):
+        if meal_type:
+            params["meal_type"] = meal_type
+            return FastPathQuery("meal_totals", MEAL_TOTALS_SQL, params)
+        name = "day_totals" if start_date == end_date else "range_totals"
+        return FastPathQuery(name, TOTALS_SQL, params)
+
+    return None
@@ -0,0 +1,135 @@
+import re
+from collections import OrderedDict
+from typing import Optional
+
+from config import settings
+
+_ISO_DATE_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
+_ID_RE = re.compile(r"\b(?:id|user|patient)\s*#?\s*(\d+)\b")
+_SQL_DATE_LITERAL_RE = re.compile(r"'(\d{4}-\d{2}-\d{2})'")
+_WRITE_KEYWORDS_RE = re.compile(
+    r"\b(insert|update|delete|drop|alter|create|truncate|grant|revoke|copy)\b",
+    re.IGNORECASE,
+)
+
+
+def normalize_question(question: str):
+    """Turns a question into a cache template plus the values abstracted out of it.
+
+    "calories on 2026-03-01 for patient 12" -> "calories on <date> for patient <id>"
+    with dates ["2026-03-01"].
+    """
+    text = " ".join(question.lower().split())
+    dates = _ISO_DATE_RE.findall(text)
+    template = _ISO_DATE_RE.sub("<date>", text)
+    template = _ID_RE.sub(lambda m: m.group(0).replace(m.group(1), "<id>"), template)
+    template = re.sub(r"[^\w<>' -]", "", template).strip()
+    return template, dates
+
+
+def parameterize_sql(
+    sql: str, user_id: int, current_date: str, dates: list, ids: tuple = ()
+):
+    """Replaces the literals the LLM baked into the query with bind parameters.
+
+    Returns None if the statement is not a single read-only SELECT or still
+    contains a literal that would make it unsafe to reuse for another user/day.
+    `ids` are the ids the question mentioned (its template has "<id>" in their
+    place); only the one equal to user_id can be bound, so any other left in
+    the statement makes it unsafe to reuse for a question about another id.
+    """
+    statement = sql.strip().rstrip(";").strip()
+    if ";" in statement or _WRITE_KEYWORDS_RE.search(statement):
+        return None
+    if not re.match(r"^(select|with)\b", statement, re.IGNORECASE):
+        return None
+
+    def replace_date(match):
+        value = match.group(1)
+        if value in dates:
+            return f":date_{dates.index(value)}"
+        if value == current_date:
+            return ":current_date"
+        return match.group(0)
+
+    statement = _SQL_DATE_LITERAL_RE.sub(replace_date, statement)
+    statement = re.sub(
+        rf"(\buser_id\s*=\s*)'?{int(user_id)}'?(?!\d)",
+        r"\1:user_id",
+        statement,
+        flags=re.IGNORECASE,
+    )
+
+    if _SQL_DATE_LITERAL_RE.search(statement):
+        return None
+    for value in {int(user_id), *map(int, ids)}:
+        if re.search(rf"(?<![\w.]){value}(?![\w.])", statement):
+            return None
+    if "tracking_dailylog" in statement.lower() and ":user_id" not in statement:
+        return None
+    return statement
+
+
+class SQLPlanCache:
+    """LRU cache of validated, parameterized SQL keyed by question template."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._plans = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, namespace: str, question: str, user_id: int, current_date: str):
+        """Returns (sql, params) for a previously seen question template."""
+        template, dates = normalize_question(question)
+        key = (namespace, template)
+        sql = self._plans.get(key)
+        if sql is None:
+            self.misses += 1
+            return None
+
+        self._plans.move_to_end(key)
+        self.hits += 1
+        return sql, self.bind_params(question, user_id, current_date)
+
+    def bind_params(self, question: str, user_id: int, current_date: str) -> dict:
+        """Builds the bind parameters a cached statement expects for a question."""
+        _, dates = normalize_question(question)
+        params = {"user_id": int(user_id), "current_date": current_date}
+        params.update({f"date_{i}": value for i, value in enumerate(dates)})
+        return params
+
+    def store(
+        self, namespace: str, question: str, sql: str, user_id: int, current_date: str
+    ) -> Optional[str]:
+        """Parameterizes and caches LLM-generated SQL. Returns the cached
+        statement, or None if it could not be safely parameterized."""
+        template, dates = normalize_question(question)
+        ids = _ID_RE.findall(question.lower())
+        statement = parameterize_sql(sql, user_id, current_date, dates, ids)
+        if statement is None:
+            return None
+
+        key = (namespace, template)
+        self._plans[key] = statement
+        self._plans.move_to_end(key)
+        while len(self._plans) > self.maxsize:
+            self._plans.popitem(last=False)
+        return statement
+
+    def invalidate(self, namespace: str, question: str):
+        template, _ = normalize_question(question)
+        self._plans.pop((namespace, template), None)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._plans),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+sql_plan_cache = SQLPlanCache(maxsize=settings.SQL_PLAN_CACHE_SIZE)
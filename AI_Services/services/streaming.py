@@ -0,0 +1,114 @@
+import asyncio
+import json
+
+# nginx buffers proxied responses by default, which would hold every event
+# until the agent finishes. X-Accel-Buffering turns that off per response.
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+
+def sse_event(event: dict) -> str:
+    """Formats an agent event as a Server-Sent Events frame."""
+    return f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+
+
+def _chunk_text(content) -> str:
+    if isinstance(content, list):
+        return "".join(
+            part.get("text", "") if isinstance(part, dict) else str(part)
+            for part in content
+        )
+    return content or ""
+
+
+async def stream_agent_events(agent_executor, inputs: dict):
+    """Runs an AgentExecutor and yields events as they are produced.
+
+    - {"type": "step", "tool": ..., "status": "start" | "end"} around tool calls
+    - {"type": "token", "content": ...} for tokens of the agent's own answer
+    - {"type": "done", "response": ...} once with the final output
+
+    A model turn's tokens are held back until the turn ends. If it ends in a
+    tool call, the text was reasoning and is dropped. A model in a fallback
+    chain that fails part way never ends, so its partial text is dropped too.
+    Tokens from LLM calls made inside a tool (e.g. SQL generation) are never
+    forwarded; only the model driving the agent is streamed to the user.
+    """
+    tool_depth = 0
+    turns = {}  # run_id -> tokens of an agent model turn still in progress
+    answer = []
+    final_output = None
+
+    async for event in agent_executor.astream_events(inputs, version="v2"):
+        kind = event["event"]
+
+        if kind == "on_tool_start":
+            tool_depth += 1
+            print(f"[STREAM] Tool started: {event['name']}")
+            yield {"type": "step", "tool": event["name"], "status": "start"}
+
+        elif kind == "on_tool_end":
+            tool_depth = max(tool_depth - 1, 0)
+            yield {"type": "step", "tool": event["name"], "status": "end"}
+
+        elif kind == "on_chat_model_start" and tool_depth == 0:
+            turns[event["run_id"]] = []
+
+        elif kind == "on_chat_model_stream" and event["run_id"] in turns:
+            content = _chunk_text(event["data"]["chunk"].content)
+            if content:
+                turns[event["run_id"]].append(content)
+
+        elif kind == "on_chat_model_end" and event["run_id"] in turns:
+            tokens = turns.pop(event["run_id"])
+            if getattr(event["data"].get("output"), "tool_calls", None):
+                continue
+            for content in tokens:
+                answer.append(content)
+                yield {"type": "token", "content": content}
+
+        elif kind == "on_chain_end" and event["name"] == "AgentExecutor":
+            output = event["data"].get("output") or {}
+            final_output = output.get("output")
+
+    if final_output is None:
+        final_output = "".join(answer)
+    yield {"type": "done", "response": final_output}
+
+
+# Detached runs in progress. The event loop only keeps weak references to
+# tasks, so without this a run whose client left could be garbage collected.
+_detached_runs = set()
+
+
+async def detached(events):
+    """Iterates `events` in a task of its own and re-yields them.
+
+    If the client disconnects, the response stops iterating but the task runs
+    `events` to the end, so work done when it finishes (saving the answer to
+    the chat history) still happens. An exception raised by `events` is
+    re-raised to the consumer if it is still listening.
+    """
+    queue = asyncio.Queue()
+    finished = object()
+
+    async def pump():
+        try:
+            async for event in events:
+                queue.put_nowait(event)
+        except Exception as exc:
+            queue.put_nowait(exc)
+        finally:
+            queue.put_nowait(finished)
+
+    task = asyncio.create_task(pump())
+    _detached_runs.add(task)
+    task.add_done_callback(_detached_runs.discard)
+
+    while (item := await queue.get()) is not finished:
+        if isinstance(item, Exception):
+            raise item
+        yield item
@@ -0,0 +1,156 @@
+"""
+OpenTelemetry tracing, switched on by setting OTEL_EXPORTER_OTLP_ENDPOINT
+(e.g. http://otel-collector:4318, see docker-compose.tracing.yml).
+
+Requests continue the caller's trace from its traceparent header. Gemini
+(requests), Groq (httpx), DynamoDB (boto3) and SQL (psycopg2) calls get client
+spans, and every model tried in a failover chain gets its own span, so a trace
+shows which models failed before one answered:
+
+- GeminiService / GeminiVisionService wrap each attempt in `llm_attempt()`.
+- The LangChain agents pass `llm_callbacks()` to each model in their
+  with_fallbacks() chain.
+
+Configured on import, like config.settings, so the agents built when the
+routers are imported already see it. Without the variable none of the
+OpenTelemetry packages are imported and the helpers do nothing.
+"""
+
+from contextlib import contextmanager
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from config import settings
+
+_tracer = None
+
+
+def configure():
+    global _tracer
+    if _tracer is not None or not settings.OTEL_EXPORTER_OTLP_ENDPOINT:
+        return
+
+    from opentelemetry import trace
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+        OTLPSpanExporter,
+    )
+    from opentelemetry.instrumentation.botocore import BotocoreInstrumentor
+    from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+    from opentelemetry.instrumentation.psycopg2 import Psycopg2Instrumentor
+    from opentelemetry.instrumentation.requests import RequestsInstrumentor
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.OTEL_SERVICE_NAME})
+    )
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    trace.set_tracer_provider(provider)
+
+    RequestsInstrumentor().instrument()
+    HTTPXClientInstrumentor().instrument()
+    BotocoreInstrumentor().instrument()
+    Psycopg2Instrumentor().instrument()
+
+    _tracer = trace.get_tracer(__name__)
+
+
+def instrument_app(app):
+    if _tracer is None:
+        return
+
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
+    FastAPIInstrumentor.instrument_app(app)
+
+
+def _attempt_attributes(system, model):
+    return {"gen_ai.system": system, "gen_ai.request.model": model}
+
+
+@contextmanager
+def llm_attempt(system, model):
+    """A span around one model attempt. Yields the span (None when tracing is
+    off) for `attempt_failed()`."""
+    if _tracer is None:
+        yield None
+        return
+
+    from opentelemetry.trace import SpanKind
+
+    with _tracer.start_as_current_span(
+        f"llm {model}",
+        kind=SpanKind.CLIENT,
+        attributes=_attempt_attributes(system, model),
+    ) as span:
+        yield span
+
+
+def attempt_failed(span, reason):
+    """Marks an attempt that failed without raising (bad status, bad JSON)."""
+    if span is None:
+        return
+
+    from opentelemetry.trace import Status, StatusCode
+
+    span.set_status(Status(StatusCode.ERROR, reason))
+
+
+class LLMAttemptTracer(BaseCallbackHandler):
+    """Opens a span when a model run starts and ends it with the run."""
+
+    # Called in the caller's context, so spans nest under the request.
+    run_inline = True
+
+    def __init__(self, system):
+        self.system = system
+        self.spans = {}
+
+    def _start(self, run_id, metadata, invocation_params):
+        from opentelemetry.trace import SpanKind
+
+        invocation_params = invocation_params or {}
+        model = (
+            (metadata or {}).get("ls_model_name")
+            or invocation_params.get("model")
+            or invocation_params.get("model_name")
+            or "unknown"
+        )
+        self.spans[run_id] = _tracer.start_span(
+            f"llm {model}",
+            kind=SpanKind.CLIENT,
+            attributes=_attempt_attributes(self.system, model),
+        )
+
+    def on_chat_model_start(
+        self, serialized, messages, *, run_id, metadata=None, **kwargs
+    ):
+        self._start(run_id, metadata, kwargs.get("invocation_params"))
+
+    def on_llm_start(self, serialized, prompts, *, run_id, metadata=None, **kwargs):
+        self._start(run_id, metadata, kwargs.get("invocation_params"))
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        span = self.spans.pop(run_id, None)
+        if span is not None:
+            span.end()
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        from opentelemetry.trace import Status, StatusCode
+
+        span = self.spans.pop(run_id, None)
+        if span is not None:
+            span.record_exception(error)
+            span.set_status(Status(StatusCode.ERROR, str(error)))
+            span.end()
+
+
+def llm_callbacks(system):
+    """Callbacks for a LangChain chat model, giving each of its runs a span."""
+    if _tracer is None:
+        return []
+    return [LLMAttemptTracer(system)]
+
+
+configure()
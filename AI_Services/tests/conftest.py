@@ -0,0 +1,5 @@
+import os
+
+# config.settings refuses to load without a SECRET_KEY; importing anything from
+# services/ pulls it in.
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
@@ -0,0 +1,111 @@
+import threading
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from services.embedding_cache import CachedEmbeddings, SQLiteEmbeddingStore
+
+
+class CountingEmbeddings(Embeddings):
+    """Deterministic embeddings that record every call made to the model."""
+
+    def __init__(self):
+        self.document_batches = []
+        self.queries = []
+        self._lock = threading.Lock()
+
+    def _vector(self, text):
+        return [float(len(text)), float(sum(map(ord, text)) % 97), 0.5]
+
+    def embed_documents(self, texts):
+        with self._lock:
+            self.document_batches.append(list(texts))
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        self.queries.append(text)
+        return self._vector(text)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SQLiteEmbeddingStore(str(tmp_path / "cache" / "embeddings.sqlite3"))
+
+
+@pytest.fixture
+def model():
+    return CountingEmbeddings()
+
+
+def test_store_round_trips_float32_vectors(store):
+    store.set_many({"a": [0.25, -1.5], "b": [3.0]})
+
+    assert store.get_many(["a", "b", "missing"]) == {"a": [0.25, -1.5], "b": [3.0]}
+
+
+def test_store_reads_past_the_bound_variable_chunk(store):
+    store.set_many({str(n): [float(n)] for n in range(1200)})
+
+    assert len(store.get_many([str(n) for n in range(1200)])) == 1200
+
+
+def test_documents_miss_then_hit(store, model):
+    embeddings = CachedEmbeddings(model, store, namespace="test")
+    texts = ["oats", "eggs"]
+
+    first = embeddings.embed_documents(texts)
+    second = embeddings.embed_documents(texts)
+
+    assert first == second == [model._vector(text) for text in texts]
+    assert model.document_batches == [["oats", "eggs"]]
+
+
+def test_only_missing_documents_are_embedded_once(store, model):
+    embeddings = CachedEmbeddings(model, store, namespace="test")
+    embeddings.embed_documents(["oats"])
+
+    vectors = embeddings.embed_documents(["oats", "tofu", "tofu", "rice"])
+
+    assert model.document_batches == [["oats"], ["tofu", "rice"]]
+    assert vectors[1] == vectors[2] == model._vector("tofu")
+
+
+def test_documents_are_embedded_in_batches(store, model):
+    embeddings = CachedEmbeddings(
+        model, store, namespace="test", batch_size=2, max_concurrency=3
+    )
+    texts = [f"doc {n}" for n in range(5)]
+
+    vectors = embeddings.embed_documents(texts)
+
+    assert sorted(len(batch) for batch in model.document_batches) == [1, 2, 2]
+    assert vectors == [model._vector(text) for text in texts]
+
+
+def test_cache_survives_a_new_store_on_the_same_file(tmp_path, model):
+    path = str(tmp_path / "embeddings.sqlite3")
+    CachedEmbeddings(model, SQLiteEmbeddingStore(path), "test").embed_documents(["a"])
+
+    reopened = CachedEmbeddings(model, SQLiteEmbeddingStore(path), "test")
+    reopened.embed_documents(["a"])
+
+    assert model.document_batches == [["a"]]
+
+
+def test_queries_are_cached_apart_from_documents(store, model):
+    embeddings = CachedEmbeddings(model, store, namespace="test")
+    embeddings.embed_documents(["how do i reset my password"])
+
+    embeddings.embed_query("How do I  reset my password")
+    embeddings.embed_query("how do i reset my password")
+
+    # Case and spacing are folded for queries, but a document vector is never
+    # reused for a query.
+    assert model.queries == ["How do I  reset my password"]
+
+
+def test_namespaces_do_not_share_vectors(store, model):
+    CachedEmbeddings(model, store, namespace="model-a").embed_documents(["oats"])
+    CachedEmbeddings(model, store, namespace="model-b").embed_documents(["oats"])
+
+    assert model.document_batches == [["oats"], ["oats"]]
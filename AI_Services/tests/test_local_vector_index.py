@@ -0,0 +1,108 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from services.local_vector_index import (
+    DOCUMENTS_FILE,
+    LocalVectorIndex,
+    export_snapshot,
+    snapshot_version,
+)
+
+
+class FakeCollection:
+    """Pages through fixed rows like langchain Chroma.get(include=[...])."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def get(self, include, limit, offset):
+        page = self.rows[offset : offset + limit]
+        return {
+            "ids": [row[0] for row in page],
+            "documents": [row[1] for row in page],
+            "metadatas": [row[2] for row in page],
+            "embeddings": [row[3] for row in page],
+        }
+
+
+class FixedQuery:
+    def __init__(self, vector):
+        self.vector = vector
+
+    def embed_query(self, text):
+        return self.vector
+
+
+ROWS = [
+    ("a", "oats", {"meal": "breakfast"}, [1.0, 0.0, 0.0]),
+    ("b", "salad", {"meal": "lunch"}, [0.0, 2.0, 0.0]),
+    ("c", "soup", {"meal": "dinner"}, [3.0, 3.0, 0.0]),
+    ("d", "tea", {}, [0.0, 0.0, 5.0]),
+]
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path):
+    directory = str(tmp_path / "snapshot")
+    assert export_snapshot(FakeCollection(ROWS), directory, page_size=3) == 4
+    return directory
+
+
+def test_export_writes_normalized_vectors_and_documents(snapshot_dir):
+    index = LocalVectorIndex(snapshot_dir, FixedQuery([1.0, 0.0, 0.0]))
+
+    assert len(index) == 4
+    assert np.allclose(np.linalg.norm(index.vectors, axis=1), 1.0)
+    assert [d["id"] for d in index.documents] == ["a", "b", "c", "d"]
+    assert index.documents[0]["metadata"] == {"meal": "breakfast"}
+
+
+def test_top_k_is_ordered_by_cosine_similarity(snapshot_dir):
+    index = LocalVectorIndex(snapshot_dir, FixedQuery([2.0, 1.0, 0.0]))
+
+    docs = index.similarity_search("anything", k=3)
+
+    assert [d.page_content for d in docs] == ["soup", "oats", "salad"]
+    assert docs[0].metadata == {"meal": "dinner"}
+
+
+def test_k_larger_than_the_index(snapshot_dir):
+    index = LocalVectorIndex(snapshot_dir, FixedQuery([0.0, 0.0, 1.0]))
+
+    docs = index.similarity_search("anything", k=10)
+
+    assert len(docs) == 4
+    assert docs[0].page_content == "tea"
+
+
+def test_reexport_replaces_the_snapshot(snapshot_dir):
+    export_snapshot(FakeCollection(ROWS[:1]), snapshot_dir)
+
+    index = LocalVectorIndex(snapshot_dir, FixedQuery([1.0, 0.0, 0.0]))
+
+    assert len(index) == 1
+    assert not os.path.exists(f"{snapshot_dir}.tmp")
+    assert not os.path.exists(f"{snapshot_dir}.old")
+
+
+def test_empty_collection(tmp_path):
+    directory = str(tmp_path / "snapshot")
+
+    assert export_snapshot(FakeCollection([]), directory) == 0
+    assert LocalVectorIndex(directory, FixedQuery([1.0])).similarity_search("x") == []
+
+
+def test_snapshot_version(tmp_path, snapshot_dir):
+    assert snapshot_version(str(tmp_path / "missing")) is None
+    assert snapshot_version(snapshot_dir) is not None
+
+
+def test_size_mismatch_is_rejected(snapshot_dir):
+    with open(os.path.join(snapshot_dir, DOCUMENTS_FILE), "a") as f:
+        f.write(json.dumps({"id": "e", "page_content": "x", "metadata": {}}) + "\n")
+
+    with pytest.raises(ValueError, match="size mismatch"):
+        LocalVectorIndex(snapshot_dir, FixedQuery([1.0, 0.0, 0.0]))
@@ -0,0 +1,94 @@
+from datetime import date
+
+import pytest
+
+from services.nutrition_queries import match_nutrition_query
+
+TODAY = date(2026, 10, 21)  # a Wednesday
+USER_ID = 7
+
+MATCHED = [
+    ("how many calories did I eat", "day_totals", "2026-10-21", "2026-10-21"),
+    ("how many calories did I eat today", "day_totals", "2026-10-21", "2026-10-21"),
+    (
+        "how much protein did I have yesterday",
+        "day_totals",
+        "2026-10-20",
+        "2026-10-20",
+    ),
+    ("calories I logged on 2026-10-02", "day_totals", "2026-10-02", "2026-10-02"),
+    (
+        "how many calories did I eat in the last 3 days",
+        "range_totals",
+        "2026-10-19",
+        "2026-10-21",
+    ),
+    ("my carb intake this week", "range_totals", "2026-10-19", "2026-10-21"),
+    ("calories I ate last week", "range_totals", "2026-10-12", "2026-10-18"),
+    ("calories I had over the past week", "range_totals", "2026-10-15", "2026-10-21"),
+    ("my fat intake this month", "range_totals", "2026-10-01", "2026-10-21"),
+    (
+        "how many calories did I eat last month",
+        "range_totals",
+        "2026-09-01",
+        "2026-09-30",
+    ),
+    ("how many calories did I have at lunch", "meal_totals", "2026-10-21", None),
+    ("what did I eat yesterday", "log_items", "2026-10-20", "2026-10-20"),
+    ("what did I have for breakfast", "meal_items", "2026-10-21", "2026-10-21"),
+    ("which foods do I eat most often this month", "top_foods", "2026-10-01", None),
+]
+
+UNMATCHED = [
+    # Periods the fast path can't resolve.
+    "how many calories did I eat in september",
+    "calories I ate the week before last",
+    "how much protein did I have in week 3",
+    "how many calories did I eat on monday",
+    "calories I ate in the last 2 weeks",
+    "calories I had over the last few days",
+    "calories I ate 3 days ago",
+    "calories I ate in 2025",
+    "calories I ate on 2026-10-01 and 2026-10-02",
+    # Statistics other than a sum or a frequency ranking.
+    "my highest calorie day this month",
+    "my average protein intake this week",
+    "calories I ate per day this week",
+    "what is the most protein food I ate",
+    "which food did I eat least",
+    # Not about what was eaten.
+    "how many calories do I need",
+    "how many calories have I got left",
+    "what can I eat for lunch",
+    "how much protein should I have today",
+    "how many calories am I allowed today",
+    "my calories today",
+    "how many calories did I burn today",
+    "how many calories are in an apple",
+    "what did I eat for breakfast and lunch",
+]
+
+
+@pytest.mark.parametrize("question, name, start, end", MATCHED)
+def test_matches_supported_questions(question, name, start, end):
+    query = match_nutrition_query(question, USER_ID, today=TODAY)
+
+    assert query is not None
+    assert query.name == name
+    assert query.params["user_id"] == USER_ID
+    assert query.params["start_date"] == start
+    if end is not None:
+        assert query.params["end_date"] == end
+
+
+@pytest.mark.parametrize("question", UNMATCHED)
+def test_leaves_other_questions_to_the_llm(question):
+    assert match_nutrition_query(question, USER_ID, today=TODAY) is None
+
+
+def test_meal_totals_filter_by_meal():
+    query = match_nutrition_query(
+        "how many calories did I eat at dinner", USER_ID, today=TODAY
+    )
+
+    assert query.params["meal_type"] == "DINNER"
@@ -0,0 +1,129 @@
+import json
+
+import pytest
+from langchain_core.documents import Document
+
+import seed_chroma
+from seed_chroma import document_id, iter_jsonl_documents, seed_database
+
+
+class FakeVectorStore:
+    """In-memory stand-in for the langchain Chroma store seed_database talks to."""
+
+    def __init__(self):
+        self.docs = {}
+        self.added = []
+        self.deleted = []
+
+    def get(self, ids=None, include=None, limit=None, offset=0):
+        if ids is not None:
+            return {"ids": [doc_id for doc_id in ids if doc_id in self.docs]}
+        page = list(self.docs)[offset:]
+        return {"ids": page[:limit] if limit else page}
+
+    def add_documents(self, documents, ids):
+        self.added.extend(ids)
+        self.docs.update(zip(ids, documents))
+
+    def delete(self, ids):
+        self.deleted.extend(ids)
+        for doc_id in ids:
+            del self.docs[doc_id]
+
+
+def doc(text, **metadata):
+    return Document(page_content=text, metadata=metadata)
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = FakeVectorStore()
+    monkeypatch.setattr(seed_chroma, "build_embeddings", lambda api_key: None)
+    monkeypatch.setattr(seed_chroma.chromadb, "HttpClient", lambda **kwargs: None)
+    monkeypatch.setattr(seed_chroma, "Chroma", lambda **kwargs: store)
+    return store
+
+
+@pytest.fixture
+def builtin(monkeypatch):
+    docs = [doc("sync health data", topic="integrations"), doc("reset password")]
+    monkeypatch.setattr(seed_chroma, "builtin_documents", lambda: list(docs))
+    return docs
+
+
+def test_document_id_is_a_content_hash():
+    assert document_id(doc("oats", a=1, b=2)) == document_id(doc("oats", b=2, a=1))
+    assert document_id(doc("oats")) != document_id(doc("oats "))
+    assert document_id(doc("oats", a=1)) != document_id(doc("oats", a=2))
+
+
+def test_iter_jsonl_documents_reads_both_shapes(tmp_path):
+    path = tmp_path / "docs.jsonl"
+    rows = [
+        {"page_content": "faq", "metadata": {"topic": "x"}},
+        {"title": "Soup", "content": "Boil.", "calories": 100, "type": "lunch"},
+        {"unexpected": True},
+    ]
+    path.write_text("\n".join(json.dumps(row) for row in rows) + "\n\n")
+
+    docs = list(iter_jsonl_documents(str(path)))
+
+    assert [d.page_content for d in docs] == [
+        "faq",
+        "Recipe: Soup. Instructions: Boil.",
+    ]
+    assert docs[1].metadata == {
+        "category": "recipe",
+        "meal_type": "lunch",
+        "calories": 100,
+    }
+
+
+def test_first_run_adds_everything(store, builtin):
+    seed_database(chunk_size=1, snapshot=False)
+
+    assert sorted(store.added) == sorted(document_id(d) for d in builtin)
+    assert store.deleted == []
+
+
+def test_rerun_embeds_nothing_new(store, builtin):
+    seed_database(snapshot=False)
+    store.added.clear()
+
+    seed_database(snapshot=False)
+
+    assert store.added == []
+    assert store.deleted == []
+
+
+def test_changed_document_is_added_and_old_version_pruned(store, builtin, monkeypatch):
+    seed_database(snapshot=False)
+    store.added.clear()
+    old_id = document_id(builtin[1])
+    changed = [builtin[0], doc("reset password from the login screen")]
+    monkeypatch.setattr(seed_chroma, "builtin_documents", lambda: changed)
+
+    seed_database(chunk_size=1, snapshot=False)
+
+    assert store.added == [document_id(changed[1])]
+    assert store.deleted == [old_id]
+    assert set(store.docs) == {document_id(d) for d in changed}
+
+
+def test_no_prune_keeps_stale_documents(store, builtin, monkeypatch):
+    seed_database(snapshot=False)
+    monkeypatch.setattr(seed_chroma, "builtin_documents", lambda: builtin[:1])
+
+    seed_database(prune=False, snapshot=False)
+
+    assert store.deleted == []
+    assert len(store.docs) == 2
+
+
+def test_duplicates_across_sources_are_added_once(store, builtin, tmp_path):
+    path = tmp_path / "extra.jsonl"
+    path.write_text(json.dumps({"page_content": "reset password", "metadata": {}}))
+
+    seed_database([str(path)], snapshot=False)
+
+    assert len(store.added) == 2
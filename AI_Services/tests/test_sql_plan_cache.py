@@ -0,0 +1,135 @@
+from services.sql_plan_cache import SQLPlanCache, normalize_question, parameterize_sql
+
+TODAY = "2026-03-10"
+
+
+def test_normalize_question_abstracts_dates_and_ids():
+    template, dates = normalize_question(
+        "Calories on 2026-03-01 and 2026-03-02 for  Patient #12?"
+    )
+
+    assert template == "calories on <date> and <date> for patient <id>"
+    assert dates == ["2026-03-01", "2026-03-02"]
+
+
+def test_normalize_question_same_template_for_other_values():
+    first, _ = normalize_question("protein on 2026-01-05 for user 3")
+    second, _ = normalize_question("Protein on 2026-02-17 for user 44.")
+
+    assert first == second
+
+
+def test_parameterize_sql_binds_user_and_dates():
+    sql = (
+        "SELECT SUM(calories) FROM tracking_dailylog "
+        "WHERE user_id = 7 AND date BETWEEN '2026-03-01' AND '2026-03-10';"
+    )
+
+    assert parameterize_sql(sql, 7, TODAY, ["2026-03-01"]) == (
+        "SELECT SUM(calories) FROM tracking_dailylog "
+        "WHERE user_id = :user_id AND date BETWEEN :date_0 AND :current_date"
+    )
+
+
+def test_parameterize_sql_accepts_quoted_user_id_and_cte():
+    sql = (
+        "WITH t AS (SELECT * FROM tracking_dailylog WHERE user_id = '7') "
+        "SELECT COUNT(*) FROM t"
+    )
+
+    statement = parameterize_sql(sql, 7, TODAY, [])
+
+    assert statement.startswith("WITH t AS")
+    assert "user_id = :user_id" in statement
+
+
+def test_parameterize_sql_rejects_unsafe_statements():
+    rejected = [
+        "DELETE FROM tracking_dailylog WHERE user_id = 7",
+        "SELECT 1; DROP TABLE tracking_dailylog",
+        "EXPLAIN SELECT 1",
+        # A date that is neither in the question nor today can't be rebound.
+        "SELECT * FROM tracking_dailylog WHERE user_id = 7 AND date = '2025-01-01'",
+        # The user id left outside "user_id = N".
+        "SELECT * FROM tracking_dailylog t WHERE t.user_id IN (7)",
+        "SELECT * FROM tracking_dailylog",
+    ]
+
+    for sql in rejected:
+        assert parameterize_sql(sql, 7, TODAY, []) is None, sql
+
+
+def test_parameterize_sql_rejects_a_question_id_left_in_the_sql():
+    sql = "SELECT name FROM foods_fooditem WHERE id = 12"
+
+    assert parameterize_sql(sql, 7, TODAY, [], ids=["12"]) is None
+    assert parameterize_sql(sql, 7, TODAY, []) == sql
+
+
+def test_parameterize_sql_leaves_general_queries_alone():
+    sql = "SELECT name, met_value FROM exercises_exercise WHERE name ILIKE '%run%'"
+
+    assert parameterize_sql(sql, 7, TODAY, []) == sql
+
+
+def test_store_then_lookup_rebinds_for_another_user_and_day():
+    cache = SQLPlanCache()
+    sql = (
+        "SELECT SUM(calories) FROM tracking_dailylog "
+        "WHERE user_id = 7 AND date = '2026-03-01'"
+    )
+
+    stored = cache.store("groq", "calories on 2026-03-01", sql, 7, TODAY)
+    hit = cache.lookup("groq", "Calories on 2026-02-14?", 9, "2026-03-11")
+
+    assert hit == (
+        stored,
+        {"user_id": 9, "current_date": "2026-03-11", "date_0": "2026-02-14"},
+    )
+
+
+def test_store_refuses_sql_with_the_question_id_baked_in():
+    cache = SQLPlanCache()
+    sql = "SELECT name FROM foods_fooditem WHERE id = 12"
+
+    assert cache.store("groq", "name of id 12", sql, 7, TODAY) is None
+    assert cache.lookup("groq", "name of id 13", 7, TODAY) is None
+
+
+def test_namespaces_are_separate():
+    cache = SQLPlanCache()
+    cache.store("groq", "my food names", "SELECT name FROM foods_fooditem", 7, TODAY)
+
+    assert cache.lookup("gemini", "my food names", 7, TODAY) is None
+    assert cache.lookup("groq", "my food names", 7, TODAY) is not None
+
+
+def test_lru_eviction_keeps_recently_used_plans():
+    cache = SQLPlanCache(maxsize=2)
+    for name in ("a", "b"):
+        cache.store("groq", name, f"SELECT '{name}'", 7, TODAY)
+
+    cache.lookup("groq", "a", 7, TODAY)  # "b" is now least recently used
+    cache.store("groq", "c", "SELECT 'c'", 7, TODAY)
+
+    assert cache.lookup("groq", "b", 7, TODAY) is None
+    assert cache.lookup("groq", "a", 7, TODAY) is not None
+    assert cache.lookup("groq", "c", 7, TODAY) is not None
+    assert cache.stats()["size"] == 2
+
+
+def test_invalidate_and_stats():
+    cache = SQLPlanCache(maxsize=4)
+    cache.store("groq", "q", "SELECT 1", 7, TODAY)
+
+    cache.lookup("groq", "q", 7, TODAY)
+    cache.invalidate("groq", "q")
+    cache.lookup("groq", "q", 7, TODAY)
+
+    assert cache.stats() == {
+        "size": 0,
+        "maxsize": 4,
+        "hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+    }
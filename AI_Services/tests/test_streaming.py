@@ -0,0 +1,198 @@
+import asyncio
+import json
+
+import pytest
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from services.streaming import detached, sse_event, stream_agent_events
+
+
+class FakeExecutor:
+    """Replays a fixed list of astream_events(version="v2") events."""
+
+    def __init__(self, events):
+        self.events = events
+
+    async def astream_events(self, inputs, version):
+        assert version == "v2"
+        for event in self.events:
+            yield event
+
+
+def model_start(run):
+    return {"event": "on_chat_model_start", "run_id": run, "data": {}}
+
+
+def model_token(run, content):
+    return {
+        "event": "on_chat_model_stream",
+        "run_id": run,
+        "data": {"chunk": AIMessageChunk(content=content)},
+    }
+
+
+def model_end(run, content="", tool_call=None):
+    tool_calls = [{"name": tool_call, "args": {}, "id": "call-1"}] if tool_call else []
+    return {
+        "event": "on_chat_model_end",
+        "run_id": run,
+        "data": {"output": AIMessage(content=content, tool_calls=tool_calls)},
+    }
+
+
+def tool(kind, name="query_database"):
+    return {"event": f"on_tool_{kind}", "name": name, "data": {}}
+
+
+def agent_end(output):
+    return {
+        "event": "on_chain_end",
+        "name": "AgentExecutor",
+        "data": {"output": {"output": output}},
+    }
+
+
+def collect(events):
+    async def run():
+        return [
+            event
+            async for event in stream_agent_events(FakeExecutor(events), {"input": ""})
+        ]
+
+    return asyncio.run(run())
+
+
+def test_answer_tokens_then_done():
+    events = collect(
+        [
+            model_start("turn-1"),
+            model_token("turn-1", "You ate "),
+            model_token("turn-1", "500 kcal."),
+            model_end("turn-1", "You ate 500 kcal."),
+            agent_end("You ate 500 kcal."),
+        ]
+    )
+
+    assert events == [
+        {"type": "token", "content": "You ate "},
+        {"type": "token", "content": "500 kcal."},
+        {"type": "done", "response": "You ate 500 kcal."},
+    ]
+
+
+def test_reasoning_before_a_tool_call_is_not_sent():
+    events = collect(
+        [
+            model_start("turn-1"),
+            model_token("turn-1", "Let me check your logs."),
+            model_end("turn-1", "Let me check your logs.", tool_call="query_database"),
+            tool("start"),
+            # SQL generation inside the tool is never forwarded.
+            model_start("sql"),
+            model_token("sql", "SELECT 1"),
+            model_end("sql", "SELECT 1"),
+            tool("end"),
+            model_start("turn-2"),
+            model_token("turn-2", "500 kcal."),
+            model_end("turn-2", "500 kcal."),
+            agent_end("500 kcal."),
+        ]
+    )
+
+    assert events == [
+        {"type": "step", "tool": "query_database", "status": "start"},
+        {"type": "step", "tool": "query_database", "status": "end"},
+        {"type": "token", "content": "500 kcal."},
+        {"type": "done", "response": "500 kcal."},
+    ]
+
+
+def test_failed_fallback_model_output_is_dropped():
+    events = collect(
+        [
+            model_start("primary"),
+            model_token("primary", "Half an ans"),
+            # The primary model errors: no on_chat_model_end for its run.
+            model_start("fallback"),
+            model_token("fallback", "Full answer."),
+            model_end("fallback", "Full answer."),
+        ]
+    )
+
+    assert events == [
+        {"type": "token", "content": "Full answer."},
+        {"type": "done", "response": "Full answer."},
+    ]
+
+
+def test_list_content_chunks_are_joined():
+    events = collect(
+        [
+            model_start("turn-1"),
+            model_token("turn-1", [{"type": "text", "text": "Hi"}, "!"]),
+            model_end("turn-1", "Hi!"),
+        ]
+    )
+
+    assert events[0] == {"type": "token", "content": "Hi!"}
+    assert events[-1] == {"type": "done", "response": "Hi!"}
+
+
+def test_sse_event_frame():
+    frame = sse_event({"type": "token", "content": "a\nb"})
+
+    assert frame.startswith("event: token\ndata: ")
+    assert frame.endswith("\n\n")
+    assert json.loads(frame.split("data: ", 1)[1]) == {
+        "type": "token",
+        "content": "a\nb",
+    }
+
+
+def test_detached_passes_events_through():
+    async def source():
+        for n in range(3):
+            yield n
+
+    async def run():
+        return [event async for event in detached(source())]
+
+    assert asyncio.run(run()) == [0, 1, 2]
+
+
+def test_detached_reraises_errors():
+    async def source():
+        yield "first"
+        raise RuntimeError("agent crashed")
+
+    async def run():
+        seen = []
+        with pytest.raises(RuntimeError, match="agent crashed"):
+            async for event in detached(source()):
+                seen.append(event)
+        return seen
+
+    assert asyncio.run(run()) == ["first"]
+
+
+def test_detached_run_finishes_after_the_client_disconnects():
+    saved = []
+
+    async def source():
+        yield {"type": "token", "content": "Hel"}
+        await asyncio.sleep(0.01)
+        yield {"type": "done", "response": "Hello"}
+        saved.append("Hello")
+
+    async def run():
+        stream = detached(source())
+        assert (await anext(stream))["type"] == "token"
+        await stream.aclose()  # what StreamingResponse does on disconnect
+        for _ in range(50):
+            if saved:
+                break
+            await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+
+    assert saved == ["Hello"]
@@ -0,0 +1,43 @@
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from .status import ACTIVE, get_account_status
+
+# Set on the Django request by AccountStatusMiddleware once the Bearer token has
+# been decoded and verified.
+VALIDATED_TOKEN_ATTR = "_validated_jwt"
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that reuses the token AccountStatusMiddleware already
+    validated, so each request verifies the signature once. The user row is
+    still loaded here, lazily, the first time a view touches request.user."""
+
+    def authenticate(self, request):
+        validated_token = getattr(request, VALIDATED_TOKEN_ATTR, None)
+        if validated_token is None:
+            return super().authenticate(request)
+        return self.get_user(validated_token), validated_token
+
+
+class StatelessJWTAuthentication(CachedJWTAuthentication):
+    """Opt-in authentication that never loads CustomUser.
+
+    request.user is a TokenUser built from the token's claims (`id`, plus
+    `role` for tokens issued by RoleRefreshToken), and blocked or deleted
+    accounts are rejected through the cached account status. Meant for
+    read-only views that only need to know who is asking; anything that
+    writes rows pointing at the user must keep the default class.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        if get_account_status(user_id) != ACTIVE:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        return TokenUser(validated_token)
@@ -1,20 +1,33 @@
 import json
+from functools import lru_cache
 
 import boto3
+from botocore.config import Config
 from django.conf import settings
 
 
+def build_sqs_client(max_pool_connections=10):
+    return boto3.client(
+        "sqs",
+        region_name=settings.AWS_REGION,
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        endpoint_url=settings.AWS_SQS_ENDPOINT_URL,
+        config=Config(max_pool_connections=max_pool_connections),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_sqs_client():
+    """Process-wide SQS client. boto3 clients are thread-safe, and reusing one
+    keeps its HTTPS connection pool instead of a new handshake per message."""
+    return build_sqs_client()
+
+
 def send_to_email_queue(subject, body, recipient_email):
     try:
         print(f"--- ATTEMPTING TO SEND EMAIL TO {recipient_email} VIA SQS ---")
 
-        sqs = boto3.client(
-            "sqs",
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        )
-
         payload = {
             "subject": subject,
             "body": body,
@@ -22,7 +35,7 @@ def send_to_email_queue(subject, body, recipient_email):
             "source": "mycalo-auth-service",
         }
 
-        response = sqs.send_message(
+        response = get_sqs_client().send_message(
             QueueUrl=settings.AWS_EMAIL_QUEUE_URL, MessageBody=json.dumps(payload)
         )
 
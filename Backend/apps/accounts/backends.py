@@ -1,17 +1,44 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import ModelBackend
-from django.db.models import Q
 
 User = get_user_model()
 
 
 class EmailUsernameBackend(ModelBackend):
-    def authenticate(self, request, username=None, password=None, *kwargs):
-        try:
-            user = User.objects.get(Q(username=username) | Q(email=username))
-        except User.DoesNotExist:
+    """Logs in with either a username or an email address.
+
+    Identifiers containing "@" are matched case-insensitively against email,
+    which the UPPER(email) index serves; anything else is an exact match on the
+    unique username index. Each is a single index lookup, unlike an OR across
+    both columns. The profile is joined in because the token serializer reads
+    it straight after authentication.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None or password is None:
+            return None
+
+        user = self._find_user(username.strip())
+        if user is None:
             return None
 
         if user.check_password(password) and self.user_can_authenticate(user):
             return user
         return None
+
+    def _find_user(self, identifier):
+        users = User.objects.select_related("profile")
+
+        if "@" in identifier:
+            matches = list(users.filter(email__iexact=identifier)[:2])
+            if len(matches) == 1:
+                return matches[0]
+            # Legacy accounts may differ only in email case; require exact.
+            for user in matches:
+                if user.email == identifier:
+                    return user
+            if matches:
+                return None
+
+        # Usernames may contain "@" too.
+        return users.filter(username=identifier).first()
@@ -0,0 +1,77 @@
+"""
+Password hashers with a configurable cost and a per-process concurrency cap.
+
+PASSWORD_HASHERS (settings.py) lists the preferred hasher first. Django's
+check_password re-hashes a password on successful login whenever it was stored
+with another algorithm or with different cost parameters, so switching hasher
+or retuning PASSWORD_ARGON2_* upgrades each account on its next login.
+
+Hashing is CPU-bound and argon2-cffi releases the GIL, so a burst of logins can
+occupy every core a worker has. Each encode/verify therefore waits for one of
+PASSWORD_HASHING_CONCURRENCY slots, leaving the remaining threads free to serve
+ordinary API requests.
+"""
+
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+_local = threading.local()
+
+
+@lru_cache
+def _semaphore(size):
+    return threading.BoundedSemaphore(size)
+
+
+@contextmanager
+def hashing_slot():
+    # Re-entrant per thread: PBKDF2's verify() calls encode().
+    if getattr(_local, "holding", False):
+        yield
+        return
+    with _semaphore(settings.PASSWORD_HASHING_CONCURRENCY):
+        _local.holding = True
+        try:
+            yield
+        finally:
+            _local.holding = False
+
+
+class BoundedHashingMixin:
+    def encode(self, password, salt, *args, **kwargs):
+        with hashing_slot():
+            return super().encode(password, salt, *args, **kwargs)
+
+    def verify(self, password, encoded):
+        with hashing_slot():
+            return super().verify(password, encoded)
+
+
+class Argon2PasswordHasher(BoundedHashingMixin, hashers.Argon2PasswordHasher):
+    """Argon2id with its cost taken from PASSWORD_ARGON2_* settings.
+
+    The defaults (2 passes, 19 MiB, 1 lane) follow the OWASP minimum and cost a
+    few milliseconds of a single core, against Django's 100 MiB over 8 lanes.
+    """
+
+    @property
+    def time_cost(self):
+        return settings.PASSWORD_ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        return settings.PASSWORD_ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_ARGON2_PARALLELISM
+
+
+class PBKDF2PasswordHasher(BoundedHashingMixin, hashers.PBKDF2PasswordHasher):
+    """Django's PBKDF2-SHA256, bounded like the preferred hasher. Kept so that
+    existing hashes still verify (and are upgraded) and as a fallback where
+    argon2-cffi cannot be installed."""
@@ -0,0 +1,90 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.request import Request
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from apps.accounts.authentication import (
+    CachedJWTAuthentication,
+    StatelessJWTAuthentication,
+)
+from apps.accounts.middleware import AccountStatusMiddleware
+from apps.accounts.tokens import RoleRefreshToken
+
+
+def legacy_stack(request):
+    """What every Bearer request did before the status cache: the middleware
+    authenticated the token (loading the user), then DRF did it again."""
+    JWTAuthentication().authenticate(request)
+    user, _ = JWTAuthentication().authenticate(Request(request))
+    return user.role
+
+
+def current_stack(authentication_class):
+    def view(request):
+        user, _ = authentication_class().authenticate(Request(request))
+        # Touch a field so lazy users are resolved like a real view would.
+        user.role
+        return HttpResponse()
+
+    return AccountStatusMiddleware(view)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare per-request authentication cost (time and queries) of the old "
+        "middleware + JWTAuthentication pipeline, CachedJWTAuthentication and "
+        "StatelessJWTAuthentication, against the configured database and cache."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument(
+            "--user-id",
+            type=int,
+            default=None,
+            help="Account to authenticate as (defaults to the first active user)",
+        )
+
+    def handle(self, *args, **options):
+        users = get_user_model().objects.filter(is_active=True)
+        if options["user_id"]:
+            users = users.filter(pk=options["user_id"])
+        user = users.order_by("pk").first()
+        if user is None:
+            raise CommandError("No active user to authenticate as.")
+
+        token = str(RoleRefreshToken.for_user(user).access_token)
+        request = RequestFactory().get(
+            "/api/search/", HTTP_AUTHORIZATION=f"Bearer {token}"
+        )
+
+        pipelines = {
+            "legacy (middleware + JWTAuthentication)": legacy_stack,
+            "CachedJWTAuthentication": current_stack(CachedJWTAuthentication),
+            "StatelessJWTAuthentication": current_stack(StatelessJWTAuthentication),
+        }
+
+        total = options["requests"]
+        self.stdout.write(f"{total} authenticated requests as user {user.pk}:")
+        for name, pipeline in pipelines.items():
+            pipeline(request)  # warm caches and connections
+
+            with CaptureQueriesContext(connection) as queries:
+                pipeline(request)
+            query_count = len(queries.captured_queries)
+
+            started = time.perf_counter()
+            for _ in range(total):
+                pipeline(request)
+            elapsed = time.perf_counter() - started
+
+            self.stdout.write(
+                f"  {name:<42} {elapsed / total * 1e6:8.1f} us/request, "
+                f"{query_count} queries/request"
+            )
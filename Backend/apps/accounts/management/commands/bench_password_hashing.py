@@ -0,0 +1,57 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hashers
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure password verification cost for each configured hasher: "
+        "milliseconds per login, logins per second per core, and throughput "
+        "with concurrent logins going through the hashing slots."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Concurrent logins for the throughput run",
+        )
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        threads = options["threads"]
+        cores = os.cpu_count() or 1
+        slots = settings.PASSWORD_HASHING_CONCURRENCY
+        password = "correct horse battery staple"
+
+        self.stdout.write(
+            f"{cores} cores, {slots} hashing slots, {threads} concurrent logins"
+        )
+        self.stdout.write(
+            f"{'hasher':<16}{'ms/login':>10}{'logins/s/core':>15}{'logins/s':>10}"
+        )
+
+        for hasher in get_hashers():
+            encoded = hasher.encode(password, hasher.salt())
+
+            start = time.perf_counter()
+            for _ in range(iterations):
+                hasher.verify(password, encoded)
+            per_login = (time.perf_counter() - start) / iterations
+
+            total = iterations * threads
+            start = time.perf_counter()
+            with ThreadPoolExecutor(threads) as pool:
+                list(pool.map(lambda _: hasher.verify(password, encoded), range(total)))
+            throughput = total / (time.perf_counter() - start)
+
+            self.stdout.write(
+                f"{hasher.algorithm:<16}{per_login * 1000:>10.1f}"
+                f"{1 / per_login:>15.1f}{throughput:>10.1f}"
+            )
@@ -0,0 +1,57 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+
+from apps.profiles.models import Profile
+
+
+class Command(BaseCommand):
+    help = (
+        "Create active accounts loadtest-<n>@example.com (username loadtest-<n>) "
+        "with profiles, sharing one password, for the login storm scenario in "
+        "loadtests/. Existing ones are left alone."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=1000)
+        parser.add_argument("--password", default="loadtest-password")
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        # Hash once: every account shares the password, and hashing thousands
+        # of times would take longer than the load test itself.
+        password = make_password(options["password"])
+
+        usernames = [f"loadtest-{n}" for n in range(options["count"])]
+        existing = set(
+            User.objects.filter(username__in=usernames).values_list(
+                "username", flat=True
+            )
+        )
+        users = User.objects.bulk_create(
+            [
+                User(
+                    username=username,
+                    email=f"{username}@example.com",
+                    password=password,
+                    role="user",
+                )
+                for username in usernames
+                if username not in existing
+            ],
+            batch_size=1000,
+        )
+        # bulk_create skips the post_save signal that normally adds profiles.
+        created = User.objects.filter(
+            username__in=[user.username for user in users]
+        ).values_list("pk", flat=True)
+        Profile.objects.bulk_create(
+            [Profile(user_id=pk, daily_calorie_goal=2000) for pk in created],
+            batch_size=1000,
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {len(users)} load test users ({len(existing)} existed)."
+            )
+        )
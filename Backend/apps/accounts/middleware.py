@@ -1,44 +1,57 @@
 from django.http import JsonResponse
 from rest_framework_simplejwt.authentication import JWTAuthentication
-from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed,
+    InvalidToken,
+    TokenError,
+)
+from rest_framework_simplejwt.settings import api_settings
+
+from .authentication import VALIDATED_TOKEN_ATTR
+from .status import BLOCKED, get_account_status
 
 
 class AccountStatusMiddleware:
+    """Rejects Bearer requests from blocked accounts.
+
+    Only the token is verified here (no DB access); the block status comes from
+    the account status cache. The validated token is kept on the request for
+    CachedJWTAuthentication, so DRF doesn't decode it a second time.
+    """
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.jwt_auth = JWTAuthentication()
+
+    def _validated_token(self, request):
+        header = self.jwt_auth.get_header(request)
+        if header is None:
+            return None
+        try:
+            raw_token = self.jwt_auth.get_raw_token(header)
+            if raw_token is None:
+                return None
+            return self.jwt_auth.get_validated_token(raw_token)
+        except (InvalidToken, AuthenticationFailed, TokenError):
+            # Left for DRF to reject with its usual 401.
+            return None
 
     def __call__(self, request):
-        auth_header = request.headers.get("Authorization")
-
-        if auth_header and auth_header.startswith("Bearer "):
-            try:
-                jwt_auth = JWTAuthentication()
-                auth_result = jwt_auth.authenticate(request)
-
-                if auth_result:
-                    user, token = auth_result
-
-                    if not user.is_active or user.status == "inactive":
-                        return JsonResponse(
-                            {
-                                "error": "Account Blocked",
-                                "detail": "Your account has been suspended by an administrator.",
-                                "code": "account_blocked",
-                            },
-                            status=403,
-                        )
-
-            except (InvalidToken, AuthenticationFailed) as e:
-
-                error_str = str(e).lower()
-                if "inactive" in error_str or "user is deleted" in error_str:
-                    return JsonResponse(
-                        {
-                            "error": "Account Blocked",
-                            "detail": "Your account has been suspended by an administrator.",
-                            "code": "account_blocked",
-                        },
-                        status=403,
-                    )
+        validated_token = self._validated_token(request)
+
+        if validated_token is not None:
+            user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+            if get_account_status(user_id) == BLOCKED:
+                return JsonResponse(
+                    {
+                        "error": "Account Blocked",
+                        "detail": (
+                            "Your account has been suspended by an administrator."
+                        ),
+                        "code": "account_blocked",
+                    },
+                    status=403,
+                )
+            setattr(request, VALIDATED_TOKEN_ATTR, validated_token)
 
         return self.get_response(request)
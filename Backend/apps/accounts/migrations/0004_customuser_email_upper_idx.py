@@ -0,0 +1,22 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:41
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0003_customuser_totp_secret"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                django.db.models.functions.text.Upper("email"),
+                name="customuser_email_upper_idx",
+            ),
+        ),
+    ]
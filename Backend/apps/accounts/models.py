@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Upper
 
 
 # Create your models here.
@@ -38,5 +39,11 @@ class CustomUser(AbstractUser):
         verbose_name="user permissions",
     )
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Serves the case-insensitive `email__iexact` login lookup.
+            models.Index(Upper("email"), name="customuser_email_upper_idx"),
+        ]
+
     def __str__(self):
         return self.username
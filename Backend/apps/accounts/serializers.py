@@ -1,12 +1,21 @@
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
 
 from apps.profiles.serializers import DoctorProfileSerializer
 
 from .models import CustomUser
+from .status import ACTIVE, get_account_status
+from .tokens import RoleRefreshToken
 
 
 class CustomTokenJwtSerializer(TokenObtainPairSerializer):
+    token_class = RoleRefreshToken
+
     def validate(self, attrs):
         data = super().validate(attrs)
 
@@ -18,6 +27,7 @@ class CustomTokenJwtSerializer(TokenObtainPairSerializer):
                 "message": "OTP Verification Required",
             }
 
+        # EmailUsernameBackend joins the profile, so this costs no query.
         daily_calorie_goal = 0
         try:
             if hasattr(self.user, "profile"):
@@ -39,6 +49,39 @@ class CustomTokenJwtSerializer(TokenObtainPairSerializer):
         return data
 
 
+class CachedTokenRefreshSerializer(TokenRefreshSerializer):
+    """TokenRefreshSerializer that checks the account through the status cache
+    instead of loading the user, and returns the token's user id so the view
+    can attach the (cached) user payload without decoding the new access token.
+    """
+
+    token_class = RoleRefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+
+        if get_account_status(user_id) != ACTIVE:
+            raise AuthenticationFailed(
+                self.error_messages["no_active_account"], "no_active_account"
+            )
+
+        data = {"access": str(refresh.access_token), "user_id": user_id}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                refresh.blacklist()
+
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            refresh.outstand()
+
+            data["refresh"] = str(refresh)
+
+        return data
+
+
 class RegisterSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, min_length=6)
     confirm_password = serializers.CharField(write_only=True)
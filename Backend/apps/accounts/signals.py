@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.profiles.models import DoctorProfile
+
+from .status import invalidate_account_status
+from .user_payload import invalidate_user_payload
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def drop_cached_account_status(sender, instance, **kwargs):
+    invalidate_account_status(instance.pk)
+    invalidate_user_payload(instance.pk)
+
+
+@receiver(post_save, sender=DoctorProfile)
+@receiver(post_delete, sender=DoctorProfile)
+def drop_cached_doctor_payload(sender, instance, **kwargs):
+    invalidate_user_payload(instance.user_id)
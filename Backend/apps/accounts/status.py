@@ -0,0 +1,57 @@
+"""
+Short-lived cache of whether an account may use the API.
+
+AccountStatusMiddleware checks this on every Bearer request instead of loading
+the user. Entries expire after ACCOUNT_STATUS_CACHE_TTL seconds and are dropped
+whenever a user is saved (see signals.py), so blocking takes effect on the
+next request in this process and within the TTL everywhere else.
+"""
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+ACTIVE = "active"
+BLOCKED = "blocked"
+MISSING = "missing"
+
+
+def _cache_key(user_id):
+    return f"account_status:{user_id}"
+
+
+def get_account_status(user_id):
+    key = _cache_key(user_id)
+    try:
+        status = cache.get(key)
+    except Exception as e:
+        # A cache outage must not lock everyone out; fall through to the DB.
+        print(f"Account status cache unavailable: {e}")
+        status = None
+    if status is not None:
+        return status
+
+    row = (
+        get_user_model()
+        .objects.filter(pk=user_id)
+        .values_list("is_active", "status")
+        .first()
+    )
+    if row is None:
+        status = MISSING
+    else:
+        is_active, account_status = row
+        status = ACTIVE if is_active and account_status != "inactive" else BLOCKED
+
+    try:
+        cache.set(key, status, settings.ACCOUNT_STATUS_CACHE_TTL)
+    except Exception:
+        pass
+    return status
+
+
+def invalidate_account_status(user_id):
+    try:
+        cache.delete(_cache_key(user_id))
+    except Exception as e:
+        print(f"Could not invalidate account status for user {user_id}: {e}")
@@ -0,0 +1,37 @@
+from smtplib import SMTPException
+
+from botocore.exceptions import BotoCoreError, ClientError
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import send_mail
+from django.db import transaction
+
+from .aws_utils import send_to_email_queue
+
+
+@shared_task(
+    autoretry_for=(SMTPException, OSError, BotoCoreError, ClientError),
+    retry_backoff=True,
+    retry_backoff_max=300,
+    retry_jitter=True,
+    max_retries=5,
+)
+def send_email(subject, body, recipient_email):
+    """Delivers one transactional email through EMAIL_TRANSPORT: SMTP from
+    the worker, or the SQS email queue."""
+    if settings.EMAIL_TRANSPORT == "sqs":
+        send_to_email_queue(subject, body, recipient_email)
+    else:
+        send_mail(
+            subject,
+            body,
+            settings.EMAIL_HOST_USER,
+            [recipient_email],
+            fail_silently=False,
+        )
+
+
+def queue_email(subject, body, recipient_email):
+    """Hands an email to the Celery worker once the current transaction commits,
+    so the OTP it carries is saved before the mail can arrive."""
+    transaction.on_commit(lambda: send_email.delay(subject, body, recipient_email))
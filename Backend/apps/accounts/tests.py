@@ -1,3 +1,251 @@
-from django.test import TestCase
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
 
-# Create your tests here.
+from apps.accounts.tasks import send_email
+from apps.accounts.tokens import RoleRefreshToken
+
+User = get_user_model()
+
+
+@pytest.fixture
+def bearer_client():
+    user = User.objects.create_user(
+        username="statususer",
+        email="statususer@example.com",
+        password="password",
+        role="user",
+    )
+    client = APIClient()
+    token = RefreshToken.for_user(user).access_token
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    return user, client
+
+
+@pytest.mark.django_db
+class TestAccountStatusMiddleware:
+
+    def test_user_is_loaded_once_per_request(self, bearer_client):
+        _, client = bearer_client
+        client.get("/api/tracking/summary/")  # warms the status cache
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get("/api/tracking/summary/")
+
+        assert response.status_code == 200
+        user_queries = [
+            q for q in queries.captured_queries if "accounts_customuser" in q["sql"]
+        ]
+        assert len(user_queries) == 1
+
+    def test_blocking_takes_effect_immediately(self, bearer_client):
+        user, client = bearer_client
+        admin = User.objects.create_user(
+            username="statusadmin",
+            email="statusadmin@example.com",
+            password="password",
+            role="admin",
+        )
+        assert client.get("/api/tracking/summary/").status_code == 200
+
+        admin_client = APIClient()
+        admin_client.force_authenticate(admin)
+        admin_client.patch(
+            f"/api/admin/users-management/{user.id}/",
+            {"action": "toggle_block"},
+            format="json",
+        )
+
+        response = client.get("/api/tracking/summary/")
+        assert response.status_code == 403
+        assert response.json()["code"] == "account_blocked"
+
+    def test_invalid_token_is_left_to_drf(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION="Bearer not-a-jwt")
+
+        assert client.get("/api/tracking/summary/").status_code == 401
+
+
+@pytest.mark.django_db
+class TestStatelessJWTAuthentication:
+
+    def test_read_only_views_skip_the_user_table(self, bearer_client):
+        _, client = bearer_client
+        client.get("/api/search/?q=oats")  # warms the status cache
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get("/api/search/?q=oats")
+
+        assert response.status_code == 200
+        assert not any(
+            "accounts_customuser" in q["sql"] for q in queries.captured_queries
+        )
+
+    def test_tokens_carry_the_role_claim(self, bearer_client):
+        user, _ = bearer_client
+        token = RoleRefreshToken.for_user(user).access_token
+
+        assert token["role"] == "user"
+
+    def test_deleted_user_is_rejected(self, bearer_client):
+        user, client = bearer_client
+        user.delete()
+
+        assert client.get("/api/search/?q=oats").status_code == 401
+
+
+@pytest.mark.django_db
+class TestEmailDispatch:
+
+    def test_registration_queues_the_otp_email(
+        self, django_capture_on_commit_callbacks, monkeypatch
+    ):
+        queued = []
+        monkeypatch.setattr(
+            "apps.accounts.tasks.send_email.delay",
+            lambda *args: queued.append(args),
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = APIClient().post(
+                "/api/users/register/",
+                {
+                    "username": "mailuser",
+                    "email": "mailuser@example.com",
+                    "mobile": "9999999999",
+                    "password": "Str0ng-password",
+                    "confirm_password": "Str0ng-password",
+                },
+                format="json",
+            )
+
+        assert response.status_code == 201
+        user = User.objects.get(email="mailuser@example.com")
+        subject, body, recipient = queued[0]
+        assert recipient == "mailuser@example.com"
+        assert user.otp in body
+
+    def test_task_sends_over_smtp(self, settings, mailoutbox):
+        settings.EMAIL_TRANSPORT = "smtp"
+        send_email("Subject", "Body", "someone@example.com")
+
+        assert len(mailoutbox) == 1
+        assert mailoutbox[0].to == ["someone@example.com"]
+
+
+@pytest.fixture
+def login_user():
+    return User.objects.create_user(
+        username="loginuser",
+        email="LoginUser@example.com",
+        password="password",
+        role="user",
+    )
+
+
+def login(identifier, password="password"):
+    client = APIClient()
+    response = client.post(
+        "/api/users/login/",
+        {"username": identifier, "password": password},
+        format="json",
+    )
+    return client, response
+
+
+@pytest.mark.django_db
+class TestLoginPath:
+
+    @pytest.mark.parametrize(
+        "identifier", ["loginuser", "loginuser@example.com", "LOGINUSER@EXAMPLE.COM"]
+    )
+    def test_login_by_username_or_any_email_case(self, login_user, identifier):
+        _, response = login(identifier)
+
+        assert response.status_code == 200
+        assert response.data["id"] == login_user.id
+
+    def test_username_is_case_sensitive(self, login_user):
+        _, response = login("LOGINUSER")
+
+        assert response.status_code == 401
+
+    def test_profile_is_joined_into_the_lookup(self, login_user):
+        with CaptureQueriesContext(connection) as queries:
+            _, response = login("loginuser@example.com")
+
+        assert response.status_code == 200
+        assert not any(
+            q["sql"].startswith('SELECT "profiles_profile"')
+            for q in queries.captured_queries
+        )
+
+    def test_refresh_serves_the_user_from_cache(self, login_user):
+        client, _ = login("loginuser")
+        assert client.post("/api/users/token/refresh/").status_code == 200
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post("/api/users/token/refresh/")
+
+        assert response.status_code == 200
+        assert response.data["user"]["email"] == "LoginUser@example.com"
+        assert "user_id" not in response.data
+        assert not any(
+            "accounts_customuser" in q["sql"] for q in queries.captured_queries
+        )
+
+    def test_refresh_sees_user_changes(self, login_user):
+        client, _ = login("loginuser")
+        client.post("/api/users/token/refresh/")
+
+        login_user.mobile = "9876543210"
+        login_user.save()
+
+        response = client.post("/api/users/token/refresh/")
+        assert response.data["user"]["mobile"] == "9876543210"
+
+    def test_refresh_rejects_blocked_accounts(self, login_user):
+        client, _ = login("loginuser")
+        login_user.is_active = False
+        login_user.save()
+
+        assert client.post("/api/users/token/refresh/").status_code == 401
+
+    def test_rotated_refresh_token_is_blacklisted(self, login_user):
+        client, _ = login("loginuser")
+        old = client.cookies["refresh_token"].value
+        client.post("/api/users/token/refresh/")
+
+        response = APIClient().post(
+            "/api/users/token/refresh/", {"refresh": old}, format="json"
+        )
+        assert response.status_code == 401
+
+
+@pytest.mark.django_db
+class TestPasswordRehash:
+
+    def test_pbkdf2_hash_is_upgraded_on_login(self, login_user, settings):
+        settings.PASSWORD_HASHING_CONCURRENCY = 1  # PBKDF2 verify re-enters encode
+        login_user.password = make_password("password", hasher="pbkdf2_sha256")
+        login_user.save()
+
+        _, response = login("loginuser")
+
+        assert response.status_code == 200
+        login_user.refresh_from_db()
+        assert login_user.password.startswith("argon2$argon2id$")
+
+    def test_retuned_argon2_cost_is_applied_on_login(self, login_user, settings):
+        settings.PASSWORD_ARGON2_TIME_COST = 3
+
+        login("loginuser")
+
+        login_user.refresh_from_db()
+        assert "t=3" in login_user.password
+        assert login_user.check_password("password")
@@ -0,0 +1,46 @@
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+
+class RoleRefreshToken(RefreshToken):
+    """Refresh token carrying the user's role, which access tokens minted from
+    it inherit. StatelessJWTAuthentication reads it instead of loading the user.
+
+    A role change reaches the claim on the next login or refresh-token rotation.
+
+    `blacklist` and `outstand` record the owner by id rather than loading the
+    user first as simplejwt does, so a rotation on refresh costs no user query.
+    Callers must have checked the account still exists.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token["role"] = user.role
+        return token
+
+    def _outstanding_defaults(self):
+        return {
+            "user_id": self.payload.get(api_settings.USER_ID_CLAIM),
+            "created_at": self.current_time,
+            "token": str(self),
+            "expires_at": datetime_from_epoch(self.payload["exp"]),
+        }
+
+    def blacklist(self):
+        token, _ = OutstandingToken.objects.get_or_create(
+            jti=self.payload[api_settings.JTI_CLAIM],
+            defaults=self._outstanding_defaults(),
+        )
+        return BlacklistedToken.objects.get_or_create(token=token)
+
+    def outstand(self):
+        return OutstandingToken.objects.get_or_create(
+            jti=self.payload[api_settings.JTI_CLAIM],
+            defaults=self._outstanding_defaults(),
+        )
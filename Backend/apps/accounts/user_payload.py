@@ -0,0 +1,51 @@
+"""
+Cached copy of the `user` object returned by the token refresh endpoint.
+
+Refreshes happen on every app start and token expiry, and the payload rarely
+changes, so it is served from the cache for USER_PAYLOAD_CACHE_TTL seconds
+(0 disables caching). Saving a user or their doctor profile drops the entry
+(see signals.py).
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import CustomUser
+from .serializers import UserSerializer
+
+
+def _cache_key(user_id):
+    return f"user_payload:{user_id}"
+
+
+def get_user_payload(user_id):
+    """UserSerializer data for `user_id`, or None if the user no longer exists."""
+    key = _cache_key(user_id)
+    try:
+        payload = cache.get(key)
+    except Exception as e:
+        print(f"User payload cache unavailable: {e}")
+        payload = None
+    if payload is not None:
+        return payload
+
+    user = (
+        CustomUser.objects.select_related("doctor_profile").filter(pk=user_id).first()
+    )
+    if user is None:
+        return None
+    payload = UserSerializer(user).data
+
+    if settings.USER_PAYLOAD_CACHE_TTL:
+        try:
+            cache.set(key, payload, settings.USER_PAYLOAD_CACHE_TTL)
+        except Exception:
+            pass
+    return payload
+
+
+def invalidate_user_payload(user_id):
+    try:
+        cache.delete(_cache_key(user_id))
+    except Exception as e:
+        print(f"Could not invalidate user payload for user {user_id}: {e}")
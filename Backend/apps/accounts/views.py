@@ -5,7 +5,6 @@ import string
 import pyotp
 import requests
 from django.conf import settings
-from django.core.mail import send_mail
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import generics, permissions, status, views
@@ -14,12 +13,12 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
-from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
-from .aws_utils import send_to_email_queue
 from .models import CustomUser
 from .serializers import (
+    CachedTokenRefreshSerializer,
     CorporateRegisterSerializer,
     CorporateVerifyOTPSerializer,
     CustomTokenJwtSerializer,
@@ -29,6 +28,9 @@ from .serializers import (
     UserSerializer,
     VerifyOTPSerializer,
 )
+from .tasks import queue_email
+from .tokens import RoleRefreshToken
+from .user_payload import get_user_payload
 
 
 # Create your views here.
@@ -69,6 +71,8 @@ class CustomTokenjwtView(TokenObtainPairView):
 
 
 class CustomTokenRefreshView(TokenRefreshView):
+    serializer_class = CachedTokenRefreshSerializer
+
     @swagger_auto_schema(
         operation_description="Refresh Access Token using HttpOnly cookie.",
         tags=["Login"],
@@ -99,16 +103,11 @@ class CustomTokenRefreshView(TokenRefreshView):
                         samesite=settings.SIMPLE_JWT["AUTH_COOKIE_SAMESITE"],
                     )
 
-                access_token_str = response.data.get("access")
-
-                access_token = AccessToken(access_token_str)
-                user_id = access_token["user_id"]
-
-                user = CustomUser.objects.get(id=user_id)
-
-                user_serializer = UserSerializer(user)
+                user = get_user_payload(response.data.pop("user_id"))
+                if user is None:
+                    raise CustomUser.DoesNotExist
 
-                response.data["user"] = user_serializer.data
+                response.data["user"] = user
 
             return response
         except (InvalidToken, TokenError, CustomUser.DoesNotExist):
@@ -145,13 +144,11 @@ class RegisterView(generics.GenericAPIView):
                 existing_user.otp = otp_code
                 existing_user.save()
 
-                send_mail(
+                queue_email(
                     "Mycalo AI Verification Code",
                     f"Your Mycalo AI verification code is {otp_code}. "
                     "Please do not share this code with anyone.",
-                    settings.EMAIL_HOST_USER,
-                    [existing_user.email],
-                    fail_silently=False,
+                    existing_user.email,
                 )
                 return Response(
                     {"message": "User exists but unverified. New OTP sent."},
@@ -171,13 +168,11 @@ class RegisterView(generics.GenericAPIView):
             user.otp = otp_code
             user.save()
 
-            send_mail(
+            queue_email(
                 "Mycalo AI Verification Code",
                 f"Your Mycalo AI verification code is {otp_code}. "
                 "Please do not share this code with anyone.",
-                settings.EMAIL_HOST_USER,
-                [user.email],
-                fail_silently=False,
+                user.email,
             )
             return Response(serializer.data, status=status.HTTP_201_CREATED)
 
@@ -210,7 +205,7 @@ class VerifyOTPView(views.APIView):
                     user.otp = None
                     user.save()
 
-                    refresh = RefreshToken.for_user(user)
+                    refresh = RoleRefreshToken.for_user(user)
 
                     response = Response(
                         {
@@ -323,7 +318,7 @@ class GoogleLoginView(APIView):
             user.set_unusable_password()
             user.save()
 
-        refresh = RefreshToken.for_user(user)
+        refresh = RoleRefreshToken.for_user(user)
         refresh["role"] = user.role
         refresh["username"] = user.username
 
@@ -454,7 +449,7 @@ class ForgotPasswordView(APIView):
                 user.otp = otp_code
                 user.save()
 
-                send_to_email_queue(
+                queue_email(
                     "Reset Your Password - Mycalo AI",
                     f"Your Password Reset OTP is: {otp_code}",
                     email,
@@ -643,7 +638,7 @@ class CorporateVerifyOTPView(views.APIView):
                     user.is_active = True
                     user.save()
 
-                    refresh = RefreshToken.for_user(user)
+                    refresh = RoleRefreshToken.for_user(user)
 
                     response = Response(
                         {
@@ -1,6 +1,6 @@
 from datetime import timedelta
 
-from django.db.models import Count, ExpressionWrapper, F, FloatField, Sum
+from django.db.models import Count, Sum
 from django.utils import timezone
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
@@ -123,30 +123,10 @@ class DashboardAnalyticsAPIView(APIView):
         weekly_macros_qs = (
             weekly_logs.values("date")
             .annotate(
-                total_calories=Sum(
-                    ExpressionWrapper(
-                        F("user_serving_grams") / 100.0 * F("food_item__calories"),
-                        output_field=FloatField(),
-                    )
-                ),
-                total_protein=Sum(
-                    ExpressionWrapper(
-                        F("user_serving_grams") / 100.0 * F("food_item__protein"),
-                        output_field=FloatField(),
-                    )
-                ),
-                total_carbs=Sum(
-                    ExpressionWrapper(
-                        F("user_serving_grams") / 100.0 * F("food_item__carbohydrates"),
-                        output_field=FloatField(),
-                    )
-                ),
-                total_fat=Sum(
-                    ExpressionWrapper(
-                        F("user_serving_grams") / 100.0 * F("food_item__fat"),
-                        output_field=FloatField(),
-                    )
-                ),
+                total_calories=Sum("calories", default=0),
+                total_protein=Sum("protein", default=0),
+                total_carbs=Sum("carbohydrates", default=0),
+                total_fat=Sum("fat", default=0),
             )
             .order_by("date")
         )
@@ -175,14 +155,7 @@ class DashboardAnalyticsAPIView(APIView):
 
         monthly_calories_qs = (
             monthly_logs.values("date")
-            .annotate(
-                total_calories=Sum(
-                    ExpressionWrapper(
-                        F("user_serving_grams") / 100.0 * F("food_item__calories"),
-                        output_field=FloatField(),
-                    )
-                )
-            )
+            .annotate(total_calories=Sum("calories", default=0))
             .order_by("date")
         )
 
@@ -202,12 +175,7 @@ class DashboardAnalyticsAPIView(APIView):
             )
 
         meal_distribution_qs = weekly_logs.values("meal_type").annotate(
-            total_calories=Sum(
-                ExpressionWrapper(
-                    F("user_serving_grams") / 100.0 * F("food_item__calories"),
-                    output_field=FloatField(),
-                )
-            )
+            total_calories=Sum("calories", default=0)
         )
 
         meal_distribution = {"BREAKFAST": 0, "LUNCH": 0, "DINNER": 0, "SNACK": 0}
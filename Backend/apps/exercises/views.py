@@ -6,6 +6,8 @@ from rest_framework.permissions import BasePermission
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.accounts.authentication import StatelessJWTAuthentication
+
 from .models import Exercise
 from .serializers import ExerciseSerializer
 
@@ -178,6 +180,7 @@ class AdminExerciseVerifyView(APIView):
 
 class ExerciseDetailView(APIView):
     permission_classes = [permissions.IsAuthenticated]
+    authentication_classes = [StatelessJWTAuthentication]
 
     @swagger_auto_schema(
         operation_description="Retrieve details of a specific exercise by its ID.",
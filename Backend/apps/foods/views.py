@@ -8,6 +8,8 @@ from rest_framework.permissions import BasePermission
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.accounts.authentication import StatelessJWTAuthentication
+
 from .models import FoodImage, FoodItem, FoodVote
 from .serializers import AdminFoodItemSerializer, FoodItemSerializer, VoteSerializer
 
@@ -25,6 +27,7 @@ class FoodDetailView(generics.RetrieveAPIView):
     queryset = FoodItem.objects.all()
     serializer_class = FoodItemSerializer
     permission_classes = [permissions.IsAuthenticated]
+    authentication_classes = [StatelessJWTAuthentication]
 
 
 class FoodVoteView(views.APIView):
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class MonitoringConfig(AppConfig):
+    name = "apps.monitoring"
+
+    def ready(self):
+        import apps.monitoring.signals  # noqa: F401
+        from apps.monitoring import tracing
+
+        tracing.configure()
@@ -0,0 +1,34 @@
+"""
+Cache backends that report hits and misses to the current monitoring scope.
+
+Drop-in replacements for Django's Redis and local-memory backends, selected in
+settings.CACHES.
+"""
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+
+from .stats import record_cache
+
+_MISSING = object()
+
+
+class InstrumentedCacheMixin:
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version=version)
+        record_cache(value is not _MISSING)
+        return default if value is _MISSING else value
+
+
+class InstrumentedRedisCache(InstrumentedCacheMixin, RedisCache):
+    def get_many(self, keys, version=None):
+        # Unlike BaseCache.get_many, this doesn't go through get().
+        keys = list(keys)
+        found = super().get_many(keys, version=version)
+        for key in keys:
+            record_cache(key in found)
+        return found
+
+
+class InstrumentedLocMemCache(InstrumentedCacheMixin, LocMemCache):
+    pass
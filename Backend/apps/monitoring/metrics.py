@@ -0,0 +1,110 @@
+"""
+Prometheus metrics for HTTP requests and Celery tasks.
+
+Served at /metrics (see views.py). Under gunicorn or prefork Celery, set
+PROMETHEUS_MULTIPROC_DIR to a directory shared by the processes of one
+service so /metrics aggregates all of them; gunicorn.conf.py clears it on
+start and removes the files of exited workers.
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+if MULTIPROC_DIR:
+    os.makedirs(MULTIPROC_DIR, exist_ok=True)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233)
+
+REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Time to produce a response, per view",
+    ["view", "method", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Database queries per request, per view",
+    ["view", "method"],
+    buckets=QUERY_BUCKETS,
+)
+REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds",
+    "Time spent in database queries per request, per view",
+    ["view", "method"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUEST_CACHE = Counter(
+    "http_request_cache_lookups_total",
+    "Cache lookups made while serving requests, per view",
+    ["view", "result"],
+)
+
+TASK_SECONDS = Histogram(
+    "celery_task_duration_seconds",
+    "Task run time, per task",
+    ["task", "state"],
+    buckets=LATENCY_BUCKETS + (60, 120, 300),
+)
+TASK_QUERIES = Histogram(
+    "celery_task_db_queries",
+    "Database queries per task run",
+    ["task"],
+    buckets=QUERY_BUCKETS + (377, 610, 987, 1597),
+)
+TASK_DB_SECONDS = Histogram(
+    "celery_task_db_seconds",
+    "Time spent in database queries per task run",
+    ["task"],
+    buckets=LATENCY_BUCKETS + (60, 120, 300),
+)
+TASK_CACHE = Counter(
+    "celery_task_cache_lookups_total",
+    "Cache lookups made by task runs",
+    ["task", "result"],
+)
+
+
+def observe_request(view, method, status, stats):
+    REQUEST_SECONDS.labels(view, method, status).observe(stats.seconds)
+    REQUEST_QUERIES.labels(view, method).observe(stats.queries)
+    REQUEST_DB_SECONDS.labels(view, method).observe(stats.db_seconds)
+    if stats.cache_hits:
+        REQUEST_CACHE.labels(view, "hit").inc(stats.cache_hits)
+    if stats.cache_misses:
+        REQUEST_CACHE.labels(view, "miss").inc(stats.cache_misses)
+
+
+def observe_task(task, state, stats):
+    TASK_SECONDS.labels(task, state).observe(stats.seconds)
+    TASK_QUERIES.labels(task).observe(stats.queries)
+    TASK_DB_SECONDS.labels(task).observe(stats.db_seconds)
+    if stats.cache_hits:
+        TASK_CACHE.labels(task, "hit").inc(stats.cache_hits)
+    if stats.cache_misses:
+        TASK_CACHE.labels(task, "miss").inc(stats.cache_misses)
+
+
+def registry():
+    """Registry to expose: this process's metrics, or every process's in
+    multiprocess mode."""
+    if not MULTIPROC_DIR:
+        return REGISTRY
+    collected = CollectorRegistry()
+    multiprocess.MultiProcessCollector(collected)
+    return collected
+
+
+def exposition():
+    """(body, content type) of the current metrics in text format."""
+    return generate_latest(registry()), CONTENT_TYPE_LATEST
@@ -0,0 +1,56 @@
+import logging
+
+from django.conf import settings
+
+from .metrics import observe_request
+from .stats import collect
+
+logger = logging.getLogger(__name__)
+
+
+def view_label(request):
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unmatched"
+    return match.view_name or match._func_path
+
+
+def server_timing(stats):
+    return (
+        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries", '
+        f'cache;desc="{stats.cache_hits} hits {stats.cache_misses} misses", '
+        f"total;dur={stats.seconds * 1000:.1f}"
+    )
+
+
+class MonitoringMiddleware:
+    """Records query count, query time, cache hits/misses and latency of every
+    request under its view name, for the Prometheus metrics at /metrics.
+
+    Sits first in MIDDLEWARE so the work of the other middleware (e.g. the
+    account status check) is counted too. With SERVER_TIMING on, the numbers
+    are also sent back in a Server-Timing header, which browser dev tools
+    show next to the request.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with collect() as stats:
+            response = self.get_response(request)
+
+        view = view_label(request)
+        observe_request(view, request.method, response.status_code, stats)
+
+        if settings.SERVER_TIMING:
+            response["Server-Timing"] = server_timing(stats)
+        if stats.queries >= settings.QUERY_COUNT_WARNING:
+            logger.warning(
+                "%s %s ran %d queries (%.0f ms)",
+                request.method,
+                view,
+                stats.queries,
+                stats.db_seconds * 1000,
+            )
+        return response
@@ -0,0 +1,38 @@
+from celery.signals import task_postrun, task_prerun, worker_ready
+from django.conf import settings
+from prometheus_client import start_http_server
+
+from .metrics import observe_task, registry
+from .stats import collect
+
+# task id -> (open collect() scope, its WorkStats)
+_running = {}
+
+
+@task_prerun.connect
+def start_task_stats(task_id=None, **kwargs):
+    scope = collect()
+    _running[task_id] = (scope, scope.__enter__())
+
+
+@task_postrun.connect
+def record_task_stats(task_id=None, task=None, state=None, **kwargs):
+    entry = _running.pop(task_id, None)
+    if entry is None:
+        return
+    scope, stats = entry
+    scope.__exit__(None, None, None)
+
+    observe_task(task.name, state or "UNKNOWN", stats)
+    if stats.queries >= settings.QUERY_COUNT_WARNING:
+        print(
+            f"[MONITORING] task {task.name} ran {stats.queries} queries "
+            f"({stats.db_seconds * 1000:.0f} ms)"
+        )
+
+
+@worker_ready.connect
+def serve_worker_metrics(**kwargs):
+    # Workers have no HTTP server of their own; expose metrics on a side port.
+    if settings.CELERY_METRICS_PORT:
+        start_http_server(settings.CELERY_METRICS_PORT, registry=registry())
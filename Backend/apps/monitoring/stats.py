@@ -0,0 +1,70 @@
+"""
+Per-request / per-task work counters.
+
+`collect()` opens a scope (an HTTP request in MonitoringMiddleware, a task run
+in signals.py) during which every query on the default connection and every
+cache lookup through apps.monitoring.cache is tallied into a WorkStats (and,
+with tracing on, each query gets a span). The scope lives in a ContextVar, so
+concurrent threads and tasks don't mix counts.
+"""
+
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from django.db import connection
+
+from . import tracing
+
+_current = ContextVar("monitoring_work_stats", default=None)
+
+
+@dataclass
+class WorkStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    seconds: float = 0.0
+
+
+def current():
+    return _current.get()
+
+
+def record_cache(hit):
+    stats = _current.get()
+    if stats is None:
+        return
+    if hit:
+        stats.cache_hits += 1
+    else:
+        stats.cache_misses += 1
+
+
+def _count_query(execute, sql, params, many, context):
+    stats = _current.get()
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        if stats is not None:
+            stats.queries += 1
+            stats.db_seconds += time.perf_counter() - start
+
+
+@contextmanager
+def collect():
+    stats = WorkStats()
+    token = _current.set(stats)
+    try:
+        with ExitStack() as wrappers:
+            wrappers.enter_context(connection.execute_wrapper(_count_query))
+            if tracing.enabled():
+                wrappers.enter_context(connection.execute_wrapper(tracing.trace_query))
+            yield stats
+    finally:
+        stats.seconds = time.perf_counter() - stats.started
+        _current.reset(token)
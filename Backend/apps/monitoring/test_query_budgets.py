@@ -0,0 +1,210 @@
+"""Query budgets for the hot endpoints.
+
+Each endpoint is requested against a small and a large seeded dataset. The
+query count has to be the same for both, so an N+1 fails here rather than in
+production, and has to stay within the endpoint's declared budget, so an extra
+per-request query is a deliberate change to BUDGETS rather than an accident.
+"""
+
+import datetime
+import itertools
+from dataclasses import dataclass
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.exercises.models import Exercise
+from apps.foods.models import FoodImage, FoodItem
+from apps.tracking.models import DailyLog, ExerciseLog
+
+User = get_user_model()
+
+SMALL_ROWS = 2
+LARGE_ROWS = 30
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    name: str
+    path: str
+    role: str = "user"
+    method: str = "get"
+    budget: int = 0
+
+
+BUDGETS = [
+    Endpoint("daily log list", "/api/tracking/logs/", budget=2),
+    Endpoint("exercise list", "/api/tracking/exercise-logs/", budget=3),
+    Endpoint("dashboard", "/api/analytics/dashboard/", budget=6),
+    Endpoint("admin food list", "/api/foods/admin/manage/", role="admin", budget=4),
+    Endpoint("food search", "/api/search/?q=food", budget=2),
+    Endpoint("exercise search", "/api/search/?q=exercise&type=exercises", budget=1),
+    Endpoint("AI meal logging", "/api/tracking/log-ai-meal/", method="post", budget=6),
+    Endpoint(
+        "patient food logs",
+        "/api/tracking/patient-logs/{patient}/",
+        role="doctor",
+        budget=2,
+    ),
+    Endpoint(
+        "patient exercise logs",
+        "/api/tracking/patient-exercise-logs/{patient}/",
+        role="doctor",
+        budget=3,
+    ),
+]
+
+
+class SeededWorld:
+    """A patient, a doctor and an admin, plus catalogue and log rows that can
+    be grown between measurements. Half of the logs are written without their
+    nutrient/burned-calorie snapshot, like rows from before the backfill, so
+    the serializers' fallback paths are measured too."""
+
+    def __init__(self):
+        self.users = {
+            role: User.objects.create_user(
+                username=f"budget{role}",
+                email=f"budget{role}@example.com",
+                password="password",
+                role=role,
+            )
+            for role in ("user", "doctor", "admin")
+        }
+        profile = self.users["user"].profile
+        profile.weight = 80
+        profile.save()
+
+        self.rows = 0
+        self.today = datetime.date.today()
+        self._names = itertools.count()
+
+    def grow(self, rows):
+        patient = self.users["user"]
+        for _ in range(rows - self.rows):
+            n = next(self._names)
+            food = FoodItem.objects.create(
+                name=f"Food {n}",
+                brand="Budget",
+                serving_size="100g",
+                calories=100 + n,
+                protein=10,
+                carbohydrates=20,
+                fat=5,
+            )
+            FoodImage.objects.create(food=food, image=f"food_images/food-{n}.jpg")
+            exercise = Exercise.objects.create(name=f"Exercise {n}", met_value=5)
+
+            meal_type = DailyLog.MEAL_TYPES[n % len(DailyLog.MEAL_TYPES)][0]
+            for offset in (0, 3):
+                day = self.today - datetime.timedelta(days=offset)
+                log = DailyLog.objects.create(
+                    user=patient, food_item=food, meal_type=meal_type, date=day
+                )
+                exercise_log = ExerciseLog.objects.create(
+                    user=patient, exercise=exercise, date=day
+                )
+                if n % 2:
+                    DailyLog.objects.filter(pk=log.pk).update(calories=None)
+                    ExerciseLog.objects.filter(pk=exercise_log.pk).update(
+                        burned_calories=None
+                    )
+        self.rows = rows
+
+    def ai_meal(self):
+        """One item per seeded row, half of them foods not in the catalogue."""
+        items = []
+        for n in range(self.rows):
+            known = n % 2 == 0
+            items.append(
+                {
+                    "food_name": (
+                        f"FOOD {n}" if known else f"New food {next(self._names)}"
+                    ),
+                    "user_serving_size_g": 150,
+                    "100g_serving_size": {"calories": 120, "protein": 4, "carbs": 20},
+                }
+            )
+        return {"meal_type": "LUNCH", "items": items}
+
+    def client(self, role):
+        client = APIClient()
+        token = RefreshToken.for_user(self.users[role]).access_token
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        client.get("/api/tracking/summary/")  # warms the account status cache
+        return client
+
+
+def measure(world, endpoint):
+    client = world.client(endpoint.role)
+    path = endpoint.path.format(patient=world.users["user"].id)
+
+    with CaptureQueriesContext(connection) as queries:
+        if endpoint.method == "post":
+            response = client.post(path, world.ai_meal(), format="json")
+        else:
+            response = client.get(path)
+
+    assert response.status_code < 300, response.content
+    return queries.captured_queries
+
+
+def describe(queries):
+    return "\n".join(query["sql"] for query in queries)
+
+
+@pytest.fixture
+def world():
+    return SeededWorld()
+
+
+@pytest.mark.django_db
+class TestQueryBudgets:
+
+    @pytest.mark.parametrize("endpoint", BUDGETS, ids=lambda endpoint: endpoint.name)
+    def test_query_count_is_independent_of_rows(self, world, endpoint):
+        world.grow(SMALL_ROWS)
+        small = measure(world, endpoint)
+        world.grow(LARGE_ROWS)
+        large = measure(world, endpoint)
+
+        assert len(large) == len(small), (
+            f"{endpoint.name} grows with the data: {len(small)} queries for "
+            f"{SMALL_ROWS} rows, {len(large)} for {LARGE_ROWS}:\n{describe(large)}"
+        )
+        assert len(large) <= endpoint.budget, (
+            f"{endpoint.name} ran {len(large)} queries, budget is "
+            f"{endpoint.budget}:\n{describe(large)}"
+        )
+
+    def test_ai_meal_reuses_foods_case_insensitively(self, world):
+        world.grow(SMALL_ROWS)
+        client = world.client("user")
+
+        response = client.post(
+            "/api/tracking/log-ai-meal/",
+            {
+                "meal_type": "dinner",
+                "items": [
+                    {"food_name": "food 0", "user_serving_size_g": 50},
+                    {"food_name": "Lentil soup", "100g_serving_size": {"calories": 80}},
+                    {"food_name": "LENTIL SOUP", "user_serving_size_g": 200},
+                ],
+            },
+            format="json",
+        )
+
+        assert response.status_code == 201
+        assert response.data["logs_created"] == 3
+        assert FoodItem.objects.filter(name__iexact="lentil soup").count() == 1
+        logs = DailyLog.objects.filter(meal_type="DINNER").order_by("id")
+        assert [log.food_item.name for log in logs] == [
+            "Food 0",
+            "Lentil soup",
+            "Lentil soup",
+        ]
+        assert [log.calories for log in logs] == [50, 80, 160]
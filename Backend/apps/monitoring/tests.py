@@ -0,0 +1,126 @@
+import pytest
+from celery import shared_task
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.monitoring import tracing
+from apps.monitoring.stats import collect
+
+User = get_user_model()
+
+
+@shared_task
+def touch_users():
+    return User.objects.count() + User.objects.filter(is_active=True).count()
+
+
+@pytest.fixture
+def client():
+    user = User.objects.create_user(
+        username="monitored",
+        email="monitored@example.com",
+        password="password",
+        role="user",
+    )
+    client = APIClient()
+    token = RefreshToken.for_user(user).access_token
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    return client
+
+
+@pytest.mark.django_db
+class TestMonitoringMiddleware:
+
+    def test_server_timing_header(self, client, settings):
+        settings.SERVER_TIMING = True
+
+        response = client.get("/api/tracking/summary/")
+
+        timing = response["Server-Timing"]
+        assert timing.startswith("db;dur=")
+        assert "queries" in timing and "total;dur=" in timing
+
+    def test_no_header_unless_enabled(self, client, settings):
+        settings.SERVER_TIMING = False
+
+        assert "Server-Timing" not in client.get("/api/tracking/summary/")
+
+    def test_metrics_are_labelled_by_view(self, client):
+        client.get("/api/tracking/summary/")
+
+        body = APIClient().get("/metrics").content.decode()
+        assert 'http_request_db_queries_count{method="GET",view="daily-summary"}' in (
+            body
+        )
+        assert "http_request_cache_lookups_total" in body
+
+    def test_high_query_count_is_logged(self, client, settings, caplog):
+        settings.QUERY_COUNT_WARNING = 1
+
+        with caplog.at_level("WARNING", logger="apps.monitoring.middleware"):
+            client.get("/api/tracking/summary/")
+
+        assert "GET daily-summary ran" in caplog.text
+
+
+@pytest.mark.django_db
+class TestWorkStats:
+
+    def test_counts_queries_and_cache_lookups(self):
+        cache.set("monitoring-test", 1)
+
+        with collect() as stats:
+            User.objects.count()
+            cache.get("monitoring-test")
+            cache.get("monitoring-absent")
+
+        assert stats.queries == 1
+        assert (stats.cache_hits, stats.cache_misses) == (1, 1)
+
+    def test_task_runs_are_recorded(self):
+        touch_users.apply()
+
+        body = APIClient().get("/metrics").content.decode()
+        assert (
+            'celery_task_db_queries_sum{task="apps.monitoring.tests.touch_users"} 2.0'
+            in body
+        )
+
+
+@pytest.fixture
+def spans(monkeypatch):
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(tracing, "_tracer", provider.get_tracer("test"))
+    return exporter
+
+
+@pytest.mark.django_db
+class TestTracing:
+
+    def test_queries_get_spans_under_the_current_span(self, spans):
+        with tracing._tracer.start_as_current_span("task"):
+            with collect():
+                User.objects.count()
+
+        query, task = spans.get_finished_spans()
+        assert query.name == "SELECT"
+        assert "accounts_customuser" in query.attributes["db.statement"]
+        assert query.parent.span_id == task.context.span_id
+
+    def test_no_spans_when_disabled(self):
+        assert not tracing.enabled()
+
+        with collect() as stats:
+            User.objects.count()
+
+        assert stats.queries == 1
@@ -0,0 +1,76 @@
+"""
+OpenTelemetry tracing, switched on by setting OTEL_EXPORTER_OTLP_ENDPOINT
+(e.g. http://otel-collector:4318, see docker-compose.tracing.yml).
+
+Spans go to that collector over OTLP/HTTP. Incoming requests continue the
+caller's trace from its traceparent header, Celery tasks continue the trace
+that queued them (the context travels in the message headers), and boto3
+(SQS), Redis, httpx (FCM) and requests calls get client spans that pass the
+context on. SQL gets one span per query from the execute wrapper that
+stats.collect() installs for each request and task.
+
+Without the variable none of the OpenTelemetry packages are imported.
+"""
+
+from django.conf import settings
+
+_tracer = None
+
+
+def configure():
+    global _tracer
+    if _tracer is not None or not settings.OTEL_EXPORTER_OTLP_ENDPOINT:
+        return
+
+    from opentelemetry import trace
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+        OTLPSpanExporter,
+    )
+    from opentelemetry.instrumentation.botocore import BotocoreInstrumentor
+    from opentelemetry.instrumentation.celery import CeleryInstrumentor
+    from opentelemetry.instrumentation.django import DjangoInstrumentor
+    from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+    from opentelemetry.instrumentation.redis import RedisInstrumentor
+    from opentelemetry.instrumentation.requests import RequestsInstrumentor
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.OTEL_SERVICE_NAME})
+    )
+    # The exporter reads the endpoint from the environment itself. The batch
+    # processor restarts its export thread after fork (gunicorn preload,
+    # Celery prefork), so configuring in the parent is enough.
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    trace.set_tracer_provider(provider)
+
+    DjangoInstrumentor().instrument()
+    CeleryInstrumentor().instrument()
+    BotocoreInstrumentor().instrument()
+    RedisInstrumentor().instrument()
+    HTTPXClientInstrumentor().instrument()
+    RequestsInstrumentor().instrument()
+
+    _tracer = trace.get_tracer(__name__)
+
+
+def enabled():
+    return _tracer is not None
+
+
+def trace_query(execute, sql, params, many, context):
+    from opentelemetry.trace import SpanKind
+
+    operation = sql.split(None, 1)[0].upper() if sql else "QUERY"
+    connection = context["connection"]
+    with _tracer.start_as_current_span(
+        operation,
+        kind=SpanKind.CLIENT,
+        attributes={
+            "db.system": connection.vendor,
+            "db.name": str(connection.settings_dict["NAME"]),
+            "db.statement": sql,
+        },
+    ):
+        return execute(sql, params, many, context)
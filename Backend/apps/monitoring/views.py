@@ -0,0 +1,12 @@
+from django.http import HttpResponse
+
+from .metrics import exposition
+
+
+def metrics(request):
+    """Prometheus scrape endpoint. Not routed by the nginx gateway; the
+    production compose profile doesn't publish the backend's port, so there it
+    is only reachable from inside the deployment. The development compose file
+    does publish 8000, which exposes it along with the rest of the backend."""
+    body, content_type = exposition()
+    return HttpResponse(body, content_type=content_type)
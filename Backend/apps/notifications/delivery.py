@@ -0,0 +1,236 @@
+"""
+Consumer for the meal-reminder / broadcast SQS queue.
+
+`check_missing_meals` and `send_broadcast_notification` enqueue one message per
+device. This worker long-polls the queue in batches of 10, pushes each message
+to FCM over a shared connection pool with a bounded number of requests in
+flight, deletes handled messages in batches, and clears tokens FCM reports as
+no longer registered.
+
+Messages whose delivery failed with a retryable error (429, 5xx, timeouts) are
+left on the queue and come back after its visibility timeout.
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from apps.profiles.models import Profile
+
+SQS_MAX_BATCH = 10
+FCM_SCOPE = "https://www.googleapis.com/auth/firebase.messaging"
+
+SENT = "sent"
+DEAD = "dead"
+RETRY = "retry"
+INVALID = "invalid"
+
+
+@dataclass
+class DeliveryStats:
+    started: float = field(default_factory=time.monotonic)
+    received: int = 0
+    sent: int = 0
+    dead: int = 0
+    retry: int = 0
+    invalid: int = 0
+    deleted: int = 0
+
+    def count(self, outcome):
+        setattr(self, outcome, getattr(self, outcome) + 1)
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    def summary(self):
+        rate = self.sent / self.elapsed if self.elapsed else 0.0
+        return (
+            f"received={self.received} sent={self.sent} dead={self.dead} "
+            f"retry={self.retry} invalid={self.invalid} deleted={self.deleted} "
+            f"elapsed={self.elapsed:.1f}s ({rate:.1f} sent/s)"
+        )
+
+
+class FCMClient:
+    """FCM HTTP v1 sender sharing one pooled httpx client.
+
+    Without a credentials file no Authorization header is sent, which is what
+    the local stand-in (`manage.py fake_fcm_server`) expects.
+    """
+
+    def __init__(
+        self,
+        base_url,
+        project_id,
+        concurrency=50,
+        credentials_file=None,
+        timeout=10.0,
+    ):
+        self.url = f"{base_url.rstrip('/')}/v1/projects/{project_id}/messages:send"
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=concurrency, max_keepalive_connections=concurrency
+            ),
+        )
+        self.credentials = None
+        if credentials_file:
+            # Only needed against the real FCM endpoint.
+            from google.oauth2 import service_account
+
+            self.credentials = service_account.Credentials.from_service_account_file(
+                credentials_file, scopes=[FCM_SCOPE]
+            )
+        self._token_lock = asyncio.Lock()
+
+    async def _auth_headers(self):
+        if self.credentials is None:
+            return {}
+        async with self._token_lock:
+            if not self.credentials.valid:
+                from google.auth.transport.requests import Request
+
+                await asyncio.to_thread(self.credentials.refresh, Request())
+        return {"Authorization": f"Bearer {self.credentials.token}"}
+
+    async def send(self, token, title, body, data=None):
+        message = {"token": token, "notification": {"title": title, "body": body}}
+        if data:
+            message["data"] = {key: str(value) for key, value in data.items()}
+
+        async with self.semaphore:
+            try:
+                response = await self.client.post(
+                    self.url,
+                    json={"message": message},
+                    headers=await self._auth_headers(),
+                )
+            except httpx.HTTPError as e:
+                print(f"FCM request failed: {e}")
+                return RETRY
+
+        if response.status_code == 200:
+            return SENT
+        if response.status_code == 404 or _is_unregistered(response):
+            return DEAD
+        if response.status_code == 429 or response.status_code >= 500:
+            return RETRY
+        print(f"FCM rejected message ({response.status_code}): {response.text[:200]}")
+        return INVALID
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+def _is_unregistered(response):
+    try:
+        error = response.json().get("error", {})
+    except ValueError:
+        return False
+    for detail in error.get("details", []):
+        if detail.get("errorCode") == "UNREGISTERED":
+            return True
+    # A malformed registration token is as dead as an expired one.
+    return (
+        error.get("status") == "INVALID_ARGUMENT"
+        and "registration token" in error.get("message", "").lower()
+    )
+
+
+@sync_to_async
+def prune_dead_tokens(tokens):
+    return Profile.objects.filter(fcm_token__in=tokens).update(fcm_token=None)
+
+
+class NotificationWorker:
+    """Runs `pollers` receive loops against one queue; together they share the
+    FCM client, so at most its `concurrency` sends are in flight."""
+
+    def __init__(self, sqs, queue_url, fcm, pollers=4, wait_time=20):
+        self.sqs = sqs
+        self.queue_url = queue_url
+        self.fcm = fcm
+        self.pollers = pollers
+        self.wait_time = wait_time
+        self.stats = DeliveryStats()
+        self.stopping = asyncio.Event()
+
+    def stop(self):
+        self.stopping.set()
+
+    async def run(self, until_empty=False):
+        await asyncio.gather(*(self._poll(until_empty) for _ in range(self.pollers)))
+
+    async def _poll(self, until_empty):
+        while not self.stopping.is_set():
+            # boto3 is blocking; a thread per long poll keeps the loop free.
+            response = await asyncio.to_thread(
+                self.sqs.receive_message,
+                QueueUrl=self.queue_url,
+                MaxNumberOfMessages=SQS_MAX_BATCH,
+                WaitTimeSeconds=1 if until_empty else self.wait_time,
+            )
+            messages = response.get("Messages", [])
+            if not messages:
+                if until_empty:
+                    return
+                continue
+            await self.handle_batch(messages)
+
+    async def handle_batch(self, messages):
+        self.stats.received += len(messages)
+        outcomes = await asyncio.gather(*(self._deliver(m) for m in messages))
+
+        done, dead_tokens = [], set()
+        for message, (outcome, token) in zip(messages, outcomes):
+            self.stats.count(outcome)
+            if outcome == RETRY:
+                continue
+            done.append(message)
+            if outcome == DEAD:
+                dead_tokens.add(token)
+
+        if dead_tokens:
+            await prune_dead_tokens(dead_tokens)
+        if done:
+            await self._delete(done)
+
+    async def _deliver(self, message):
+        try:
+            payload = json.loads(message["Body"])
+            token = payload["fcm_token"]
+            title, body = payload["title"], payload["body"]
+        except (ValueError, KeyError, TypeError):
+            print(f"Dropping malformed notification message {message['MessageId']}")
+            return INVALID, None
+
+        data = {"user_id": payload["user_id"]} if "user_id" in payload else None
+        return await self.fcm.send(token, title, body, data=data), token
+
+    async def _delete(self, messages):
+        entries = [
+            {"Id": str(index), "ReceiptHandle": message["ReceiptHandle"]}
+            for index, message in enumerate(messages)
+        ]
+        response = await asyncio.to_thread(
+            self.sqs.delete_message_batch, QueueUrl=self.queue_url, Entries=entries
+        )
+        self.stats.deleted += len(response.get("Successful", []))
+        for failure in response.get("Failed", []):
+            print(f"Failed to delete notification message: {failure}")
+
+
+def build_fcm_client(concurrency):
+    return FCMClient(
+        base_url=settings.FCM_BASE_URL,
+        project_id=settings.FCM_PROJECT_ID,
+        concurrency=concurrency,
+        credentials_file=settings.FCM_CREDENTIALS_FILE,
+    )
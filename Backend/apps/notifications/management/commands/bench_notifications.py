@@ -0,0 +1,69 @@
+import asyncio
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.aws_utils import build_sqs_client
+from apps.notifications.delivery import SQS_MAX_BATCH
+
+from .run_notification_worker import run_worker
+
+
+class Command(BaseCommand):
+    help = (
+        "Enqueue synthetic notifications and drain them with the notification "
+        "worker, reporting throughput. Meant for a local SQS and "
+        "`manage.py fake_fcm_server`, never the production queue."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--messages", type=int, default=5000)
+        parser.add_argument(
+            "--dead-ratio",
+            type=float,
+            default=0.05,
+            help="Share of messages addressed to unregistered tokens",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=settings.NOTIFICATION_WORKER_CONCURRENCY,
+        )
+        parser.add_argument("--pollers", type=int, default=None)
+
+    def handle(self, *args, **options):
+        if not settings.AWS_SQS_ENDPOINT_URL:
+            raise CommandError(
+                "Refusing to benchmark against AWS; set AWS_SQS_ENDPOINT_URL to a "
+                "local SQS such as elasticmq."
+            )
+
+        sqs = build_sqs_client()
+        queue_name = settings.AWS_MEAL_REMINDER_QUEUE_URL.rstrip("/").rsplit("/", 1)[-1]
+        queue_url = sqs.create_queue(QueueName=queue_name)["QueueUrl"]
+
+        total = options["messages"]
+        dead_every = round(1 / options["dead_ratio"]) if options["dead_ratio"] else 0
+        for start in range(0, total, SQS_MAX_BATCH):
+            entries = []
+            for index in range(start, min(start + SQS_MAX_BATCH, total)):
+                dead = dead_every and index % dead_every == 0
+                payload = {
+                    "user_id": index,
+                    "fcm_token": f"{'dead-' if dead else 'token-'}{index}",
+                    "title": "MyCalo AI: benchmark",
+                    "body": f"Synthetic notification {index}",
+                }
+                entries.append(
+                    {"Id": str(index - start), "MessageBody": json.dumps(payload)}
+                )
+            sqs.send_message_batch(QueueUrl=queue_url, Entries=entries)
+        self.stdout.write(f"Enqueued {total} messages on {queue_url}")
+
+        concurrency = options["concurrency"]
+        pollers = options["pollers"] or max(1, concurrency // 10)
+        stats = asyncio.run(
+            run_worker(queue_url, concurrency, pollers, until_empty=True)
+        )
+        self.stdout.write(self.style.SUCCESS(stats.summary()))
@@ -0,0 +1,123 @@
+import asyncio
+import json
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+UNREGISTERED = {
+    "error": {
+        "code": 404,
+        "status": "NOT_FOUND",
+        "message": "Requested entity was not found.",
+        "details": [{"errorCode": "UNREGISTERED"}],
+    }
+}
+UNAVAILABLE = {"error": {"code": 503, "status": "UNAVAILABLE"}}
+BAD_REQUEST = {"error": {"code": 400, "status": "INVALID_ARGUMENT"}}
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 503: "Unavailable"}
+
+
+class FakeFCM:
+    """Answers FCM HTTP v1 `messages:send` calls over keep-alive connections.
+
+    Runs on asyncio rather than http.server so simulated latency doesn't tie up
+    a thread per request and the stand-in keeps up with the worker's pool.
+    """
+
+    def __init__(self, latency, failure_rate, dead_prefix):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.dead_prefix = dead_prefix
+        self.requests = 0
+
+    def respond(self, body):
+        try:
+            token = json.loads(body)["message"]["token"]
+        except (ValueError, KeyError, TypeError):
+            return 400, BAD_REQUEST
+        if token.startswith(self.dead_prefix):
+            return 404, UNREGISTERED
+        if random.random() < self.failure_rate:
+            return 503, UNAVAILABLE
+        return 200, {"name": f"projects/fake/messages/{time.time_ns()}"}
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                length = 0
+                while True:
+                    header = await reader.readline()
+                    if header in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = header.decode("latin-1").partition(":")
+                    if name.strip().lower() == "content-length":
+                        length = int(value.strip())
+                body = await reader.readexactly(length) if length else b""
+
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                status, payload = self.respond(body)
+                self.requests += 1
+
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class Command(BaseCommand):
+    help = (
+        "Local stand-in for the FCM HTTP v1 send endpoint, for running the "
+        "notification worker without Firebase. Tokens starting with "
+        "--dead-prefix are reported as UNREGISTERED."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="0.0.0.0")
+        parser.add_argument("--port", type=int, default=8010)
+        parser.add_argument(
+            "--latency-ms",
+            type=int,
+            default=50,
+            help="Simulated FCM response time per request",
+        )
+        parser.add_argument(
+            "--failure-rate",
+            type=float,
+            default=0.0,
+            help="Share of requests answered with 503",
+        )
+        parser.add_argument("--dead-prefix", default="dead-")
+
+    def handle(self, *args, **options):
+        fake = FakeFCM(
+            latency=options["latency_ms"] / 1000,
+            failure_rate=options["failure_rate"],
+            dead_prefix=options["dead_prefix"],
+        )
+        self.stdout.write(
+            f"Fake FCM listening on http://{options['host']}:{options['port']}"
+        )
+        try:
+            asyncio.run(self.serve(fake, options["host"], options["port"]))
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(f"Answered {fake.requests} requests")
+
+    async def serve(self, fake, host, port):
+        server = await asyncio.start_server(fake.handle, host, port, backlog=1024)
+        async with server:
+            await server.serve_forever()
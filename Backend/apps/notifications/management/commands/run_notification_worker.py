@@ -0,0 +1,70 @@
+import asyncio
+import signal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.aws_utils import build_sqs_client
+from apps.notifications.delivery import NotificationWorker, build_fcm_client
+
+
+async def run_worker(queue_url, concurrency, pollers, until_empty=False):
+    """Runs a NotificationWorker until stopped (or the queue is drained) and
+    returns its stats."""
+    fcm = build_fcm_client(concurrency)
+    worker = NotificationWorker(
+        build_sqs_client(max_pool_connections=pollers * 2),
+        queue_url,
+        fcm,
+        pollers=pollers,
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    try:
+        await worker.run(until_empty=until_empty)
+    finally:
+        await fcm.aclose()
+    return worker.stats
+
+
+class Command(BaseCommand):
+    help = "Deliver queued push notifications from SQS to FCM."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=settings.NOTIFICATION_WORKER_CONCURRENCY,
+            help="Maximum FCM requests in flight",
+        )
+        parser.add_argument(
+            "--pollers",
+            type=int,
+            default=None,
+            help="Concurrent SQS receive loops (defaults to concurrency / 10)",
+        )
+        parser.add_argument(
+            "--until-empty",
+            action="store_true",
+            help="Exit once the queue has no more messages",
+        )
+
+    def handle(self, *args, **options):
+        queue_url = settings.AWS_MEAL_REMINDER_QUEUE_URL
+        if not queue_url:
+            raise CommandError("SQS_QUEUE_URL is not configured.")
+
+        concurrency = options["concurrency"]
+        pollers = options["pollers"] or max(1, concurrency // 10)
+
+        self.stdout.write(
+            f"Consuming {queue_url} with {pollers} pollers, "
+            f"{concurrency} concurrent FCM requests"
+        )
+        stats = asyncio.run(
+            run_worker(queue_url, concurrency, pollers, options["until_empty"])
+        )
+        self.stdout.write(self.style.SUCCESS(f"Stopped. {stats.summary()}"))
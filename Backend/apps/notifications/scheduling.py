@@ -0,0 +1,52 @@
+"""
+Time-slot math for meal reminders.
+
+Beat ticks every SLOT_MINUTES. On each tick, a meal's reminder is due for the
+users whose local clock reads the meal's reminder time, i.e. for a handful of
+UTC offsets. Profile.utc_offset_minutes is indexed, so each tick queries only
+that slice instead of every user at once.
+"""
+
+import datetime
+
+SLOT_MINUTES = 15
+MINUTES_PER_DAY = 24 * 60
+
+# Real-world offsets span UTC-12:00 to UTC+14:00, all multiples of 15 minutes.
+MIN_UTC_OFFSET = -12 * 60
+MAX_UTC_OFFSET = 14 * 60
+
+
+def slot_start(moment: datetime.datetime) -> datetime.datetime:
+    return moment.replace(
+        minute=moment.minute - moment.minute % SLOT_MINUTES, second=0, microsecond=0
+    )
+
+
+def parse_local_time(value) -> datetime.time:
+    if isinstance(value, datetime.time):
+        return value
+    return datetime.time.fromisoformat(value)
+
+
+def offsets_due(now_utc: datetime.datetime, local_time) -> list:
+    """UTC offsets (minutes) whose local time is `local_time` in the slot that
+    contains `now_utc`. Usually one, two around the date line."""
+    local_time = parse_local_time(local_time)
+    utc_minute = slot_start(now_utc.astimezone(datetime.timezone.utc))
+    utc_minute = utc_minute.hour * 60 + utc_minute.minute
+    target = local_time.hour * 60 + local_time.minute
+
+    base = (target - utc_minute) % MINUTES_PER_DAY
+    return [
+        offset
+        for offset in (base - MINUTES_PER_DAY, base, base + MINUTES_PER_DAY)
+        if MIN_UTC_OFFSET <= offset <= MAX_UTC_OFFSET
+    ]
+
+
+def local_date(now_utc: datetime.datetime, offset_minutes: int) -> datetime.date:
+    return (
+        now_utc.astimezone(datetime.timezone.utc)
+        + datetime.timedelta(minutes=offset_minutes)
+    ).date()
@@ -1,84 +1,122 @@
 import json
 
-import boto3
 from celery import shared_task
 from django.conf import settings
-from django.contrib.auth import get_user_model
 from django.utils import timezone
 
+from apps.accounts.aws_utils import build_sqs_client
+from apps.profiles.models import Profile
 from apps.tracking.models import DailyLog
 
-User = get_user_model()
+from .delivery import SQS_MAX_BATCH
+from .scheduling import local_date, offsets_due
+
+
+def _queue_notifications(sqs, queue_url, payloads):
+    """Sends payloads with send_message_batch, 10 per request. Returns how many
+    SQS accepted."""
+    queued = 0
+    for start in range(0, len(payloads), SQS_MAX_BATCH):
+        entries = [
+            {"Id": str(index), "MessageBody": json.dumps(payload)}
+            for index, payload in enumerate(payloads[start : start + SQS_MAX_BATCH])
+        ]
+        response = sqs.send_message_batch(QueueUrl=queue_url, Entries=entries)
+        queued += len(response.get("Successful", []))
+        for failure in response.get("Failed", []):
+            print(f"Failed to queue notification: {failure}")
+    return queued
 
 
 @shared_task
-def check_missing_meals(meal_type):
-    today = timezone.now().date()
+def dispatch_meal_reminders():
+    """Runs every 15 minutes and fans out to the UTC offsets whose local time
+    has just reached a meal's reminder time."""
+    now = timezone.now()
+    # Answered from profile_reminder_offset_idx; skips offsets nobody is in.
+    populated = set(
+        Profile.objects.filter(fcm_token__isnull=False)
+        .values_list("utc_offset_minutes", flat=True)
+        .distinct()
+    )
+    dispatched = []
+    for meal_type, local_time in settings.MEAL_REMINDER_TIMES.items():
+        for offset in offsets_due(now, local_time):
+            if offset not in populated:
+                continue
+            check_missing_meals.delay(meal_type, offset)
+            dispatched.append(f"{meal_type}@{offset:+d}")
+    return f"Dispatched {dispatched}" if dispatched else "Nothing due"
+
+
+@shared_task
+def check_missing_meals(meal_type, utc_offset_minutes=None):
+    """Reminds users who haven't logged `meal_type` today.
+
+    With `utc_offset_minutes`, only users in that offset are checked, against
+    their own local date. Without it everyone is checked against the server's
+    date.
+    """
+    profiles = Profile.objects.filter(fcm_token__isnull=False, user__is_active=True)
+    if utc_offset_minutes is None:
+        today = timezone.localdate()
+    else:
+        today = local_date(timezone.now(), utc_offset_minutes)
+        profiles = profiles.filter(utc_offset_minutes=utc_offset_minutes)
 
     users_with_logs = DailyLog.objects.filter(
         date=today, meal_type=meal_type
     ).values_list("user_id", flat=True)
 
-    users_without_logs = User.objects.exclude(id__in=users_with_logs).filter(
-        is_active=True
+    recipients = (
+        profiles.exclude(fcm_token="")
+        .exclude(user_id__in=users_with_logs)
+        .values_list("user_id", "user__first_name", "fcm_token")
     )
 
-    sqs = boto3.client(
-        "sqs",
-        region_name=settings.AWS_REGION,
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+    payloads = [
+        {
+            "user_id": user_id,
+            "fcm_token": fcm_token,
+            "title": f"MyCalo AI: Don't forget your {meal_type.title()}!",
+            "body": (
+                f"Hey {first_name or 'there'}, it's time to log your "
+                f"{meal_type.lower()} to stay on track."
+            ),
+        }
+        for user_id, first_name, fcm_token in recipients
+    ]
+    if not payloads:
+        return f"No {meal_type} reminders due"
+
+    queued = _queue_notifications(
+        build_sqs_client(), settings.AWS_MEAL_REMINDER_QUEUE_URL, payloads
     )
-    queue_url = settings.AWS_MEAL_REMINDER_QUEUE_URL
-
-    for user in users_without_logs:
-
-        if hasattr(user, "profile") and user.profile.fcm_token:
-            fcm_token = user.profile.fcm_token
-
-            payload = {
-                "user_id": user.id,
-                "fcm_token": fcm_token,
-                "title": f"MyCalo AI: Don't forget your {meal_type.title()}!",
-                "body": f"Hey {user.first_name or 'there'}, it's time to log your {meal_type.lower()} to stay on track.",
-            }
-
-            sqs.send_message(QueueUrl=queue_url, MessageBody=json.dumps(payload))
-            print(f"Queued notification for User {user.id} regarding {meal_type}")
-        else:
-
-            continue
+    print(f"Queued {queued} {meal_type} reminders for {today}")
+    return f"Queued {queued} reminders"
 
 
 @shared_task
 def send_broadcast_notification(title, message):
-    User = get_user_model()
-
-    active_users = User.objects.filter(is_active=True).select_related("profile")
-
-    sqs = boto3.client(
-        "sqs",
-        region_name=settings.AWS_REGION,
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+    recipients = (
+        Profile.objects.filter(fcm_token__isnull=False, user__is_active=True)
+        .exclude(fcm_token="")
+        .values_list("user_id", "fcm_token")
     )
 
-    queue_url = settings.AWS_MEAL_REMINDER_QUEUE_URL
-
-    count = 0
-    for user in active_users:
-        if hasattr(user, "profile") and getattr(user.profile, "fcm_token", None):
-            fcm_token = user.profile.fcm_token
-
-            payload = {
-                "user_id": user.id,
-                "fcm_token": fcm_token,
-                "title": title,
-                "body": message,
-            }
-
-            sqs.send_message(QueueUrl=queue_url, MessageBody=json.dumps(payload))
-            count += 1
+    payloads = [
+        {
+            "user_id": user_id,
+            "fcm_token": fcm_token,
+            "title": title,
+            "body": message,
+        }
+        for user_id, fcm_token in recipients
+    ]
+
+    count = _queue_notifications(
+        build_sqs_client(), settings.AWS_MEAL_REMINDER_QUEUE_URL, payloads
+    )
 
     print(f"Queued broadcast notification for {count} users.")
     return f"Sent to {count} users"
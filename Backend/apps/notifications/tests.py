@@ -1,3 +1,128 @@
-from django.test import TestCase
+import asyncio
+import datetime
+import json
 
-# Create your tests here.
+import httpx
+import pytest
+from django.contrib.auth import get_user_model
+
+from apps.notifications.delivery import FCMClient, NotificationWorker
+from apps.notifications.scheduling import local_date, offsets_due
+
+User = get_user_model()
+
+
+class FakeSQS:
+    """Just enough of the boto3 SQS client for NotificationWorker."""
+
+    def __init__(self, payloads):
+        self.messages = [
+            {
+                "MessageId": str(index),
+                "ReceiptHandle": f"handle-{index}",
+                "Body": payload if isinstance(payload, str) else json.dumps(payload),
+            }
+            for index, payload in enumerate(payloads)
+        ]
+        self.deleted = []
+
+    def receive_message(self, QueueUrl, MaxNumberOfMessages, WaitTimeSeconds):
+        batch = self.messages[:MaxNumberOfMessages]
+        self.messages = self.messages[MaxNumberOfMessages:]
+        return {"Messages": batch} if batch else {}
+
+    def delete_message_batch(self, QueueUrl, Entries):
+        self.deleted.extend(entry["ReceiptHandle"] for entry in Entries)
+        return {"Successful": [{"Id": entry["Id"]} for entry in Entries]}
+
+
+def fake_fcm(request):
+    token = json.loads(request.content)["message"]["token"]
+    if token.startswith("dead-"):
+        return httpx.Response(
+            404, json={"error": {"details": [{"errorCode": "UNREGISTERED"}]}}
+        )
+    if token.startswith("busy-"):
+        return httpx.Response(503, json={"error": {"status": "UNAVAILABLE"}})
+    return httpx.Response(200, json={"name": "projects/test/messages/1"})
+
+
+def drain(payloads, concurrency=5):
+    sqs = FakeSQS(payloads)
+
+    async def run():
+        fcm = FCMClient("http://fcm.test", "test", concurrency=concurrency)
+        fcm.client = httpx.AsyncClient(transport=httpx.MockTransport(fake_fcm))
+        worker = NotificationWorker(sqs, "queue", fcm, pollers=2)
+        await worker.run(until_empty=True)
+        await fcm.aclose()
+        return worker.stats
+
+    return sqs, asyncio.run(run())
+
+
+def payload(token, user_id=1):
+    return {"user_id": user_id, "fcm_token": token, "title": "Hi", "body": "Log lunch"}
+
+
+@pytest.mark.django_db(transaction=True)
+class TestNotificationWorker:
+
+    def test_delivers_and_deletes_in_batches(self):
+        sqs, stats = drain([payload(f"token-{i}") for i in range(25)])
+
+        assert stats.sent == 25
+        assert stats.deleted == 25
+        assert len(sqs.deleted) == 25
+
+    def test_dead_tokens_are_pruned_and_deleted(self):
+        user = User.objects.create_user(
+            username="deadtoken", password="password", role="USER"
+        )
+        user.profile.fcm_token = "dead-123"
+        user.profile.save(update_fields=["fcm_token"])
+
+        sqs, stats = drain([payload("dead-123", user.id), payload("token-1")])
+
+        user.profile.refresh_from_db()
+        assert user.profile.fcm_token is None
+        assert stats.dead == 1
+        assert stats.sent == 1
+        assert len(sqs.deleted) == 2
+
+    def test_retryable_failures_stay_on_the_queue(self):
+        sqs, stats = drain([payload("busy-1"), payload("token-1")])
+
+        assert stats.retry == 1
+        assert sqs.deleted == ["handle-1"]
+
+    def test_malformed_messages_are_dropped(self):
+        sqs, stats = drain(["not json", {"fcm_token": "token-1"}])
+
+        assert stats.invalid == 2
+        assert len(sqs.deleted) == 2
+
+
+def utc(hour, minute=0):
+    return datetime.datetime(2026, 3, 2, hour, minute, tzinfo=datetime.timezone.utc)
+
+
+class TestReminderSlots:
+
+    def test_india_breakfast_slot(self):
+        # 11:00 in Asia/Kolkata (UTC+5:30) is 05:30 UTC.
+        assert offsets_due(utc(5, 30), "11:00") == [330]
+        assert offsets_due(utc(5, 44), "11:00") == [330]
+        assert 330 not in offsets_due(utc(5, 45), "11:00")
+
+    def test_quarter_hour_offsets(self):
+        # Nepal is UTC+5:45.
+        assert offsets_due(utc(5, 15), "11:00") == [345]
+
+    def test_both_sides_of_the_date_line(self):
+        # 22:00 at UTC-12 and 22:00 at UTC+12 are a day apart, same UTC hour.
+        assert offsets_due(utc(10), "22:00") == [-720, 720]
+
+    def test_local_date_follows_the_offset(self):
+        assert local_date(utc(22), 330) == datetime.date(2026, 3, 3)
+        assert local_date(utc(2), -300) == datetime.date(2026, 3, 1)
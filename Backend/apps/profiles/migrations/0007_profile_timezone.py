@@ -0,0 +1,42 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:32
+
+import apps.profiles.models
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles", "0006_remove_employeeprofile_updated_at_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="timezone",
+            field=models.CharField(
+                default="Asia/Kolkata",
+                help_text="IANA timezone used to time reminders, e.g. 'Europe/London'",
+                max_length=64,
+                validators=[apps.profiles.models.validate_timezone],
+            ),
+        ),
+        migrations.AddField(
+            model_name="profile",
+            name="utc_offset_minutes",
+            field=models.SmallIntegerField(
+                default=apps.profiles.models.default_utc_offset_minutes,
+                editable=False,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profile",
+            index=models.Index(
+                condition=models.Q(("fcm_token__isnull", False)),
+                fields=["utc_offset_minutes"],
+                name="profile_reminder_offset_idx",
+            ),
+        ),
+    ]
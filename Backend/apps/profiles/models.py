@@ -1,6 +1,26 @@
+import zoneinfo
+
 from cloudinary.models import CloudinaryField
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.db import models
+from django.utils import timezone
+
+
+def validate_timezone(value):
+    if value not in zoneinfo.available_timezones():
+        raise ValidationError(f"{value} is not a valid IANA timezone.")
+
+
+def utc_offset_minutes(tz_name, at=None):
+    """Current UTC offset of `tz_name` in minutes (e.g. 330 for Asia/Kolkata)."""
+    at = at or timezone.now()
+    offset = at.astimezone(zoneinfo.ZoneInfo(tz_name)).utcoffset()
+    return int(offset.total_seconds() // 60)
+
+
+def default_utc_offset_minutes():
+    return utc_offset_minutes(settings.TIME_ZONE)
 
 
 class Profile(models.Model):
@@ -23,6 +43,17 @@ class Profile(models.Model):
     )
 
     fcm_token = models.TextField(null=True, blank=True)
+    timezone = models.CharField(
+        max_length=64,
+        default=settings.TIME_ZONE,
+        validators=[validate_timezone],
+        help_text="IANA timezone used to time reminders, e.g. 'Europe/London'",
+    )
+    # Derived from `timezone` on save and refreshed hourly for DST changes, so a
+    # reminder tick can select its slice of users with one indexed equality.
+    utc_offset_minutes = models.SmallIntegerField(
+        default=default_utc_offset_minutes, editable=False
+    )
 
     name = models.CharField(max_length=120, blank=True, default="")
     photo = CloudinaryField("image", blank=True, null=True)
@@ -51,6 +82,15 @@ class Profile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["utc_offset_minutes"],
+                condition=models.Q(fcm_token__isnull=False),
+                name="profile_reminder_offset_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.user.username}'s Profile"
 
@@ -27,6 +27,7 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
             "carbs_goal",
             "fats_goal",
             "fcm_token",
+            "timezone",
         ]
         read_only_fields = [
             "daily_calorie_goal",
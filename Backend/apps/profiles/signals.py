@@ -2,7 +2,7 @@ from django.conf import settings
 from django.db.models.signals import post_save, pre_save
 from django.dispatch import receiver
 
-from .models import Profile
+from .models import Profile, utc_offset_minutes
 
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
@@ -11,6 +11,11 @@ def create_user_profile(sender, instance, created, **kwargs):
         Profile.objects.create(user=instance)
 
 
+@receiver(pre_save, sender=Profile)
+def sync_utc_offset(sender, instance, **kwargs):
+    instance.utc_offset_minutes = utc_offset_minutes(instance.timezone)
+
+
 @receiver(pre_save, sender=Profile)
 def calculate_nutrition_goals(sender, instance, **kwargs):
     if instance.weight and instance.height and instance.age and instance.gender:
@@ -0,0 +1,20 @@
+from celery import shared_task
+from django.db.models import Q
+
+from .models import Profile, utc_offset_minutes
+
+
+@shared_task
+def refresh_utc_offsets():
+    """Re-derives Profile.utc_offset_minutes after DST transitions. One UPDATE
+    per timezone whose offset changed; a no-op most hours."""
+    updated = 0
+    timezones = Profile.objects.values_list("timezone", flat=True).distinct()
+    for tz_name in timezones:
+        offset = utc_offset_minutes(tz_name)
+        updated += Profile.objects.filter(
+            Q(timezone=tz_name) & ~Q(utc_offset_minutes=offset)
+        ).update(utc_offset_minutes=offset)
+
+    print(f"Refreshed UTC offsets for {updated} profiles")
+    return f"Updated {updated} profiles"
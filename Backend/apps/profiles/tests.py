@@ -86,3 +86,32 @@ class TestProfileSignalLogic:
         )
 
         assert Profile.objects.filter(user=doctor).exists() == False
+
+
+@pytest.mark.django_db
+class TestProfileUtcOffset:
+
+    def test_offset_follows_timezone_on_save(self):
+        user = User.objects.create_user(
+            username="tz_user", password="password", role="USER"
+        )
+        profile = user.profile
+
+        profile.timezone = "Asia/Tokyo"
+        profile.save()
+
+        profile.refresh_from_db()
+        assert profile.utc_offset_minutes == 540
+
+    def test_default_offset_comes_from_default_timezone(self, settings):
+        # bulk_create skips the pre_save signal, so only the field default applies.
+        settings.TIME_ZONE = "America/Sao_Paulo"
+        user = User.objects.create_user(
+            username="bulk_user", password="password", role="DOCTOR"
+        )
+
+        (profile,) = Profile.objects.bulk_create(
+            [Profile(user=user, timezone=settings.TIME_ZONE)]
+        )
+
+        assert profile.utc_offset_minutes == -180
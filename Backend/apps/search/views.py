@@ -5,6 +5,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.accounts.authentication import StatelessJWTAuthentication
 from apps.exercises.models import Exercise
 from apps.exercises.serializers import ExerciseSerializer
 from apps.foods.models import FoodItem
@@ -14,6 +15,7 @@ from apps.foods.serializers import FoodItemSerializer
 # Create your views here.
 class GlobalSearchView(APIView):
     permission_classes = [IsAuthenticated]
+    authentication_classes = [StatelessJWTAuthentication]
 
     @swagger_auto_schema(
         manual_parameters=[
@@ -53,6 +55,7 @@ class GlobalSearchView(APIView):
                     Q(name__icontains=query) | Q(brand__icontains=query)
                 )
                 .filter(name__icontains=query)
+                .prefetch_related("images")
                 .distinct()[:LIMIT]
             )
 
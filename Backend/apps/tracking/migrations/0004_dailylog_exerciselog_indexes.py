@@ -0,0 +1,41 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:19
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY keeps the log tables writable while it builds.
+    atomic = False
+
+    dependencies = [
+        ("exercises", "0001_initial"),
+        ("foods", "0005_foodvote"),
+        ("tracking", "0003_exerciselog"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="dailylog",
+            index=models.Index(
+                fields=["user", "-date", "-created_at"], name="dailylog_user_date_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="dailylog",
+            index=models.Index(
+                fields=["date", "meal_type"],
+                include=("user",),
+                name="dailylog_date_meal_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="exerciselog",
+            index=models.Index(
+                fields=["user", "-date", "-created_at"],
+                name="exerciselog_user_date_idx",
+            ),
+        ),
+    ]
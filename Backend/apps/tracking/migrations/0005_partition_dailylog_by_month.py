@@ -0,0 +1,152 @@
+"""
+Turns tracking_dailylog into a table range-partitioned by month on `date`.
+
+Existing rows are copied into the partitioned table inside the migration's
+transaction, so the table is locked for the duration of the copy. Run it in a
+maintenance window on large databases. Only Postgres is affected; the Django
+model state does not change.
+"""
+
+import datetime
+
+from django.conf import settings
+from django.db import migrations
+
+from apps.tracking.partitions import (
+    DEFAULT_PARTITION,
+    PARENT_TABLE,
+    PARTITION_INDEXES,
+    add_months,
+    ensure_default_partition,
+    ensure_partitions,
+    month_start,
+)
+
+LEGACY_TABLE = f"{PARENT_TABLE}_legacy"
+ID_SEQUENCE = f"{PARENT_TABLE}_pk_seq"
+
+# Older rows than this stay in the default partition instead of getting one
+# tiny partition per month.
+MAX_BACKFILL_MONTHS = 36
+
+PARENT_INDEX_NAMES = {
+    "user_date_idx": "dailylog_user_date_idx",
+    "date_meal_idx": "dailylog_date_meal_idx",
+    "food_item_idx": "tracking_dailylog_food_item_idx",
+}
+
+
+def _foreign_keys(apps):
+    user_table = apps.get_model(settings.AUTH_USER_MODEL)._meta.db_table
+    food_table = apps.get_model("foods", "FoodItem")._meta.db_table
+    return [
+        ("tracking_dailylog_user_id_fk", "user_id", user_table),
+        ("tracking_dailylog_food_item_id_fk", "food_item_id", food_table),
+    ]
+
+
+def _add_foreign_keys(cursor, apps, table):
+    for name, column, target in _foreign_keys(apps):
+        cursor.execute(
+            f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" FOREIGN KEY ("{column}") '
+            f'REFERENCES "{target}" ("id") DEFERRABLE INITIALLY DEFERRED'
+        )
+
+
+def _sync_sequence(cursor, table):
+    cursor.execute(
+        f"SELECT setval('{ID_SEQUENCE}', COALESCE(MAX(id), 0) + 1, false) "
+        f'FROM "{table}"'
+    )
+
+
+def partition_dailylog(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" RENAME TO "{LEGACY_TABLE}"')
+
+        cursor.execute(f'CREATE SEQUENCE "{ID_SEQUENCE}"')
+        cursor.execute(
+            f'CREATE TABLE "{PARENT_TABLE}" (LIKE "{LEGACY_TABLE}" INCLUDING DEFAULTS) '
+            f"PARTITION BY RANGE (date)"
+        )
+        cursor.execute(
+            f'ALTER TABLE "{PARENT_TABLE}" '
+            f"ALTER COLUMN id SET DEFAULT nextval('{ID_SEQUENCE}')"
+        )
+        cursor.execute(f'ALTER SEQUENCE "{ID_SEQUENCE}" OWNED BY "{PARENT_TABLE}".id')
+        # The partition key has to be part of the primary key.
+        cursor.execute(
+            f'ALTER TABLE "{PARENT_TABLE}" ADD CONSTRAINT "{PARENT_TABLE}_pkey_date" '
+            f"PRIMARY KEY (id, date)"
+        )
+        _add_foreign_keys(cursor, apps, PARENT_TABLE)
+
+        # The legacy indexes still own these names.
+        for suffix in PARTITION_INDEXES:
+            cursor.execute(f'DROP INDEX IF EXISTS "{PARENT_INDEX_NAMES[suffix]}"')
+        for suffix, definition in PARTITION_INDEXES.items():
+            cursor.execute(
+                f'CREATE INDEX "{PARENT_INDEX_NAMES[suffix]}" '
+                f'ON "{PARENT_TABLE}" {definition}'
+            )
+
+        today = datetime.date.today()
+        cursor.execute(f'SELECT MIN(date) FROM "{LEGACY_TABLE}"')
+        oldest = cursor.fetchone()[0] or today
+        first_month = max(
+            month_start(oldest), add_months(month_start(today), -MAX_BACKFILL_MONTHS)
+        )
+        last_month = add_months(
+            month_start(today), settings.DAILYLOG_PARTITION_MONTHS_AHEAD
+        )
+        ensure_default_partition(cursor)
+        ensure_partitions(cursor, first_month, last_month)
+
+        cursor.execute(
+            f'INSERT INTO "{PARENT_TABLE}" SELECT * FROM "{LEGACY_TABLE}"'
+        )
+        _sync_sequence(cursor, PARENT_TABLE)
+        cursor.execute(f'DROP TABLE "{LEGACY_TABLE}"')
+
+
+def unpartition_dailylog(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" RENAME TO "{LEGACY_TABLE}"')
+        cursor.execute(
+            f'CREATE TABLE "{PARENT_TABLE}" (LIKE "{LEGACY_TABLE}" INCLUDING DEFAULTS)'
+        )
+        cursor.execute(f'ALTER SEQUENCE "{ID_SEQUENCE}" OWNED BY "{PARENT_TABLE}".id')
+        cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" ADD PRIMARY KEY (id)')
+
+        cursor.execute(
+            f'INSERT INTO "{PARENT_TABLE}" SELECT * FROM "{LEGACY_TABLE}"'
+        )
+        _sync_sequence(cursor, PARENT_TABLE)
+        cursor.execute(f'DROP TABLE "{LEGACY_TABLE}" CASCADE')
+        cursor.execute(f'DROP TABLE IF EXISTS "{DEFAULT_PARTITION}"')
+
+        _add_foreign_keys(cursor, apps, PARENT_TABLE)
+        for suffix, definition in PARTITION_INDEXES.items():
+            cursor.execute(
+                f'CREATE INDEX "{PARENT_INDEX_NAMES[suffix]}" '
+                f'ON "{PARENT_TABLE}" {definition}'
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("foods", "0005_foodvote"),
+        ("tracking", "0004_dailylog_exerciselog_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_dailylog, unpartition_dailylog),
+    ]
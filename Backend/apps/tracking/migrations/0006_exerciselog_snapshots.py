@@ -0,0 +1,27 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tracking", "0005_partition_dailylog_by_month"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exerciselog",
+            name="burned_calories",
+            field=models.PositiveIntegerField(
+                blank=True, help_text="kcal burned (MET x weight x hours)", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="exerciselog",
+            name="user_weight",
+            field=models.FloatField(
+                blank=True, help_text="Weight in KG used for burned_calories", null=True
+            ),
+        ),
+    ]
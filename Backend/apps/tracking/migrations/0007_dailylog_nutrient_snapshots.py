@@ -0,0 +1,61 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tracking", "0006_exerciselog_snapshots"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dailylog",
+            name="calories",
+            field=models.PositiveIntegerField(
+                blank=True, help_text="kcal for this serving", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="dailylog",
+            name="carbohydrates",
+            field=models.FloatField(
+                blank=True, help_text="Carbohydrates in grams", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="dailylog",
+            name="cholesterol",
+            field=models.FloatField(
+                blank=True, help_text="Cholesterol in mg", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="dailylog",
+            name="fat",
+            field=models.FloatField(blank=True, help_text="Fat in grams", null=True),
+        ),
+        migrations.AddField(
+            model_name="dailylog",
+            name="fiber",
+            field=models.FloatField(blank=True, help_text="Fiber in grams", null=True),
+        ),
+        migrations.AddField(
+            model_name="dailylog",
+            name="protein",
+            field=models.FloatField(
+                blank=True, help_text="Protein in grams", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="dailylog",
+            name="sodium",
+            field=models.FloatField(blank=True, help_text="Sodium in mg", null=True),
+        ),
+        migrations.AddField(
+            model_name="dailylog",
+            name="sugar",
+            field=models.FloatField(blank=True, help_text="Sugar in grams", null=True),
+        ),
+    ]
@@ -0,0 +1,67 @@
+"""
+Fills the nutrient snapshot columns added in 0007 for logs written before it,
+scaled from each food's current values. Until then those rows count as 0 in
+the dashboard, daily summary and AI totals, which SUM the columns.
+
+The scaling is frozen here as DailyLog.snapshot_nutrients was when 0007 was
+written, so later changes to the model can't change what this migration does.
+
+Runs outside a transaction in chunks, each committed on its own, so a large
+table isn't locked for the whole backfill and an interrupted run resumes where
+it stopped.
+"""
+
+from django.db import migrations
+
+BATCH_SIZE = 2000
+
+DECIMAL_FIELDS = (
+    "protein",
+    "carbohydrates",
+    "fat",
+    "fiber",
+    "sugar",
+    "sodium",
+    "cholesterol",
+)
+
+
+def snapshot(log):
+    food = log.food_item
+    grams = log.user_serving_grams
+    ratio = grams / 100.0 if grams > 0 else 0
+
+    log.calories = round(food.calories * ratio)
+    for field in DECIMAL_FIELDS:
+        setattr(log, field, round(float(getattr(food, field)) * ratio, 1))
+
+
+def backfill_snapshots(apps, schema_editor):
+    DailyLog = apps.get_model("tracking", "DailyLog")
+
+    pending = DailyLog.objects.filter(calories__isnull=True).select_related("food_item")
+    last_id = 0
+    while True:
+        # Keyset pagination on id: every chunk is an index range scan, and
+        # rows updated by an earlier chunk are never read again.
+        logs = list(pending.filter(pk__gt=last_id).order_by("pk")[:BATCH_SIZE])
+        if not logs:
+            break
+
+        for log in logs:
+            snapshot(log)
+        DailyLog.objects.bulk_update(logs, ("calories", *DECIMAL_FIELDS))
+        last_id = logs[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("tracking", "0007_dailylog_nutrient_snapshots"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_snapshots, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,77 @@
+"""
+Fills ExerciseLog.user_weight and burned_calories, added in 0006, for logs
+written before it, using each user's current profile weight. Until then those
+rows count as 0 in the daily summary and dashboard, which SUM burned_calories.
+
+The formula (MET x kg x hours, 70 kg when the profile has no weight) is frozen
+here as ExerciseLog.save had it when 0006 was written.
+
+Runs outside a transaction in chunks, each committed on its own, so a large
+table isn't locked for the whole backfill and an interrupted run resumes where
+it stopped.
+"""
+
+from django.db import migrations
+from django.db.models import F, FloatField, OuterRef, Subquery, Value
+from django.db.models.functions import Cast, Coalesce, NullIf, Round
+
+BATCH_SIZE = 5000
+DEFAULT_USER_WEIGHT = 70.0
+
+
+def backfill_snapshots(apps, schema_editor):
+    Exercise = apps.get_model("exercises", "Exercise")
+    ExerciseLog = apps.get_model("tracking", "ExerciseLog")
+    Profile = apps.get_model("profiles", "Profile")
+
+    user_weight = Coalesce(
+        NullIf(
+            Subquery(
+                Profile.objects.filter(user_id=OuterRef("user_id")).values("weight")[:1]
+            ),
+            Value(0.0),
+        ),
+        Value(DEFAULT_USER_WEIGHT),
+    )
+    met_value = Subquery(
+        Exercise.objects.filter(pk=OuterRef("exercise_id")).values("met_value")[:1]
+    )
+
+    pending = ExerciseLog.objects.filter(burned_calories__isnull=True)
+    last_id = 0
+    while True:
+        ids = list(
+            pending.filter(pk__gt=last_id)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:BATCH_SIZE]
+        )
+        if not ids:
+            break
+
+        # Two statements: burned_calories reads the weight written by the first.
+        batch = ExerciseLog.objects.filter(pk__in=ids)
+        batch.filter(user_weight__isnull=True).update(user_weight=user_weight)
+        batch.update(
+            burned_calories=Round(
+                Cast(met_value, FloatField())
+                * F("user_weight")
+                * F("duration_minutes")
+                / 60.0
+            )
+        )
+        last_id = ids[-1]
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("exercises", "0001_initial"),
+        ("profiles", "0007_profile_timezone"),
+        ("tracking", "0008_backfill_dailylog_nutrient_snapshots"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_snapshots, migrations.RunPython.noop),
+    ]
@@ -5,6 +5,19 @@ from django.utils import timezone
 from apps.exercises.models import Exercise
 from apps.foods.models import FoodItem
 
+from .utils import get_user_weight
+
+SNAPSHOT_DECIMAL_FIELDS = (
+    "protein",
+    "carbohydrates",
+    "fat",
+    "fiber",
+    "sugar",
+    "sodium",
+    "cholesterol",
+)
+SNAPSHOT_FIELDS = ("calories", *SNAPSHOT_DECIMAL_FIELDS)
+
 
 class DailyLog(models.Model):
     MEAL_TYPES = (
@@ -25,17 +38,79 @@ class DailyLog(models.Model):
     meal_type = models.CharField(max_length=20, choices=MEAL_TYPES)
     date = models.DateField(default=timezone.now)
 
+    # Nutrients for this serving, scaled from the FoodItem when the log is
+    # written. Later edits to the food don't rewrite history, and totals are a
+    # plain SUM without joining foods_fooditem.
+    calories = models.PositiveIntegerField(
+        null=True, blank=True, help_text="kcal for this serving"
+    )
+    protein = models.FloatField(null=True, blank=True, help_text="Protein in grams")
+    carbohydrates = models.FloatField(
+        null=True, blank=True, help_text="Carbohydrates in grams"
+    )
+    fat = models.FloatField(null=True, blank=True, help_text="Fat in grams")
+    fiber = models.FloatField(null=True, blank=True, help_text="Fiber in grams")
+    sugar = models.FloatField(null=True, blank=True, help_text="Sugar in grams")
+    sodium = models.FloatField(null=True, blank=True, help_text="Sodium in mg")
+    cholesterol = models.FloatField(
+        null=True, blank=True, help_text="Cholesterol in mg"
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-date", "-created_at"]
+        indexes = [
+            # Per-user day/range lookups, already in default ordering (no sort).
+            models.Index(
+                fields=["user", "-date", "-created_at"], name="dailylog_user_date_idx"
+            ),
+            # Meal reminders: who logged a meal on a date, answered from the index.
+            models.Index(
+                fields=["date", "meal_type"],
+                include=["user"],
+                name="dailylog_date_meal_idx",
+            ),
+        ]
 
     def __str__(self):
         return (
             f"{self.user.username} - {self.food_item.name} - {self.user_serving_grams}g"
         )
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_source = (
+            instance.__dict__.get("food_item_id"),
+            instance.__dict__.get("user_serving_grams"),
+        )
+        return instance
+
+    def snapshot_nutrients(self):
+        """Copies the FoodItem's per-100g values scaled to this serving, rounded
+        the way DailyLogSerializer shows them."""
+        food = self.food_item
+        grams = self.user_serving_grams
+        ratio = grams / 100.0 if grams > 0 else 0
+
+        self.calories = round(food.calories * ratio)
+        for field in SNAPSHOT_DECIMAL_FIELDS:
+            setattr(self, field, round(float(getattr(food, field)) * ratio, 1))
+
+    def save(self, *args, **kwargs):
+        # Only re-scaled when the serving itself changes, so edits to the food
+        # afterwards leave logged days as they were.
+        source = (self.food_item_id, self.user_serving_grams)
+        if self.calories is None or source != getattr(self, "_snapshot_source", None):
+            self.snapshot_nutrients()
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, *SNAPSHOT_FIELDS}
+        super().save(*args, **kwargs)
+        self._snapshot_source = source
+
 
 class ExerciseLog(models.Model):
     user = models.ForeignKey(
@@ -47,11 +122,46 @@ class ExerciseLog(models.Model):
     )
     date = models.DateField(default=timezone.now)
 
+    # Snapshot taken when the log is written, so history doesn't shift when the
+    # user's weight changes and totals are a plain SUM.
+    user_weight = models.FloatField(
+        null=True, blank=True, help_text="Weight in KG used for burned_calories"
+    )
+    burned_calories = models.PositiveIntegerField(
+        null=True, blank=True, help_text="kcal burned (MET x weight x hours)"
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-date", "-created_at"]
+        indexes = [
+            models.Index(
+                fields=["user", "-date", "-created_at"],
+                name="exerciselog_user_date_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.exercise.name} ({self.duration_minutes}m)"
+
+    def save(self, *args, **kwargs):
+        if self.user_weight is None:
+            self.user_weight = get_user_weight(self.user_id)
+        # Recomputed on every save (duration or exercise may have changed), but
+        # always with the weight captured when the log was first written.
+        self.burned_calories = round(
+            float(self.exercise.met_value)
+            * self.user_weight
+            * (self.duration_minutes / 60)
+        )
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {
+                *update_fields,
+                "user_weight",
+                "burned_calories",
+            }
+        super().save(*args, **kwargs)
@@ -0,0 +1,159 @@
+"""
+Monthly range partitioning of tracking_dailylog (Postgres only).
+
+The parent table is partitioned by `date`. Each month lives in
+`tracking_dailylog_pYYYY_MM`, and anything outside the created months falls
+into `tracking_dailylog_default` until its month gets a partition of its own.
+"""
+
+import datetime
+import re
+
+from django.db import connection
+
+PARENT_TABLE = "tracking_dailylog"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+ARCHIVE_PREFIX = f"{PARENT_TABLE}_archive_"
+
+_PARTITION_RE = re.compile(rf"^{PARENT_TABLE}_p(\d{{4}})_(\d{{2}})$")
+
+# Index suffix -> definition. The parent gets the same definitions (see
+# 0005_partition_dailylog_by_month), so ATTACH PARTITION adopts these instead
+# of building new ones, and every partition's indexes have predictable names.
+PARTITION_INDEXES = {
+    "user_date_idx": "(user_id, date DESC, created_at DESC)",
+    "date_meal_idx": "(date, meal_type) INCLUDE (user_id)",
+    "food_item_idx": "(food_item_id)",
+}
+
+
+def month_start(day: datetime.date) -> datetime.date:
+    return day.replace(day=1)
+
+
+def add_months(day: datetime.date, months: int) -> datetime.date:
+    month_index = day.year * 12 + day.month - 1 + months
+    return datetime.date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def partition_name(month: datetime.date) -> str:
+    return f"{PARENT_TABLE}_p{month.year:04d}_{month.month:02d}"
+
+
+def is_partitioned(cursor) -> bool:
+    if connection.vendor != "postgresql":
+        return False
+    cursor.execute(
+        """
+        SELECT EXISTS (
+            SELECT 1 FROM pg_partitioned_table pt
+            JOIN pg_class c ON c.oid = pt.partrelid
+            WHERE c.relname = %s AND pg_table_is_visible(c.oid)
+        )
+        """,
+        [PARENT_TABLE],
+    )
+    return cursor.fetchone()[0]
+
+
+def list_month_partitions(cursor) -> list:
+    """Months (first day) that currently have an attached partition, sorted."""
+    cursor.execute(
+        """
+        SELECT child.relname FROM pg_inherits i
+        JOIN pg_class parent ON parent.oid = i.inhparent
+        JOIN pg_class child ON child.oid = i.inhrelid
+        WHERE parent.relname = %s AND pg_table_is_visible(parent.oid)
+        """,
+        [PARENT_TABLE],
+    )
+    months = []
+    for (name,) in cursor.fetchall():
+        match = _PARTITION_RE.match(name)
+        if match:
+            months.append(datetime.date(int(match[1]), int(match[2]), 1))
+    return sorted(months)
+
+
+def _create_partition_table(cursor, name: str):
+    # ATTACH PARTITION requires every CHECK constraint of the parent (e.g. the
+    # ones PositiveIntegerField columns get) to exist on the child by name.
+    cursor.execute(
+        f'CREATE TABLE "{name}" '
+        f'(LIKE "{PARENT_TABLE}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+    )
+    for suffix, definition in PARTITION_INDEXES.items():
+        cursor.execute(f'CREATE INDEX "{name}_{suffix}" ON "{name}" {definition}')
+
+
+def ensure_default_partition(cursor):
+    cursor.execute("SELECT to_regclass(%s)", [DEFAULT_PARTITION])
+    if cursor.fetchone()[0]:
+        return False
+    _create_partition_table(cursor, DEFAULT_PARTITION)
+    cursor.execute(
+        f'ALTER TABLE "{PARENT_TABLE}" ATTACH PARTITION "{DEFAULT_PARTITION}" DEFAULT'
+    )
+    return True
+
+
+def ensure_month_partition(cursor, month: datetime.date) -> bool:
+    """Creates the partition for `month` if missing. Returns True if created.
+
+    Rows for that month already sitting in the default partition are moved
+    into the new partition first, otherwise ATTACH would reject the range.
+    """
+    month = month_start(month)
+    name = partition_name(month)
+    cursor.execute("SELECT to_regclass(%s)", [name])
+    if cursor.fetchone()[0]:
+        return False
+
+    start, end = month, add_months(month, 1)
+    _create_partition_table(cursor, name)
+
+    cursor.execute("SELECT to_regclass(%s)", [DEFAULT_PARTITION])
+    if cursor.fetchone()[0]:
+        cursor.execute(
+            f'WITH moved AS (DELETE FROM "{DEFAULT_PARTITION}" '
+            f"WHERE date >= %s AND date < %s RETURNING *) "
+            f'INSERT INTO "{name}" SELECT * FROM moved',
+            [start, end],
+        )
+
+    cursor.execute(
+        f'ALTER TABLE "{PARENT_TABLE}" ATTACH PARTITION "{name}" '
+        f"FOR VALUES FROM (%s) TO (%s)",
+        [start, end],
+    )
+    return True
+
+
+def ensure_partitions(cursor, first_month: datetime.date, last_month: datetime.date):
+    """Creates every missing monthly partition from first_month to last_month."""
+    created = []
+    month = month_start(first_month)
+    while month <= month_start(last_month):
+        if ensure_month_partition(cursor, month):
+            created.append(partition_name(month))
+        month = add_months(month, 1)
+    return created
+
+
+def detach_partitions_before(cursor, cutoff_month: datetime.date):
+    """Detaches monthly partitions that end on or before `cutoff_month` and
+    renames them to tracking_dailylog_archive_YYYY_MM.
+
+    The archived tables keep their rows and can be dumped or dropped by hand;
+    they are no longer visible through DailyLog.
+    """
+    detached = []
+    for month in list_month_partitions(cursor):
+        if add_months(month, 1) > month_start(cutoff_month):
+            continue
+        name = partition_name(month)
+        archive = f"{ARCHIVE_PREFIX}{month.year:04d}_{month.month:02d}"
+        cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" DETACH PARTITION "{name}"')
+        cursor.execute(f'ALTER TABLE "{name}" RENAME TO "{archive}"')
+        detached.append(archive)
+    return detached
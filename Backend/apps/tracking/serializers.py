@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from .models import DailyLog, ExerciseLog
+from .utils import get_user_weight
 
 
 class DailyLogSerializer(serializers.ModelSerializer):
@@ -25,24 +26,23 @@ class DailyLogSerializer(serializers.ModelSerializer):
 
     def get_food_details(self, obj):
         food = obj.food_item
-        grams = obj.user_serving_grams
 
-        if grams <= 0:
-            ratio = 0
-        else:
-            ratio = grams / 100.0
+        # Snapshotted on save; rows from before the backfill are scaled from the
+        # food's current values.
+        if obj.calories is None:
+            obj.snapshot_nutrients()
 
         return {
             "name": food.name,
             "brand": food.brand,
-            "calories": round(food.calories * ratio),
-            "protein": round(float(food.protein) * ratio, 1),
-            "carbohydrates": round(float(food.carbohydrates) * ratio, 1),
-            "fat": round(float(food.fat) * ratio, 1),
-            "fiber": round(float(food.fiber) * ratio, 1),
-            "sugar": round(float(food.sugar) * ratio, 1),
-            "sodium": round(float(food.sodium) * ratio, 1),
-            "cholesterol": round(float(food.cholesterol) * ratio, 1),
+            "calories": obj.calories,
+            "protein": obj.protein,
+            "carbohydrates": obj.carbohydrates,
+            "fat": obj.fat,
+            "fiber": obj.fiber,
+            "sugar": obj.sugar,
+            "sodium": obj.sodium,
+            "cholesterol": obj.cholesterol,
         }
 
 
@@ -63,17 +63,27 @@ class ExerciseLogSerializer(serializers.ModelSerializer):
             "date": {"write_only": True},
         }
 
+    def _get_user_weight(self, obj):
+        """Weight from context when the view resolved it, otherwise looked up
+        once per user and remembered for the rest of the serialization."""
+        if "user_weight" in self.context:
+            return self.context["user_weight"]
+        weights = self.context.setdefault("user_weights", {})
+        if obj.user_id not in weights:
+            weights[obj.user_id] = get_user_weight(obj.user_id)
+        return weights[obj.user_id]
+
     def get_exercise_details(self, obj):
         exercise = obj.exercise
         duration = obj.duration_minutes
 
-        user_weight = 70.0
-        if hasattr(obj.user, "profile") and obj.user.profile.weight:
-            user_weight = float(obj.user.profile.weight)
-
-        burned_calories = round(
-            float(exercise.met_value) * user_weight * (duration / 60)
-        )
+        # Snapshotted on save; rows from before the backfill fall back to the
+        # current weight.
+        burned_calories = obj.burned_calories
+        if burned_calories is None:
+            burned_calories = round(
+                float(exercise.met_value) * self._get_user_weight(obj) * (duration / 60)
+            )
 
         return {
             "log_id": obj.id,
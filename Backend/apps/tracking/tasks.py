@@ -0,0 +1,43 @@
+from celery import shared_task
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .partitions import (
+    add_months,
+    detach_partitions_before,
+    ensure_default_partition,
+    ensure_partitions,
+    is_partitioned,
+    month_start,
+)
+
+
+@shared_task
+def maintain_dailylog_partitions():
+    """Keeps monthly DailyLog partitions created ahead of time and, if a
+    retention period is configured, detaches the ones that fell out of it."""
+    current_month = month_start(timezone.now().date())
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        if not is_partitioned(cursor):
+            return "tracking_dailylog is not partitioned"
+
+        ensure_default_partition(cursor)
+        created = ensure_partitions(
+            cursor,
+            current_month,
+            add_months(current_month, settings.DAILYLOG_PARTITION_MONTHS_AHEAD),
+        )
+
+        detached = []
+        if settings.DAILYLOG_PARTITION_RETENTION_MONTHS:
+            detached = detach_partitions_before(
+                cursor,
+                add_months(
+                    current_month, -settings.DAILYLOG_PARTITION_RETENTION_MONTHS
+                ),
+            )
+
+    print(f"DailyLog partitions created: {created}, detached: {detached}")
+    return f"Created {len(created)}, detached {len(detached)}"
@@ -1,3 +1,483 @@
-from django.test import TestCase
+import datetime
 
-# Create your tests here.
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from rest_framework.test import APIClient
+
+from apps.exercises.models import Exercise
+from apps.foods.models import FoodItem
+from apps.tracking.models import DailyLog, ExerciseLog
+from apps.tracking.partitions import (
+    DEFAULT_PARTITION,
+    add_months,
+    ensure_month_partition,
+    ensure_partitions,
+    is_partitioned,
+    month_start,
+    partition_name,
+)
+
+User = get_user_model()
+
+OTHER_USERS = 20
+
+pytestmark = pytest.mark.django_db
+
+postgres_only = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="EXPLAIN plans are Postgres-specific"
+)
+
+
+@pytest.fixture
+def seeded_logs():
+    user = User.objects.create_user(
+        username="indexuser",
+        email="indexuser@example.com",
+        password="password",
+        role="USER",
+    )
+    # Enough other users that user_id is selective, as in production; with one
+    # other user the planner rightly prefers scanning a whole day by date.
+    others = User.objects.bulk_create(
+        User(username=f"indexother{n}", email=f"indexother{n}@example.com")
+        for n in range(OTHER_USERS)
+    )
+    food = FoodItem.objects.create(
+        name="Oats",
+        serving_size="100g",
+        calories=389,
+        protein=17,
+        carbohydrates=66,
+        fat=7,
+    )
+    exercise = Exercise.objects.create(name="Running", met_value=9.8)
+
+    today = datetime.date.today()
+    with connection.cursor() as cursor:
+        if is_partitioned(cursor):
+            # Months outside the migration's window would land in the default
+            # partition; give the seeded range (and one older month) their own.
+            ensure_partitions(
+                cursor, add_months(month_start(today), -3), month_start(today)
+            )
+
+    logs, exercise_logs = [], []
+    for offset in range(40):
+        day = today - datetime.timedelta(days=offset)
+        for owner in (user, *others):
+            for meal_type in ("BREAKFAST", "LUNCH", "DINNER"):
+                logs.append(
+                    DailyLog(user=owner, food_item=food, meal_type=meal_type, date=day)
+                )
+            exercise_logs.append(ExerciseLog(user=owner, exercise=exercise, date=day))
+    DailyLog.objects.bulk_create(logs)
+    ExerciseLog.objects.bulk_create(exercise_logs)
+
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE tracking_dailylog")
+        cursor.execute("ANALYZE tracking_exerciselog")
+    return user, today
+
+
+def explain(queryset, **planner_settings):
+    """EXPLAIN a queryset with sequential scans made prohibitively expensive.
+
+    Postgres still picks a seq scan when no index can serve the query, so the
+    plan only avoids one if a matching index exists. Tables this small would
+    otherwise always be scanned sequentially. When tracking_dailylog is
+    partitioned the plan names per-partition indexes, which share the parent
+    index's suffix (e.g. tracking_dailylog_p2026_03_user_date_idx).
+    """
+    planner_settings = {"enable_seqscan": "off", **planner_settings}
+    with connection.cursor() as cursor:
+        for name, value in planner_settings.items():
+            cursor.execute(f"SET LOCAL {name} = {value}")
+    return queryset.explain()
+
+
+@postgres_only
+class TestDailyLogQueryPlans:
+
+    def test_daily_list_uses_user_date_index(self, seeded_logs):
+        user, today = seeded_logs
+        plan = explain(
+            DailyLog.objects.filter(user=user, date=today).select_related("food_item")
+        )
+
+        assert "Seq Scan on tracking_dailylog" not in plan
+        assert "user_date_idx" in plan
+
+    def test_daily_list_ordering_needs_no_sort(self, seeded_logs):
+        user, today = seeded_logs
+        plan = explain(
+            DailyLog.objects.filter(user=user, date=today), enable_bitmapscan="off"
+        )
+
+        assert "user_date_idx" in plan
+        assert "Sort" not in plan
+
+    def test_dashboard_range_uses_user_date_index(self, seeded_logs):
+        user, today = seeded_logs
+        plan = explain(
+            DailyLog.objects.filter(
+                user=user,
+                date__gte=today - datetime.timedelta(days=30),
+                date__lte=today,
+            )
+        )
+
+        assert "Seq Scan on tracking_dailylog" not in plan
+        assert "user_date_idx" in plan
+
+    def test_missing_meal_lookup_uses_date_meal_index(self, seeded_logs):
+        _, today = seeded_logs
+        plan = explain(
+            DailyLog.objects.filter(date=today, meal_type="LUNCH").values_list(
+                "user_id", flat=True
+            )
+        )
+
+        assert "Seq Scan on tracking_dailylog" not in plan
+        assert "date_meal_idx" in plan
+
+
+@postgres_only
+class TestDailyLogPartitionPruning:
+
+    def test_dashboard_range_only_touches_recent_partitions(self, seeded_logs):
+        user, today = seeded_logs
+        with connection.cursor() as cursor:
+            if not is_partitioned(cursor):
+                pytest.skip("tracking_dailylog is not partitioned")
+
+        plan = explain(
+            DailyLog.objects.filter(
+                user=user,
+                date__gte=today - datetime.timedelta(days=29),
+                date__lte=today,
+            )
+        )
+
+        old_month = add_months(month_start(today), -3)
+        assert partition_name(month_start(today)) in plan
+        assert partition_name(old_month) not in plan
+        assert "tracking_dailylog_default" not in plan
+
+    def test_missing_meal_lookup_touches_one_partition(self, seeded_logs):
+        _, today = seeded_logs
+        with connection.cursor() as cursor:
+            if not is_partitioned(cursor):
+                pytest.skip("tracking_dailylog is not partitioned")
+
+        plan = explain(
+            DailyLog.objects.filter(date=today, meal_type="LUNCH").values_list(
+                "user_id", flat=True
+            )
+        )
+
+        assert partition_name(month_start(today)) in plan
+        assert "Append" not in plan
+
+
+@postgres_only
+class TestDailyLogPartitionMaintenance:
+
+    def test_new_month_partition_after_all_migrations(self):
+        # Runs against the fully migrated schema, so the partition has to carry
+        # every constraint later migrations added to the parent.
+        with connection.cursor() as cursor:
+            if not is_partitioned(cursor):
+                pytest.skip("tracking_dailylog is not partitioned")
+
+        user = User.objects.create_user(
+            username="partitionuser",
+            email="partitionuser@example.com",
+            password="password",
+            role="USER",
+        )
+        food = FoodItem.objects.create(
+            name="Rice",
+            serving_size="100g",
+            calories=130,
+            protein=3,
+            carbohydrates=28,
+            fat=0,
+        )
+        month = add_months(month_start(datetime.date.today()), 60)
+        early = DailyLog.objects.create(
+            user=user, food_item=food, meal_type="LUNCH", date=month
+        )
+
+        with connection.cursor() as cursor:
+            assert ensure_month_partition(cursor, month)
+            assert not ensure_month_partition(cursor, month)
+
+        late = DailyLog.objects.create(
+            user=user,
+            food_item=food,
+            meal_type="DINNER",
+            date=month + datetime.timedelta(days=5),
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT id FROM "{partition_name(month)}" ORDER BY id')
+            assert [row[0] for row in cursor.fetchall()] == [early.id, late.id]
+            cursor.execute(
+                f'SELECT count(*) FROM "{DEFAULT_PARTITION}" WHERE date >= %s',
+                [month],
+            )
+            assert cursor.fetchone()[0] == 0
+
+
+@postgres_only
+class TestExerciseLogQueryPlans:
+
+    def test_exercise_list_uses_user_date_index(self, seeded_logs):
+        user, today = seeded_logs
+        plan = explain(
+            ExerciseLog.objects.filter(user=user, date=today).select_related("exercise")
+        )
+
+        assert "Seq Scan on tracking_exerciselog" not in plan
+        assert "exerciselog_user_date_idx" in plan
+
+
+@pytest.fixture
+def logged_user():
+    user = User.objects.create_user(
+        username="rangeuser",
+        email="rangeuser@example.com",
+        password="password",
+        role="USER",
+    )
+    other = User.objects.create_user(
+        username="rangeother",
+        email="rangeother@example.com",
+        password="password",
+        role="USER",
+    )
+    food = FoodItem.objects.create(
+        name="Oats",
+        serving_size="100g",
+        calories=400,
+        protein=10,
+        carbohydrates=60,
+        fat=5,
+    )
+    exercise = Exercise.objects.create(name="Running", met_value=10)
+
+    day = datetime.date(2026, 3, 2)
+    for owner in (user, other):
+        DailyLog.objects.create(
+            user=owner,
+            food_item=food,
+            user_serving_grams=50,
+            meal_type="BREAKFAST",
+            date=day,
+        )
+        DailyLog.objects.create(
+            user=owner,
+            food_item=food,
+            user_serving_grams=150,
+            meal_type="LUNCH",
+            date=day,
+        )
+        ExerciseLog.objects.create(
+            user=owner, exercise=exercise, duration_minutes=60, date=day
+        )
+    DailyLog.objects.create(
+        user=user,
+        food_item=food,
+        user_serving_grams=100,
+        meal_type="DINNER",
+        date=day + datetime.timedelta(days=2),
+    )
+    return user, food
+
+
+@pytest.fixture
+def client(logged_user):
+    client = APIClient()
+    client.force_authenticate(logged_user[0])
+    return client
+
+
+class TestLogRangeView:
+    URL = "/api/tracking/range/"
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "",
+            "?start=2026-03-01",
+            "?end=2026-03-07",
+            "?start=yesterday&end=2026-03-07",
+            "?start=2026-02-30&end=2026-03-07",
+            "?start=2026-03-01&end=2026-13-01",
+        ],
+    )
+    def test_missing_or_invalid_dates_are_rejected(self, client, query):
+        response = client.get(self.URL + query)
+
+        assert response.status_code == 400
+        assert "YYYY-MM-DD" in response.data["error"]
+
+    @pytest.mark.parametrize(
+        "start, end",
+        [("2026-03-07", "2026-03-01"), ("2026-01-01", "2026-04-03")],
+        ids=["inverted", "over 92 days"],
+    )
+    def test_bad_ranges_are_rejected(self, client, start, end):
+        response = client.get(f"{self.URL}?start={start}&end={end}")
+
+        assert response.status_code == 400
+        assert "92 days" in response.data["error"]
+
+    def test_longest_allowed_range(self, client):
+        response = client.get(f"{self.URL}?start=2026-01-01&end=2026-04-02")
+
+        assert response.status_code == 200
+        assert len(response.data["days"]) == 92
+
+    def test_groups_logs_per_day_and_meal(self, client):
+        response = client.get(f"{self.URL}?start=2026-03-01&end=2026-03-07")
+
+        assert response.status_code == 200
+        days = response.data["days"]
+        assert [day["date"] for day in days] == [f"2026-03-0{n}" for n in range(1, 8)]
+        assert [day["total_grant_calories"] for day in days] == [
+            0,
+            800,
+            0,
+            400,
+            0,
+            0,
+            0,
+        ]
+        assert [day["total_burned_calories"] for day in days] == [
+            0,
+            700,
+            0,
+            0,
+            0,
+            0,
+            0,
+        ]
+
+        meals = {meal["meal_type"]: meal for meal in days[1]["meals"]}
+        assert [meal["meal_type"] for meal in days[1]["meals"]] == [
+            "breakfast",
+            "lunch",
+            "dinner",
+            "snack",
+        ]
+        assert meals["breakfast"]["total_meal_calories"] == 200
+        assert meals["lunch"]["total_meal_calories"] == 600
+        assert meals["dinner"]["items"] == []
+        assert [exercise["name"] for exercise in days[1]["exercises"]] == ["Running"]
+
+    def test_compact_output_is_columnar(self, client, logged_user):
+        _, food = logged_user
+        response = client.get(f"{self.URL}?start=2026-03-01&end=2026-03-07&compact=1")
+
+        assert response.status_code == 200
+        body = response.data
+        assert body["compact"] is True
+        assert body["days"]["date"][1] == "2026-03-02"
+        assert body["days"]["total_grant_calories"] == [0, 800, 0, 400, 0, 0, 0]
+        assert body["days"]["total_burned_calories"] == [0, 700, 0, 0, 0, 0, 0]
+
+        food_logs = body["food_logs"]
+        assert food_logs["date"] == ["2026-03-02", "2026-03-02", "2026-03-04"]
+        assert food_logs["meal_type"] == ["BREAKFAST", "LUNCH", "DINNER"]
+        assert food_logs["name"] == [food.name] * 3
+        assert food_logs["calories"] == [200, 600, 400]
+        assert all(len(column) == 3 for column in food_logs.values())
+
+        exercise_logs = body["exercise_logs"]
+        assert exercise_logs["name"] == ["Running"]
+        assert exercise_logs["burned_calories"] == [700]
+
+
+class TestDailySummaryView:
+    URL = "/api/tracking/summary/?date=2026-03-02"
+
+    @pytest.fixture(autouse=True)
+    def goals(self, logged_user):
+        profile = logged_user[0].profile
+        profile.daily_calorie_goal = 2000
+        profile.protein_goal = 100
+        profile.carbs_goal = 250
+        profile.fats_goal = 60
+        profile.save()
+
+    @pytest.mark.parametrize("day", ["02-03-2026", "2026-02-30", "2026-13-01"])
+    def test_invalid_dates_are_rejected(self, client, day):
+        response = client.get(f"/api/tracking/summary/?date={day}")
+
+        assert response.status_code == 400
+        assert "YYYY-MM-DD" in response.data["error"]
+
+    def test_totals_only_count_the_users_day(self, client):
+        response = client.get(self.URL)
+
+        assert response.status_code == 200
+        assert response.data["date"] == "2026-03-02"
+        assert response.data["consumed"] == {
+            "calories": 800,
+            "protein": 20.0,
+            "carbohydrates": 120.0,
+            "fat": 10.0,
+            "items_logged": 2,
+        }
+        assert response.data["burned"] == {"calories": 700, "exercises_logged": 1}
+
+    def test_net_and_remaining(self, client):
+        response = client.get(self.URL)
+
+        assert response.data["goals"] == {
+            "calories": 2000,
+            "protein": 100,
+            "carbs": 250,
+            "fats": 60,
+        }
+        assert response.data["net_calories"] == 100
+        assert response.data["remaining"] == {
+            "calories": 1900,
+            "protein": 80.0,
+            "carbs": 130.0,
+            "fats": 50.0,
+        }
+
+    def test_empty_day(self, client):
+        response = client.get("/api/tracking/summary/?date=2026-03-03")
+
+        assert response.data["consumed"]["items_logged"] == 0
+        assert response.data["net_calories"] == 0
+        assert response.data["remaining"]["calories"] == 2000
+
+    def test_matching_etag_returns_304(self, client):
+        etag = client.get(self.URL)["ETag"]
+
+        response = client.get(self.URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert not response.content
+
+    def test_etag_changes_after_a_new_log(self, client, logged_user):
+        user, food = logged_user
+        etag = client.get(self.URL)["ETag"]
+
+        DailyLog.objects.create(
+            user=user,
+            food_item=food,
+            meal_type="SNACK",
+            date=datetime.date(2026, 3, 2),
+        )
+        response = client.get(self.URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        assert response.data["consumed"]["calories"] == 1200
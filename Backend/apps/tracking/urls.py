@@ -2,12 +2,14 @@ from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 from .views import (
+    DailySummaryView,
     DailyLogViewSet,
     ExerciseLogDetailView,
     ExerciseLogListView,
     LogAIMealView,
     LogExerciseView,
     LogManualFoodView,
+    LogRangeView,
     PatientDailyLogView,
     PatientExerciseLogView,
 )
@@ -21,6 +23,8 @@ urlpatterns = [
     path("log-manual/", LogManualFoodView.as_view(), name="log-manual"),
     path("log-exercise/", LogExerciseView.as_view(), name="log-exercise"),
     path("exercise-logs/", ExerciseLogListView.as_view(), name="exercise-log-list"),
+    path("range/", LogRangeView.as_view(), name="log-range"),
+    path("summary/", DailySummaryView.as_view(), name="daily-summary"),
     path(
         "exercise-logs/<int:pk>/",
         ExerciseLogDetailView.as_view(),
@@ -0,0 +1,32 @@
+from django.db.models import F, FloatField, Value
+from django.db.models.functions import Cast, Round
+
+from apps.profiles.models import Profile
+
+# Used for burned-calorie estimates when the user has no weight on file.
+DEFAULT_USER_WEIGHT = 70.0
+
+
+def get_user_weight(user_id):
+    weight = (
+        Profile.objects.filter(user_id=user_id).values_list("weight", flat=True).first()
+    )
+    return float(weight) if weight else DEFAULT_USER_WEIGHT
+
+
+def burned_calories_expression(user_weight, met_value=None):
+    """Per-log burned calories, as in ExerciseLog.save: MET x kg x hours.
+
+    `user_weight` and `met_value` may be numbers or expressions (the backfill
+    passes subqueries, since UPDATE can't follow joins).
+    """
+    if not hasattr(user_weight, "resolve_expression"):
+        user_weight = Value(float(user_weight))
+    if met_value is None:
+        met_value = F("exercise__met_value")
+    return Round(
+        Cast(met_value, FloatField())
+        * Cast(user_weight, FloatField())
+        * F("duration_minutes")
+        / 60.0
+    )
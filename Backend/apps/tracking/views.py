@@ -1,6 +1,14 @@
+import hashlib
+import json
+from datetime import timedelta
+
 from django.contrib.auth import get_user_model
 from django.db import transaction
+from django.db.models import Count, Q, Sum
 from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.utils.dateparse import parse_date
+from django.utils.http import parse_etags
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import permissions, status, views, viewsets
@@ -8,6 +16,7 @@ from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.response import Response
 
 from apps.foods.models import FoodImage, FoodItem
+from apps.profiles.models import Profile
 
 from .models import DailyLog, ExerciseLog
 from .serializers import DailyLogSerializer, ExerciseLogSerializer
@@ -146,44 +155,21 @@ class LogAIMealView(views.APIView):
 
         try:
             with transaction.atomic():
-                created_logs = []
+                foods = self._foods_by_name(ai_items)
 
+                logs = []
                 for item in ai_items:
-                    food_name = item.get("food_name")
-                    details_100g = item.get("100g_serving_size", {})
-
-                    food_defaults = {
-                        "name": food_name,
-                        "serving_size": "100g",
-                        "calories": details_100g.get("calories", 0),
-                        "protein": details_100g.get("protein", 0),
-                        "carbohydrates": details_100g.get("carbs", 0),
-                        "fat": details_100g.get("fats", 0),
-                        "fiber": details_100g.get("fiber", 0),
-                        "sugar": details_100g.get("sugar", 0),
-                        "saturated_fat": details_100g.get("saturated_fat", 0),
-                        "sodium": details_100g.get("sodium", 0),
-                        "cholesterol": details_100g.get("cholesterol", 0),
-                        "source": "AI",
-                        "is_public": True,
-                        "is_verified": False,
-                        "votes": 0,
-                    }
-
-                    food_item, _ = FoodItem.objects.get_or_create(
-                        name__iexact=food_name, defaults=food_defaults
-                    )
-
-                    user_grams = item.get("user_serving_size_g", 100)
-
-                    log = DailyLog.objects.create(
+                    log = DailyLog(
                         user=user,
-                        food_item=food_item,
-                        user_serving_grams=user_grams,
+                        food_item=foods[item.get("food_name").lower()],
+                        user_serving_grams=item.get("user_serving_size_g", 100),
                         meal_type=meal_type,
                         date=date_str,
                     )
-                    created_logs.append(log.id)
+                    # bulk_create skips save(), which normally takes the snapshot.
+                    log.snapshot_nutrients()
+                    logs.append(log)
+                created_logs = DailyLog.objects.bulk_create(logs)
 
             return Response(
                 {
@@ -200,6 +186,54 @@ class LogAIMealView(views.APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    @staticmethod
+    def _foods_by_name(ai_items):
+        """FoodItems keyed by lower-cased name, matched case-insensitively.
+
+        Looks the whole meal up in one query and inserts the unknown foods in
+        one more, instead of a get_or_create per item. The first item naming a
+        new food supplies its nutrients.
+        """
+        items_by_name = {}
+        for item in ai_items:
+            items_by_name.setdefault(item.get("food_name").lower(), item)
+
+        lookup = Q()
+        for item in items_by_name.values():
+            lookup |= Q(name__iexact=item["food_name"])
+
+        foods = {}
+        for food in FoodItem.objects.filter(lookup).order_by("id"):
+            foods.setdefault(food.name.lower(), food)
+
+        to_create = []
+        for name, item in items_by_name.items():
+            if name in foods:
+                continue
+            details_100g = item.get("100g_serving_size", {})
+            to_create.append(
+                FoodItem(
+                    name=item["food_name"],
+                    serving_size="100g",
+                    calories=details_100g.get("calories", 0),
+                    protein=details_100g.get("protein", 0),
+                    carbohydrates=details_100g.get("carbs", 0),
+                    fat=details_100g.get("fats", 0),
+                    fiber=details_100g.get("fiber", 0),
+                    sugar=details_100g.get("sugar", 0),
+                    saturated_fat=details_100g.get("saturated_fat", 0),
+                    sodium=details_100g.get("sodium", 0),
+                    cholesterol=details_100g.get("cholesterol", 0),
+                    source="AI",
+                    is_public=True,
+                    is_verified=False,
+                    votes=0,
+                )
+            )
+        for food in FoodItem.objects.bulk_create(to_create):
+            foods[food.name.lower()] = food
+        return foods
+
 
 class LogManualFoodView(views.APIView):
     permission_classes = [permissions.IsAuthenticated]
@@ -402,7 +436,7 @@ class ExerciseLogListView(views.APIView):
 
         exercise_logs = ExerciseLog.objects.filter(
             user=request.user, date=date_str
-        ).select_related("exercise", "user__profile")
+        ).select_related("exercise")
 
         response_data = {
             "user_id": request.user.id,
@@ -411,8 +445,12 @@ class ExerciseLogListView(views.APIView):
             "exercises": [],
         }
 
+        # Shared so un-snapshotted rows look the weight up only once.
+        serializer_context = {}
         for ex_log in exercise_logs:
-            serialized_ex = ExerciseLogSerializer(ex_log).data
+            serialized_ex = ExerciseLogSerializer(
+                ex_log, context=serializer_context
+            ).data
             ex_details = serialized_ex.get("exercise_details")
             if ex_details:
                 response_data["exercises"].append(ex_details)
@@ -556,7 +594,7 @@ class PatientExerciseLogView(views.APIView):
 
         exercise_logs = ExerciseLog.objects.filter(
             user_id=user_id, date=date_str
-        ).select_related("exercise", "user__profile")
+        ).select_related("exercise")
 
         response_data = {
             "user_id": user_id,
@@ -565,11 +603,345 @@ class PatientExerciseLogView(views.APIView):
             "exercises": [],
         }
 
+        # Shared so un-snapshotted rows look the weight up only once.
+        serializer_context = {}
         for ex_log in exercise_logs:
-            serialized_ex = ExerciseLogSerializer(ex_log).data
+            serialized_ex = ExerciseLogSerializer(
+                ex_log, context=serializer_context
+            ).data
             ex_details = serialized_ex.get("exercise_details")
             if ex_details:
                 response_data["exercises"].append(ex_details)
                 response_data["total_burned_calories"] += ex_details["burned_calories"]
 
         return Response(response_data, status=status.HTTP_200_OK)
+
+
+class LogRangeView(views.APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    MAX_RANGE_DAYS = 92
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Retrieve food logs grouped per day and meal, plus exercise totals, "
+            "for a date range (week/month views) in one request."
+        ),
+        tags=["Daily Logs"],
+        manual_parameters=[
+            openapi.Parameter(
+                "start",
+                openapi.IN_QUERY,
+                description="First date (YYYY-MM-DD)",
+                type=openapi.TYPE_STRING,
+                required=True,
+            ),
+            openapi.Parameter(
+                "end",
+                openapi.IN_QUERY,
+                description=(
+                    "Last date, inclusive (YYYY-MM-DD). At most 92 days after start."
+                ),
+                type=openapi.TYPE_STRING,
+                required=True,
+            ),
+            openapi.Parameter(
+                "compact",
+                openapi.IN_QUERY,
+                description="Set to 1 for columnar JSON (one array per field)",
+                type=openapi.TYPE_BOOLEAN,
+            ),
+        ],
+        responses={
+            200: "Per-day food and exercise logs for the range",
+            400: "Invalid or too large date range",
+        },
+    )
+    def get(self, request):
+        try:
+            start = parse_date(request.query_params.get("start", ""))
+            end = parse_date(request.query_params.get("end", ""))
+        except ValueError:  # well formed but impossible, e.g. 2026-02-30
+            start = end = None
+        if not start or not end:
+            return Response(
+                {"error": "start and end are required in YYYY-MM-DD format"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if end < start or (end - start).days >= self.MAX_RANGE_DAYS:
+            return Response(
+                {
+                    "error": (
+                        "end must be on or after start and within "
+                        f"{self.MAX_RANGE_DAYS} days"
+                    )
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        logs = (
+            DailyLog.objects.filter(user=request.user, date__range=(start, end))
+            .select_related("food_item")
+            .order_by("date", "created_at")
+        )
+        exercise_logs = (
+            ExerciseLog.objects.filter(user=request.user, date__range=(start, end))
+            .select_related("exercise")
+            .order_by("date", "created_at")
+        )
+
+        food_items = DailyLogSerializer(logs, many=True).data
+        exercise_items = ExerciseLogSerializer(exercise_logs, many=True).data
+
+        if request.query_params.get("compact") in ("1", "true", "True"):
+            return Response(
+                self._compact_payload(
+                    request.user.id,
+                    start,
+                    end,
+                    zip(logs, food_items),
+                    zip(exercise_logs, exercise_items),
+                )
+            )
+
+        days = {}
+        for offset in range((end - start).days + 1):
+            day = start + timedelta(days=offset)
+            days[day] = {
+                "date": str(day),
+                "total_grant_calories": 0,
+                "total_burned_calories": 0,
+                "meals": {
+                    "BREAKFAST": {
+                        "meal_type": "breakfast",
+                        "total_meal_calories": 0,
+                        "items": [],
+                    },
+                    "LUNCH": {
+                        "meal_type": "lunch",
+                        "total_meal_calories": 0,
+                        "items": [],
+                    },
+                    "DINNER": {
+                        "meal_type": "dinner",
+                        "total_meal_calories": 0,
+                        "items": [],
+                    },
+                    "SNACK": {
+                        "meal_type": "snack",
+                        "total_meal_calories": 0,
+                        "items": [],
+                    },
+                },
+                "exercises": [],
+            }
+
+        for log, serialized_item in zip(logs, food_items):
+            day = days[log.date]
+            meal = day["meals"].get(log.meal_type)
+            if meal is None or not serialized_item.get("food_details"):
+                continue
+            item_calories = serialized_item["food_details"]["calories"]
+            meal["items"].append(serialized_item)
+            meal["total_meal_calories"] += item_calories
+            day["total_grant_calories"] += item_calories
+
+        for ex_log, serialized_ex in zip(exercise_logs, exercise_items):
+            ex_details = serialized_ex.get("exercise_details")
+            if ex_details:
+                day = days[ex_log.date]
+                day["exercises"].append(ex_details)
+                day["total_burned_calories"] += ex_details["burned_calories"]
+
+        for day in days.values():
+            day["meals"] = list(day["meals"].values())
+
+        return Response(
+            {
+                "user_id": request.user.id,
+                "start": str(start),
+                "end": str(end),
+                "days": list(days.values()),
+            }
+        )
+
+    @staticmethod
+    def _compact_payload(user_id, start, end, food_rows, exercise_rows):
+        """Columnar encoding: each table is a dict of equally long arrays, so
+        field names are sent once instead of once per row."""
+        day_count = (end - start).days + 1
+        dates = [str(start + timedelta(days=offset)) for offset in range(day_count)]
+        day_index = {date: i for i, date in enumerate(dates)}
+        consumed = [0] * day_count
+        burned = [0] * day_count
+
+        food_columns = {
+            "date": [],
+            "meal_type": [],
+            "id": [],
+            "name": [],
+            "grams": [],
+            "calories": [],
+            "protein": [],
+            "carbohydrates": [],
+            "fat": [],
+        }
+        for log, item in food_rows:
+            details = item.get("food_details")
+            if not details:
+                continue
+            date = str(log.date)
+            food_columns["date"].append(date)
+            food_columns["meal_type"].append(log.meal_type)
+            food_columns["id"].append(item["id"])
+            food_columns["name"].append(details["name"])
+            food_columns["grams"].append(item["user_serving_grams"])
+            for key in ("calories", "protein", "carbohydrates", "fat"):
+                food_columns[key].append(details[key])
+            consumed[day_index[date]] += details["calories"]
+
+        exercise_columns = {
+            "date": [],
+            "log_id": [],
+            "name": [],
+            "duration_minutes": [],
+            "burned_calories": [],
+        }
+        for ex_log, item in exercise_rows:
+            details = item.get("exercise_details")
+            if not details:
+                continue
+            date = str(ex_log.date)
+            exercise_columns["date"].append(date)
+            for key in ("log_id", "name", "duration_minutes", "burned_calories"):
+                exercise_columns[key].append(details[key])
+            burned[day_index[date]] += details["burned_calories"]
+
+        return {
+            "user_id": user_id,
+            "start": str(start),
+            "end": str(end),
+            "compact": True,
+            "days": {
+                "date": dates,
+                "total_grant_calories": consumed,
+                "total_burned_calories": burned,
+            },
+            "food_logs": food_columns,
+            "exercise_logs": exercise_columns,
+        }
+
+
+class DailySummaryView(views.APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Net-energy summary for one day: consumed macros, burned calories and "
+            "what is left of the profile goals. Supports ETag / If-None-Match."
+        ),
+        tags=["Daily Logs"],
+        manual_parameters=[
+            openapi.Parameter(
+                "date",
+                openapi.IN_QUERY,
+                description="Date in YYYY-MM-DD format (defaults to today)",
+                type=openapi.TYPE_STRING,
+            )
+        ],
+        responses={
+            200: "Daily summary",
+            304: "Not modified (If-None-Match matched the current ETag)",
+            400: "Invalid date",
+        },
+    )
+    def get(self, request):
+        date_str = request.query_params.get("date", str(timezone.now().date()))
+        try:
+            day = parse_date(date_str)
+        except ValueError:  # well formed but impossible, e.g. 2026-02-30
+            day = None
+        if not day:
+            return Response(
+                {"error": "date must be in YYYY-MM-DD format"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        user = request.user
+
+        # Snapshots are rounded per item like the serializers, so the totals
+        # equal the sum of what the log list endpoints show.
+        consumed = DailyLog.objects.filter(user=user, date=day).aggregate(
+            items_logged=Count("id"),
+            calories=Sum("calories"),
+            protein=Sum("protein"),
+            carbohydrates=Sum("carbohydrates"),
+            fat=Sum("fat"),
+        )
+        burned = ExerciseLog.objects.filter(user=user, date=day).aggregate(
+            exercises_logged=Count("id"),
+            burned_calories=Sum("burned_calories"),
+        )
+
+        goals = (
+            Profile.objects.filter(user=user)
+            .values("daily_calorie_goal", "protein_goal", "carbs_goal", "fats_goal")
+            .first()
+            or {}
+        )
+
+        consumed_calories = round(float(consumed["calories"] or 0))
+        consumed_protein = round(float(consumed["protein"] or 0), 1)
+        consumed_carbs = round(float(consumed["carbohydrates"] or 0), 1)
+        consumed_fat = round(float(consumed["fat"] or 0), 1)
+        burned_calories = round(float(burned["burned_calories"] or 0))
+
+        calorie_goal = goals.get("daily_calorie_goal", 0)
+        protein_goal = goals.get("protein_goal", 0)
+        carbs_goal = goals.get("carbs_goal", 0)
+        fats_goal = goals.get("fats_goal", 0)
+
+        response_data = {
+            "user_id": user.id,
+            "date": str(day),
+            "consumed": {
+                "calories": consumed_calories,
+                "protein": consumed_protein,
+                "carbohydrates": consumed_carbs,
+                "fat": consumed_fat,
+                "items_logged": consumed["items_logged"],
+            },
+            "burned": {
+                "calories": burned_calories,
+                "exercises_logged": burned["exercises_logged"],
+            },
+            "goals": {
+                "calories": calorie_goal,
+                "protein": protein_goal,
+                "carbs": carbs_goal,
+                "fats": fats_goal,
+            },
+            "net_calories": consumed_calories - burned_calories,
+            "remaining": {
+                "calories": calorie_goal - consumed_calories + burned_calories,
+                "protein": round(protein_goal - consumed_protein, 1),
+                "carbs": round(carbs_goal - consumed_carbs, 1),
+                "fats": round(fats_goal - consumed_fat, 1),
+            },
+        }
+
+        payload = json.dumps(response_data, sort_keys=True).encode()
+        etag = f'"{hashlib.md5(payload).hexdigest()}"'
+
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match and (
+            etag in parse_etags(if_none_match) or if_none_match.strip() == "*"
+        ):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(response_data)
+
+        response["ETag"] = etag
+        # Clients may keep the body but must revalidate; it changes on every log.
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
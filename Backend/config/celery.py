@@ -15,19 +15,18 @@ app.autodiscover_tasks()
 
 
 app.conf.beat_schedule = {
-    "check-unlogged-breakfast-11am": {
-        "task": "apps.notifications.tasks.check_missing_meals",
-        "schedule": crontab(hour=11, minute=0),
-        "args": ("BREAKFAST",),
+    # Meal reminders go out at MEAL_REMINDER_TIMES in each user's timezone; every
+    # tick only handles the timezones whose meal time has just arrived.
+    "dispatch-meal-reminders-every-15-min": {
+        "task": "apps.notifications.tasks.dispatch_meal_reminders",
+        "schedule": crontab(minute="*/15"),
     },
-    "check-unlogged-lunch-3pm": {
-        "task": "apps.notifications.tasks.check_missing_meals",
-        "schedule": crontab(hour=15, minute=0),
-        "args": ("LUNCH",),
+    "refresh-profile-utc-offsets-hourly": {
+        "task": "apps.profiles.tasks.refresh_utc_offsets",
+        "schedule": crontab(minute=5),
     },
-    "check-unlogged-dinner-10pm": {
-        "task": "apps.notifications.tasks.check_missing_meals",
-        "schedule": crontab(hour=22, minute=0),
-        "args": ("DINNER",),
+    "maintain-dailylog-partitions-1am": {
+        "task": "apps.tracking.tasks.maintain_dailylog_partitions",
+        "schedule": crontab(hour=1, minute=0),
     },
 }
@@ -66,9 +66,11 @@ INSTALLED_APPS = [
     "apps.exercises",
     "django_celery_beat",
     "apps.admin_panel",
+    "apps.monitoring",
 ]
 
 MIDDLEWARE = [
+    "apps.monitoring.middleware.MonitoringMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -111,6 +113,14 @@ DATABASES = {
         "PASSWORD": os.getenv("DB_PASSWORD"),
         "HOST": os.getenv("DB_HOST", "db"),
         "PORT": os.getenv("DB_PORT", "5432"),
+        # Keep connections across requests instead of reconnecting each time,
+        # checking them before reuse so a restarted database or pooler is
+        # noticed. 0 restores per-request connections.
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
+        # PgBouncer in transaction pooling mode can hand each transaction a
+        # different server connection, which breaks server-side cursors.
+        "DISABLE_SERVER_SIDE_CURSORS": os.getenv("DB_PGBOUNCER", "False") == "True",
     }
 }
 
@@ -134,6 +144,24 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing (apps/accounts/hashers.py). The first entry hashes new
+# passwords; accounts stored with the other are re-hashed on their next login.
+PASSWORD_HASHER = os.getenv("PASSWORD_HASHER", "argon2")
+_PASSWORD_HASHERS = {
+    "argon2": "apps.accounts.hashers.Argon2PasswordHasher",
+    "pbkdf2": "apps.accounts.hashers.PBKDF2PasswordHasher",
+}
+PASSWORD_HASHERS = [
+    _PASSWORD_HASHERS[PASSWORD_HASHER],
+    *(path for name, path in _PASSWORD_HASHERS.items() if name != PASSWORD_HASHER),
+]
+PASSWORD_ARGON2_TIME_COST = int(os.getenv("PASSWORD_ARGON2_TIME_COST", "2"))
+PASSWORD_ARGON2_MEMORY_COST = int(os.getenv("PASSWORD_ARGON2_MEMORY_COST", "19456"))
+PASSWORD_ARGON2_PARALLELISM = int(os.getenv("PASSWORD_ARGON2_PARALLELISM", "1"))
+# Hashes computed at once per process; further logins wait for a free slot.
+PASSWORD_HASHING_CONCURRENCY = int(os.getenv("PASSWORD_HASHING_CONCURRENCY", "2"))
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/6.0/topics/i18n/
 
@@ -155,7 +183,7 @@ STATIC_URL = "static/"
 # REST Framework & JWT
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.accounts.authentication.CachedJWTAuthentication",
     )
 }
 
@@ -183,9 +211,10 @@ AUTHENTICATION_BACKENDS = [
 
 
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
-EMAIL_HOST = "smtp.gmail.com"
-EMAIL_PORT = 587
-EMAIL_USE_TLS = True
+EMAIL_HOST = os.getenv("EMAIL_HOST", "smtp.gmail.com")
+EMAIL_PORT = int(os.getenv("EMAIL_PORT", "587"))
+EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "True") == "True"
+EMAIL_TIMEOUT = 10
 EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
 
@@ -250,6 +279,39 @@ else:
         },
     }
 
+# Shared Redis cache when CACHE_REDIS_URL is set (e.g. redis://redis:6379/2),
+# otherwise a per-process in-memory cache.
+if os.getenv("CACHE_REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "apps.monitoring.cache.InstrumentedRedisCache",
+            "LOCATION": os.getenv("CACHE_REDIS_URL"),
+            "TIMEOUT": 300,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "apps.monitoring.cache.InstrumentedLocMemCache",
+        }
+    }
+
+# Seconds a blocked/active account status is trusted by AccountStatusMiddleware.
+ACCOUNT_STATUS_CACHE_TTL = int(os.getenv("ACCOUNT_STATUS_CACHE_TTL", "30"))
+# Seconds the token refresh endpoint may serve a cached user payload; 0 disables.
+USER_PAYLOAD_CACHE_TTL = int(os.getenv("USER_PAYLOAD_CACHE_TTL", "300"))
+
+# Request/task instrumentation (apps/monitoring). Server-Timing headers expose
+# query counts to clients, so they are off in production unless asked for.
+SERVER_TIMING = os.getenv("SERVER_TIMING", str(DEBUG)) == "True"
+# Requests and tasks running this many queries or more are logged.
+QUERY_COUNT_WARNING = int(os.getenv("QUERY_COUNT_WARNING", "50"))
+# Port the Celery worker serves /metrics on; unset to disable.
+CELERY_METRICS_PORT = int(os.getenv("CELERY_METRICS_PORT", "0")) or None
+# OpenTelemetry collector (OTLP/HTTP) to send traces to; unset disables tracing.
+OTEL_EXPORTER_OTLP_ENDPOINT = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
+OTEL_SERVICE_NAME = os.getenv("OTEL_SERVICE_NAME", "mycalo-backend")
+
 CELERY_BROKER_URL = os.getenv("REDIS_URL", "redis://redis:6379/1")
 CELERY_RESULT_BACKEND = os.getenv("REDIS_URL", "redis://redis:6379/1")
 
@@ -259,6 +321,15 @@ CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "Asia/Kolkata"
 CELERY_ENABLE_UTC = False
 
+# tracking_dailylog monthly partitions (see apps/tracking/partitions.py)
+DAILYLOG_PARTITION_MONTHS_AHEAD = int(os.getenv("DAILYLOG_PARTITION_MONTHS_AHEAD", "3"))
+# Detach partitions older than this many months; unset keeps everything.
+DAILYLOG_PARTITION_RETENTION_MONTHS = (
+    int(os.getenv("DAILYLOG_PARTITION_RETENTION_MONTHS"))
+    if os.getenv("DAILYLOG_PARTITION_RETENTION_MONTHS")
+    else None
+)
+
 # AWS SQS & SES Configuration
 AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
@@ -267,6 +338,27 @@ AWS_REGION = os.getenv("AWS_REGION", "ap-south-1")
 # Queue URLs
 AWS_MEAL_REMINDER_QUEUE_URL = os.getenv("SQS_QUEUE_URL")
 AWS_EMAIL_QUEUE_URL = os.getenv("AWS_SQS_EMAIL_QUEUE_URL")
+# How the send_email Celery task delivers: "sqs" (the email queue) or "smtp".
+EMAIL_TRANSPORT = os.getenv("EMAIL_TRANSPORT", "sqs" if AWS_EMAIL_QUEUE_URL else "smtp")
+# Set to a local SQS (e.g. http://elasticmq:9324) to run without AWS.
+AWS_SQS_ENDPOINT_URL = os.getenv("AWS_SQS_ENDPOINT_URL") or None
+
+# Push notifications (FCM HTTP v1), sent by `manage.py run_notification_worker`.
+# FCM_BASE_URL can point at `manage.py fake_fcm_server` for local benchmarks.
+FCM_BASE_URL = os.getenv("FCM_BASE_URL", "https://fcm.googleapis.com")
+FCM_PROJECT_ID = os.getenv("FCM_PROJECT_ID", "mycalo-ai")
+FCM_CREDENTIALS_FILE = os.getenv("FCM_CREDENTIALS_FILE") or None
+# Local time at which each meal's reminder goes out, in every user's own timezone
+# (Profile.timezone). dispatch_meal_reminders runs every 15 minutes, so times
+# should fall on :00, :15, :30 or :45.
+MEAL_REMINDER_TIMES = {
+    "BREAKFAST": "11:00",
+    "LUNCH": "15:00",
+    "DINNER": "22:00",
+}
+NOTIFICATION_WORKER_CONCURRENCY = int(
+    os.getenv("NOTIFICATION_WORKER_CONCURRENCY", "50")
+)
 
 # Add this to help Django trust the Traefik proxy
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
@@ -22,6 +22,10 @@ from drf_yasg.views import get_schema_view
 from rest_framework import permissions
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from apps.monitoring.views import metrics
+
+from .views import health
+
 schema_view = get_schema_view(
     openapi.Info(
         title="MyCalo AI API",
@@ -39,6 +43,8 @@ schema_view = get_schema_view(
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("api/health/", health, name="health"),
+    path("metrics", metrics, name="prometheus-metrics"),
     path("api/users/", include("apps.accounts.urls")),
     path("api/search/", include("apps.search.urls")),
     path("api/foods/", include("apps.foods.urls")),
@@ -0,0 +1,12 @@
+from django.db import connection
+from django.http import JsonResponse
+
+
+def health(request):
+    """Liveness/readiness probe for load balancers and compose healthchecks."""
+    try:
+        connection.ensure_connection()
+    except Exception as e:
+        print(f"Health check failed: {e}")
+        return JsonResponse({"status": "unavailable"}, status=503)
+    return JsonResponse({"status": "ok"})
@@ -0,0 +1,54 @@
+"""
+Gunicorn settings for serving the Backend in production:
+
+    gunicorn -c gunicorn.conf.py config.wsgi:application
+
+Threaded workers suit this API: most request time is spent waiting on
+Postgres, Redis or other services, and password hashing is already capped per
+process (PASSWORD_HASHING_CONCURRENCY). Every setting can be overridden with
+an environment variable of the same name, e.g. GUNICORN_WORKERS=4.
+"""
+
+import multiprocessing
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+
+worker_class = "gthread"
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+
+# Recycle workers now and then so slow leaks can't accumulate; the jitter keeps
+# them from all restarting at once.
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "200"))
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = 30
+# Longer than nginx's upstream keepalive_timeout, so nginx closes idle
+# connections first and never writes to one gunicorn has just dropped.
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "75"))
+
+# Load the app once in the master and fork, sharing memory between workers.
+# Database connections are opened lazily per worker, so none are inherited.
+preload_app = True
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOGLEVEL", "info")
+
+
+# Prometheus multiprocess mode (apps/monitoring/metrics.py): start from an
+# empty metrics directory and drop the files of workers that exit.
+def on_starting(server):
+    path = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if path and os.path.isdir(path):
+        for name in os.listdir(path):
+            os.remove(os.path.join(path, name))
+
+
+def child_exit(server, worker):
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
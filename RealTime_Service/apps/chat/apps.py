@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class ChatConfig(AppConfig):
     name = 'apps.chat'
+
+    def ready(self):
+        from . import tracing
+
+        tracing.configure()
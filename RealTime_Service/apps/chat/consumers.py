@@ -3,6 +3,7 @@ import decimal
 from channels.generic.websocket import AsyncWebsocketConsumer
 from datetime import datetime
 from channels.db import database_sync_to_async
+from . import tracing
 from .services import get_dynamodb_resource
 
 class DecimalEncoder(json.JSONEncoder):
@@ -13,6 +14,11 @@ class DecimalEncoder(json.JSONEncoder):
 
 class ChatConsumer(AsyncWebsocketConsumer):
     async def connect(self):
+        room_name = self.scope['url_route']['kwargs']['room_name']
+        with tracing.span('chat.connect', **{'chat.room': room_name}):
+            await self.join_room()
+
+    async def join_room(self):
         self.room_name = self.scope['url_route']['kwargs']['room_name']
         self.room_group_name = f'chat_{self.room_name}'
         self.user_id = self.scope.get("user_id")
@@ -55,12 +61,17 @@ class ChatConsumer(AsyncWebsocketConsumer):
         await self.channel_layer.group_discard(self.room_group_name, self.channel_name)
 
     async def call_ended(self, event):
-        await self.send(text_data=json.dumps({
-            'type': 'call_ended',
-            'sender_id': event['sender_id']
-        }))
+        with tracing.span('chat.deliver', event, **{'chat.event': 'call_ended'}):
+            await self.send(text_data=json.dumps({
+                'type': 'call_ended',
+                'sender_id': event['sender_id']
+            }))
 
     async def receive(self, text_data):
+        with tracing.span('chat.receive', **{'chat.room': self.room_name}):
+            await self.handle_message(text_data)
+
+    async def handle_message(self, text_data):
         data = json.loads(text_data)
         msg_type = data.get('type', 'chat_message') # Default to chat
         timestamp = datetime.now().isoformat()
@@ -69,12 +80,12 @@ class ChatConsumer(AsyncWebsocketConsumer):
         if msg_type in ['call_user', 'answer_call', 'ice_candidate', 'call_ended']:
             await self.channel_layer.group_send(
                 self.room_group_name,
-                {
+                tracing.with_trace_context({
                     'type': 'webrtc_signal',
                     'signal_type': msg_type,
                     'data': data.get('data'),
                     'sender_id': self.user_id
-                }
+                })
             )
             return
 
@@ -91,36 +102,38 @@ class ChatConsumer(AsyncWebsocketConsumer):
 
         await self.channel_layer.group_send(
             self.room_group_name,
-            {
+            tracing.with_trace_context({
                 'type': 'chat_message',
                 'message': message_text,
                 'file_url': file_url,
                 'file_type': file_type,
                 'sender_id': self.user_id,
                 'timestamp': timestamp
-            }
+            })
         )
 
     # Handler for Normal Chat
     async def chat_message(self, event):
-        await self.send(text_data=json.dumps({
-            'type': 'new_message',
-            'message': event['message'],
-            'file_url': event.get('file_url'),
-            'file_type': event.get('file_type'),
-            'sender_id': event['sender_id'],
-            'timestamp': event.get('timestamp', datetime.now().isoformat())
-        }, cls=DecimalEncoder))
+        with tracing.span('chat.deliver', event, **{'chat.event': 'chat_message'}):
+            await self.send(text_data=json.dumps({
+                'type': 'new_message',
+                'message': event['message'],
+                'file_url': event.get('file_url'),
+                'file_type': event.get('file_type'),
+                'sender_id': event['sender_id'],
+                'timestamp': event.get('timestamp', datetime.now().isoformat())
+            }, cls=DecimalEncoder))
 
     # Handler for WebRTC Signaling
     async def webrtc_signal(self, event):
         # Don't send the signal back to the sender
         if str(event['sender_id']) != str(self.user_id):
-            await self.send(text_data=json.dumps({
-                'type': event['signal_type'],
-                'data': event.get('data'),
-                'sender_id': event['sender_id']
-            }))
+            with tracing.span('chat.deliver', event, **{'chat.event': 'webrtc_signal'}):
+                await self.send(text_data=json.dumps({
+                    'type': event['signal_type'],
+                    'data': event.get('data'),
+                    'sender_id': event['sender_id']
+                }))
 
     # ... (Keep save_message_to_dynamo, update_consultation, cleanup_old_messages, get_chat_history exactly as they were) ...
     # Copy/Paste your existing DB methods here.
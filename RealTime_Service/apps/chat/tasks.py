@@ -3,6 +3,7 @@ import os
 from celery import shared_task
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
+from . import tracing
 from .services import get_dynamodb_resource
 from datetime import datetime
 
@@ -79,14 +80,14 @@ def process_file_upload(file_path, room_name, user_id, original_filename):
         
         async_to_sync(channel_layer.group_send)(
             group_name,
-            {
+            tracing.with_trace_context({
                 'type': 'chat_message',
                 'message': chat_message_text,
                 'file_url': secure_url,
                 'file_type': frontend_file_type,
                 'sender_id': user_id,
                 'timestamp': timestamp
-            }
+            })
         )
         
         print(f"✅ Celery: Upload complete. Type: {frontend_file_type}")
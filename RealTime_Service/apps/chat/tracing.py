@@ -0,0 +1,76 @@
+"""
+OpenTelemetry tracing, switched on by setting OTEL_EXPORTER_OTLP_ENDPOINT
+(e.g. http://otel-collector:4318, see docker-compose.tracing.yml).
+
+HTTP views, Celery tasks, DynamoDB (boto3) and Redis calls are traced by the
+stock instrumentations. WebSocket traffic is not request/response shaped, so
+ChatConsumer opens its own spans with `span()`, and events sent over the
+channel layer carry the sender's trace context (`with_trace_context()`), so
+delivering a message to each socket in the room joins the trace that
+received or uploaded it.
+
+Without the variable none of the OpenTelemetry packages are imported and the
+helpers do nothing.
+"""
+from contextlib import contextmanager
+
+from django.conf import settings
+
+_tracer = None
+
+
+def configure():
+    global _tracer
+    if _tracer is not None or not settings.OTEL_EXPORTER_OTLP_ENDPOINT:
+        return
+
+    from opentelemetry import trace
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.instrumentation.botocore import BotocoreInstrumentor
+    from opentelemetry.instrumentation.celery import CeleryInstrumentor
+    from opentelemetry.instrumentation.django import DjangoInstrumentor
+    from opentelemetry.instrumentation.redis import RedisInstrumentor
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    provider = TracerProvider(
+        resource=Resource.create({'service.name': settings.OTEL_SERVICE_NAME})
+    )
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    trace.set_tracer_provider(provider)
+
+    DjangoInstrumentor().instrument()
+    CeleryInstrumentor().instrument()
+    BotocoreInstrumentor().instrument()
+    RedisInstrumentor().instrument()
+
+    _tracer = trace.get_tracer(__name__)
+
+
+def with_trace_context(event):
+    """Adds the current trace context to a channel layer event."""
+    if _tracer is not None:
+        from opentelemetry.propagate import inject
+
+        carrier = {}
+        inject(carrier)
+        event['trace_context'] = carrier
+    return event
+
+
+@contextmanager
+def span(name, event=None, **attributes):
+    """A span around consumer work; with `event`, a child of the span that
+    sent it."""
+    if _tracer is None:
+        yield
+        return
+
+    from opentelemetry.propagate import extract
+
+    parent = None
+    if event and 'trace_context' in event:
+        parent = extract(event['trace_context'])
+    with _tracer.start_as_current_span(name, context=parent, attributes=attributes):
+        yield
@@ -139,3 +139,8 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'
+
+# --- TRACING (apps/chat/tracing.py) ---
+# OpenTelemetry collector (OTLP/HTTP) to send traces to; unset disables tracing.
+OTEL_EXPORTER_OTLP_ENDPOINT = os.getenv('OTEL_EXPORTER_OTLP_ENDPOINT')
+OTEL_SERVICE_NAME = os.getenv('OTEL_SERVICE_NAME', 'mycalo-realtime')
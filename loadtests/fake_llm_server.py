@@ -0,0 +1,181 @@
+"""
+Stand-in for the Gemini and Groq HTTP APIs, so the AI service can be load
+tested without API keys, quotas or per-token cost.
+
+    python loadtests/fake_llm_server.py --port 8020 --latency-ms 400
+
+Point the AI service at it with GEMINI_BASE_URL=http://<host>:8020 and
+GROQ_API_BASE=http://<host>:8020 (loadtests/docker-compose.loadtest.yml does
+this). It answers:
+
+- POST /v1beta/models/<model>:generateContent with a fixed nutrition analysis
+  in the JSON shape services/gemini.py asks for;
+- POST /openai/v1/chat/completions (Groq, OpenAI-compatible) with a short
+  fixed reply, streamed as server-sent events when the request asks for it.
+
+--latency-ms simulates model response time, so the numbers reflect how the
+service behaves while waiting on a slow upstream rather than on its own work.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+NUTRITION = {
+    "overall_suggestion": "Balanced portion. Add vegetables for fibre.",
+    "items": [
+        {
+            "food_name": "Steamed Rice",
+            "user_serving_size_g": 150,
+            "100g_serving_size": {
+                "calories": 130.0,
+                "protein": 2.7,
+                "carbs": 28.2,
+                "fats": 0.3,
+                "fiber": 0.4,
+                "sugar": 0.1,
+                "saturated_fat": 0.1,
+                "sodium": 1.0,
+                "cholesterol": 0.0,
+            },
+        }
+    ],
+}
+REPLY = "You have logged 1450 kcal today, 550 kcal under your goal."
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found"}
+
+
+def gemini_response():
+    return {
+        "candidates": [
+            {
+                "content": {
+                    "parts": [{"text": json.dumps(NUTRITION)}],
+                    "role": "model",
+                },
+                "finishReason": "STOP",
+            }
+        ],
+        "usageMetadata": {"promptTokenCount": 250, "candidatesTokenCount": 120},
+    }
+
+
+def chat_completion(model):
+    return {
+        "id": f"chatcmpl-{time.time_ns()}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": REPLY},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 250, "completion_tokens": 20, "total_tokens": 270},
+    }
+
+
+def chat_completion_stream(model):
+    chunk = {
+        "id": f"chatcmpl-{time.time_ns()}",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": {"role": "assistant", "content": REPLY}}],
+    }
+    done = dict(chunk, choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}])
+    return (
+        "".join(f"data: {json.dumps(event)}\n\n" for event in (chunk, done))
+        + "data: [DONE]\n\n"
+    )
+
+
+class FakeLLM:
+    def __init__(self, latency, jitter):
+        self.latency = latency
+        self.jitter = jitter
+        self.requests = 0
+
+    def respond(self, method, path, body):
+        if method != "POST":
+            return 404, "application/json", {"error": "not found"}
+        if path.startswith("/v1beta/models/") and ":generateContent" in path:
+            return 200, "application/json", gemini_response()
+        if path.endswith("/chat/completions"):
+            try:
+                request = json.loads(body)
+            except ValueError:
+                return 400, "application/json", {"error": "invalid JSON"}
+            model = request.get("model", "fake")
+            if request.get("stream"):
+                return 200, "text/event-stream", chat_completion_stream(model)
+            return 200, "application/json", chat_completion(model)
+        return 404, "application/json", {"error": "not found"}
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+
+                length = 0
+                while True:
+                    header = await reader.readline()
+                    if header in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = header.decode("latin-1").partition(":")
+                    if name.strip().lower() == "content-length":
+                        length = int(value.strip())
+                body = await reader.readexactly(length) if length else b""
+
+                delay = self.latency + random.uniform(0, self.jitter)
+                if delay:
+                    await asyncio.sleep(delay)
+                status, content_type, payload = self.respond(method, path, body)
+                self.requests += 1
+
+                data = (
+                    payload if isinstance(payload, str) else json.dumps(payload)
+                ).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(fake, host, port):
+    server = await asyncio.start_server(fake.handle, host, port, backlog=1024)
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8020)
+    parser.add_argument("--latency-ms", type=int, default=400)
+    parser.add_argument(
+        "--jitter-ms", type=int, default=200, help="Extra random latency, up to"
+    )
+    args = parser.parse_args()
+
+    fake = FakeLLM(args.latency_ms / 1000, args.jitter_ms / 1000)
+    print(f"Fake LLM listening on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(serve(fake, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    print(f"Answered {fake.requests} requests")
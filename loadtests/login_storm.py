@@ -0,0 +1,69 @@
+"""
+Login storm: many clients logging in at once and then refreshing their token,
+as after a deploy that expires sessions or a morning push notification.
+
+Seed the accounts first, then point locust at the backend:
+
+    docker compose exec backend python manage.py seed_loadtest_users --count 1000
+    locust -f loadtests/login_storm.py --host http://localhost:8000 \
+        --users 200 --spawn-rate 50 --run-time 2m --headless
+
+LOADTEST_USERS and LOADTEST_PASSWORD must match the seeding options. Failures
+are counted per endpoint; look at p95/p99 of "login" and "refresh" and at the
+backend's database connections while it runs.
+"""
+
+import os
+import random
+
+from locust import HttpUser, between, task
+
+USER_COUNT = int(os.getenv("LOADTEST_USERS", "1000"))
+PASSWORD = os.getenv("LOADTEST_PASSWORD", "loadtest-password")
+
+
+class LoginStormUser(HttpUser):
+    wait_time = between(0.5, 2)
+
+    def on_start(self):
+        n = random.randrange(USER_COUNT)
+        # Mix both identifiers; email in a different case exercises the
+        # case-insensitive lookup.
+        self.identifier = random.choice(
+            [f"loadtest-{n}", f"loadtest-{n}@example.com", f"LOADTEST-{n}@EXAMPLE.COM"]
+        )
+        self.refresh_token = None
+        self.login()
+
+    def login(self):
+        with self.client.post(
+            "/api/users/login/",
+            json={"username": self.identifier, "password": PASSWORD},
+            name="login",
+            catch_response=True,
+        ) as response:
+            if response.status_code != 200 or "access" not in response.json():
+                response.failure(f"login failed: {response.status_code}")
+            self.refresh_token = response.cookies.get("refresh_token")
+
+    @task(3)
+    def refresh(self):
+        if not self.refresh_token:
+            return self.login()
+        # The cookie is Secure, which the client won't send over plain http,
+        # so pass it along by hand.
+        with self.client.post(
+            "/api/users/token/refresh/",
+            json={},
+            headers={"Cookie": f"refresh_token={self.refresh_token}"},
+            name="refresh",
+            catch_response=True,
+        ) as response:
+            if response.status_code != 200:
+                response.failure(f"refresh failed: {response.status_code}")
+                return self.login()
+            self.refresh_token = response.cookies.get("refresh_token")
+
+    @task(1)
+    def relogin(self):
+        self.login()
@@ -0,0 +1,114 @@
+"""
+Requests per second, and per core, for key Backend endpoints.
+
+Runs a fixed number of concurrent keep-alive clients against one endpoint at a
+time for a fixed duration and reports throughput and latency percentiles.
+Needs only httpx:
+
+    docker compose exec backend python manage.py seed_loadtest_users --count 10
+    python loadtests/serving_benchmark.py --base-url http://localhost:8080 --cores 2
+
+--cores is the number of CPUs the serving containers are limited to; it turns
+requests/s into requests/s/core so runs on different machines compare. See
+loadtests/README.md for the comparison between runserver and the production
+profile.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+import httpx
+
+ENDPOINTS = {
+    "health": "/api/health/",
+    "search": "/api/search/?q=rice",
+    "summary": "/api/tracking/summary/",
+    "profile": "/api/profiles/me/",
+}
+
+
+async def login(client, identifier, password):
+    response = await client.post(
+        "/api/users/login/", json={"username": identifier, "password": password}
+    )
+    response.raise_for_status()
+    return response.json()["access"]
+
+
+async def hammer(client, path, deadline, latencies, errors):
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            response = await client.get(path)
+        except httpx.HTTPError:
+            errors.append(path)
+            continue
+        latencies.append(time.perf_counter() - start)
+        if response.status_code >= 400:
+            errors.append(response.status_code)
+
+
+async def bench_endpoint(args, token, path):
+    limits = httpx.Limits(max_connections=args.concurrency)
+    headers = {"Authorization": f"Bearer {token}"}
+    async with httpx.AsyncClient(
+        base_url=args.base_url, headers=headers, limits=limits, timeout=30
+    ) as client:
+        # Warm up connections, caches and lazily imported code.
+        await asyncio.gather(*(client.get(path) for _ in range(args.concurrency)))
+
+        latencies, errors = [], []
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(
+            *(
+                hammer(client, path, deadline, latencies, errors)
+                for _ in range(args.concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - started
+
+    rps = len(latencies) / elapsed
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0]
+    return {
+        "rps": rps,
+        "rps_per_core": rps / args.cores,
+        "p50": statistics.median(latencies) * 1000 if latencies else 0,
+        "p99": quantiles[-1] * 1000,
+        "errors": len(errors),
+    }
+
+
+async def main(args):
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=30) as client:
+        token = await login(client, args.identifier, args.password)
+
+    print(
+        f"{args.base_url}: {args.concurrency} clients, {args.duration}s per "
+        f"endpoint, {args.cores} cores"
+    )
+    print(f"{'endpoint':<10}{'req/s':>9}{'req/s/core':>12}{'p50 ms':>9}{'p99 ms':>9}")
+    for name in args.endpoints:
+        result = await bench_endpoint(args, token, ENDPOINTS[name])
+        print(
+            f"{name:<10}{result['rps']:>9.1f}{result['rps_per_core']:>12.1f}"
+            f"{result['p50']:>9.1f}{result['p99']:>9.1f}"
+            + (f"  ({result['errors']} errors)" if result["errors"] else "")
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--identifier", default="loadtest-0")
+    parser.add_argument("--password", default="loadtest-password")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--cores", type=float, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--endpoints", nargs="+", choices=ENDPOINTS, default=list(ENDPOINTS)
+    )
+    asyncio.run(main(parser.parse_args()))
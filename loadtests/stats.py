@@ -0,0 +1,100 @@
+"""Latency/throughput summaries and the JSON reports `suite.py` writes and compares."""
+
+import json
+import subprocess
+import time
+from dataclasses import dataclass, field
+
+METRICS = ("throughput", "p50_ms", "p95_ms", "p99_ms")
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, round(pct / 100 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+@dataclass
+class Recorder:
+    """Collects per-operation latencies (seconds) and error counts."""
+
+    latencies: list = field(default_factory=list)
+    errors: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    finished: float = None
+
+    def ok(self, seconds):
+        self.latencies.append(seconds)
+
+    def fail(self):
+        self.errors += 1
+
+    def stop(self):
+        self.finished = time.perf_counter()
+
+    def summary(self):
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        values = sorted(self.latencies)
+        return {
+            "operations": len(values),
+            "errors": self.errors,
+            "duration_s": round(elapsed, 2),
+            "throughput": round(len(values) / elapsed, 2) if elapsed else 0.0,
+            "p50_ms": round(percentile(values, 50) * 1000, 2),
+            "p95_ms": round(percentile(values, 95) * 1000, 2),
+            "p99_ms": round(percentile(values, 99) * 1000, 2),
+        }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def write_report(path, config, results):
+    report = {
+        "commit": git_commit(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "config": config,
+        "scenarios": results,
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def print_results(results):
+    print(
+        f"{'scenario':<14}{'ops':>8}{'errors':>8}{'ops/s':>10}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    )
+    for name, r in results.items():
+        print(
+            f"{name:<14}{r['operations']:>8}{r['errors']:>8}{r['throughput']:>10.1f}"
+            f"{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}{r['p99_ms']:>10.1f}"
+        )
+
+
+def compare(old_path, new_path):
+    """Prints each metric of two reports side by side with the relative change."""
+    with open(old_path) as f:
+        old = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+
+    print(f"{old['commit']} ({old_path}) -> {new['commit']} ({new_path})")
+    print(f"{'scenario':<14}{'metric':<12}{'old':>10}{'new':>10}{'change':>9}")
+    for name in sorted(set(old["scenarios"]) & set(new["scenarios"])):
+        for metric in METRICS:
+            before = old["scenarios"][name][metric]
+            after = new["scenarios"][name][metric]
+            change = f"{(after - before) / before:+.0%}" if before else "n/a"
+            print(f"{name:<14}{metric:<12}{before:>10.1f}{after:>10.1f}{change:>9}")
@@ -0,0 +1,310 @@
+"""
+Load-test suite for the Backend, AI service and realtime service.
+
+Each scenario runs `--concurrency` clients in a closed loop for `--duration`
+seconds and reports operations/s and p50/p95/p99 latency. Results are saved as
+JSON tagged with the current commit so runs can be compared:
+
+    python loadtests/suite.py run --out loadtests/results/before.json
+    python loadtests/suite.py run --out loadtests/results/after.json
+    python loadtests/suite.py compare loadtests/results/before.json \
+        loadtests/results/after.json
+
+Scenarios:
+
+- food_log: POST /api/tracking/log-manual/ (food item + daily log insert)
+- dashboard: GET /api/analytics/dashboard/ (DashboardAnalyticsAPIView)
+- search: GET /api/search/ (GlobalSearchView)
+- nutrition: POST /ai/nutrition/analyze (AI service -> Gemini stand-in)
+- chat_fanout: ChatConsumer; every message sent to a room is timed until each
+  listener in the room has received it, through the Redis channel layer.
+  Operations are deliveries, so throughput is deliveries/s.
+
+See loadtests/README.md for bringing up the stand-ins.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+
+import httpx
+
+from stats import Recorder, compare, print_results, write_report
+
+SEARCH_TERMS = ["rice", "chicken", "oats", "apple", "dal", "egg", "paneer", "run"]
+FOODS = ["Dosa", "Idli", "Chapati", "Poha", "Upma", "Biryani", "Sambar", "Curd"]
+
+
+async def closed_loop(args, operation):
+    """Runs `operation()` from `args.concurrency` clients until the deadline."""
+    recorder = Recorder()
+    deadline = time.perf_counter() + args.duration
+
+    async def client():
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                ok = await operation()
+            except (httpx.HTTPError, OSError):
+                ok = False
+            if ok:
+                recorder.ok(time.perf_counter() - start)
+            else:
+                recorder.fail()
+
+    await asyncio.gather(*(client() for _ in range(args.concurrency)))
+    recorder.stop()
+    return recorder.summary()
+
+
+def http_client(base_url, token, concurrency):
+    return httpx.AsyncClient(
+        base_url=base_url,
+        headers={"Authorization": f"Bearer {token}"},
+        limits=httpx.Limits(max_connections=concurrency),
+        timeout=60,
+    )
+
+
+async def food_log(args, token):
+    async with http_client(args.backend_url, token, args.concurrency) as client:
+
+        async def operation():
+            grams = random.choice([80, 100, 150, 200])
+            # The view takes form data (it also accepts image uploads).
+            response = await client.post(
+                "/api/tracking/log-manual/",
+                data={
+                    "name": random.choice(FOODS),
+                    "meal_type": random.choice(["BREAKFAST", "LUNCH", "DINNER"]),
+                    "user_serving_grams": grams,
+                    "calories": grams * 1.3,
+                    "protein": grams * 0.04,
+                    "carbohydrates": grams * 0.25,
+                    "fat": grams * 0.02,
+                },
+            )
+            return response.status_code == 201
+
+        return await closed_loop(args, operation)
+
+
+async def dashboard(args, token):
+    async with http_client(args.backend_url, token, args.concurrency) as client:
+
+        async def operation():
+            response = await client.get("/api/analytics/dashboard/")
+            return response.status_code == 200
+
+        return await closed_loop(args, operation)
+
+
+async def search(args, token):
+    async with http_client(args.backend_url, token, args.concurrency) as client:
+
+        async def operation():
+            term = random.choice(SEARCH_TERMS)
+            response = await client.get("/api/search/", params={"q": term})
+            return response.status_code == 200
+
+        return await closed_loop(args, operation)
+
+
+async def nutrition(args, token):
+    async with http_client(args.ai_url, token, args.concurrency) as client:
+
+        async def operation():
+            response = await client.post(
+                "/ai/nutrition/analyze",
+                json={"query": f"1 plate {random.choice(FOODS).lower()}"},
+            )
+            return response.status_code == 200 and response.json().get("items")
+
+        return await closed_loop(args, operation)
+
+
+async def discard_incoming(ws):
+    async for _ in ws:
+        pass
+
+
+async def chat_fanout(args, token):
+    import websockets
+
+    rooms = max(1, args.concurrency // args.listeners)
+    recorder = Recorder()
+    undelivered = 0
+
+    async def listener(url, pending, ready, done):
+        async with websockets.connect(url, subprotocols=[token]) as ws:
+            await ws.recv()  # chat_history
+            ready.set()
+            while not (done.is_set() and not pending):
+                try:
+                    raw = await asyncio.wait_for(ws.recv(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    continue
+                event = json.loads(raw)
+                sent = pending.get(event.get("message"))
+                if event.get("type") != "new_message" or sent is None:
+                    continue
+                recorder.ok(time.perf_counter() - sent[0])
+                sent[1] -= 1
+                if not sent[1]:
+                    del pending[event["message"]]
+
+    async def room(index):
+        nonlocal undelivered
+        url = f"{args.realtime_url}/ws/chat/user_{900000 + index}_doc_1/"
+        pending = {}  # message -> [sent at, deliveries outstanding]
+        ready = [asyncio.Event() for _ in range(args.listeners)]
+        done = asyncio.Event()
+        connections = [
+            asyncio.create_task(listener(url, pending, event, done)) for event in ready
+        ]
+        await asyncio.gather(*(event.wait() for event in ready))
+
+        async with websockets.connect(url, subprotocols=[token]) as sender:
+            # The sender receives its own broadcasts; keep reading them so the
+            # server never blocks on a full socket.
+            drain = asyncio.create_task(discard_incoming(sender))
+            sequence = 0
+            while time.perf_counter() < deadline:
+                message = f"bench-{index}-{sequence}"
+                sequence += 1
+                pending[message] = [time.perf_counter(), len(ready)]
+                await sender.send(json.dumps({"message": message}))
+                await asyncio.sleep(args.message_interval)
+            drain.cancel()
+
+        # Give in-flight messages a few seconds to arrive.
+        done.set()
+        await asyncio.wait(connections, timeout=5)
+        for connection in connections:
+            connection.cancel()
+        undelivered += sum(outstanding for _, outstanding in pending.values())
+
+    deadline = time.perf_counter() + args.duration
+    await asyncio.gather(*(room(index) for index in range(rooms)))
+    recorder.errors = undelivered
+    recorder.stop()
+    return recorder.summary()
+
+
+SCENARIOS = {
+    "food_log": food_log,
+    "dashboard": dashboard,
+    "search": search,
+    "nutrition": nutrition,
+    "chat_fanout": chat_fanout,
+}
+
+
+async def login(args):
+    async with httpx.AsyncClient(base_url=args.backend_url, timeout=60) as client:
+        response = await client.post(
+            "/api/users/login/",
+            json={"username": args.identifier, "password": args.password},
+        )
+        response.raise_for_status()
+        return response.json()["access"]
+
+
+async def run(args):
+    token = await login(args)
+    results = {}
+    for name in args.scenarios:
+        print(f"Running {name} for {args.duration}s...", flush=True)
+        results[name] = await SCENARIOS[name](args, token)
+
+    print_results(results)
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        config = {
+            key: value
+            for key, value in vars(args).items()
+            if key not in ("password", "command", "out")
+        }
+        write_report(args.out, config, results)
+        print(f"Saved {args.out}")
+
+
+def setup_dynamodb(endpoint):
+    """Creates the realtime service's tables in DynamoDB Local if missing."""
+    import boto3
+
+    dynamodb = boto3.client(
+        "dynamodb",
+        endpoint_url=endpoint,
+        region_name="ap-south-1",
+        aws_access_key_id="local",
+        aws_secret_access_key="local",
+    )
+    tables = {
+        "ChatHistory": [("RoomID", "HASH"), ("Timestamp", "RANGE")],
+        "DoctorConsultations": [("ConsultationID", "HASH")],
+    }
+    existing = dynamodb.list_tables()["TableNames"]
+    for name, keys in tables.items():
+        if name in existing:
+            continue
+        dynamodb.create_table(
+            TableName=name,
+            KeySchema=[{"AttributeName": a, "KeyType": t} for a, t in keys],
+            AttributeDefinitions=[
+                {"AttributeName": a, "AttributeType": "S"} for a, _ in keys
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        print(f"Created {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run scenarios and report")
+    run_parser.add_argument("--backend-url", default="http://localhost:8000")
+    run_parser.add_argument("--ai-url", default="http://localhost:8001")
+    run_parser.add_argument("--realtime-url", default="ws://localhost:8003")
+    run_parser.add_argument("--identifier", default="loadtest-0")
+    run_parser.add_argument("--password", default="loadtest-password")
+    run_parser.add_argument("--concurrency", type=int, default=20)
+    run_parser.add_argument("--duration", type=float, default=30)
+    run_parser.add_argument(
+        "--listeners", type=int, default=10, help="chat_fanout: listeners per room"
+    )
+    run_parser.add_argument(
+        "--message-interval",
+        type=float,
+        default=0.1,
+        help="chat_fanout: seconds between messages from each room's sender",
+    )
+    run_parser.add_argument(
+        "--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS)
+    )
+    run_parser.add_argument("--out", help="Write a JSON report here")
+
+    compare_parser = commands.add_parser("compare", help="Compare two reports")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+
+    setup_parser = commands.add_parser(
+        "setup-dynamodb", help="Create the chat tables in DynamoDB Local"
+    )
+    setup_parser.add_argument("--endpoint", default="http://localhost:8004")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        asyncio.run(run(args))
+    elif args.command == "compare":
+        compare(args.old, args.new)
+    else:
+        setup_dynamodb(args.endpoint)
+
+
+if __name__ == "__main__":
+    main()